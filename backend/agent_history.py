@@ -0,0 +1,201 @@
+# agent_history.py
+#
+# Columnar store for Agent.history. One preallocated typed array per field
+# (agents x rounds) instead of one dict per agent per round; strategy,
+# action and reason are small ints into shared tables.
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union, overload
+
+import numpy as np
+
+# Key layouts produced by multi_round_auction.raise_agents, in insertion order.
+RAISE_KEYS = (
+    "round",
+    "position",
+    "loser_factor",
+    "remaining_before",
+    "planned_raise",
+    "new_bid",
+    "strategy",
+)
+ACTION_KEYS = ("round", "action", "reason", "current_bid")
+
+_LAYOUT_RAISE = 0
+_LAYOUT_ACTION = 1
+_LAYOUT_OTHER = 2  # any other shape of dict, kept as-is on the side
+
+
+class AgentHistoryStore:
+    """
+    History of every agent in one auction.
+
+    `capacity` slots per agent are preallocated (typically num_rounds) and
+    doubled if an agent ever needs more. Entries go in through
+    view(i).append(dict) and come back out as dicts equal to the ones
+    appended, so raise_agents and existing readers don't change.
+    """
+
+    def __init__(self, num_agents: int, capacity: int) -> None:
+        self.num_agents = num_agents
+        self.capacity = max(1, capacity)
+        shape = (num_agents, self.capacity)
+
+        self.lengths = np.zeros(num_agents, dtype=np.int32)
+        self.layout = np.zeros(shape, dtype=np.int8)
+        self.round = np.zeros(shape, dtype=np.int32)
+        self.position = np.zeros(shape, dtype=np.int32)
+        self.code = np.zeros(shape, dtype=np.int8)  # strategy (raise) or action (other)
+        self.reason = np.zeros(shape, dtype=np.int8)
+        self.loser_factor = np.zeros(shape, dtype=np.float64)
+        self.remaining_before = np.zeros(shape, dtype=np.float64)
+        self.planned_raise = np.zeros(shape, dtype=np.float64)
+        self.bid = np.zeros(shape, dtype=np.float64)  # new_bid / current_bid
+
+        self.strategies: List[str] = []
+        self.actions: List[str] = []
+        self.reasons: List[str] = []
+        self._codes: Dict[Tuple[int, str], int] = {}
+        self._other: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    _ARRAYS = (
+        "layout",
+        "round",
+        "position",
+        "code",
+        "reason",
+        "loser_factor",
+        "remaining_before",
+        "planned_raise",
+        "bid",
+    )
+
+    def view(self, agent_index: int) -> "AgentHistoryView":
+        return AgentHistoryView(self, agent_index)
+
+    def _intern(self, table: List[str], table_id: int, value: str) -> int:
+        key = (table_id, value)
+        code = self._codes.get(key)
+        if code is None:
+            code = len(table)
+            if code > np.iinfo(np.int8).max:
+                raise ValueError("Too many distinct history labels for int8 codes")
+            table.append(value)
+            self._codes[key] = code
+        return code
+
+    def _grow(self) -> None:
+        new_capacity = self.capacity * 2
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            grown = np.zeros((self.num_agents, new_capacity), dtype=old.dtype)
+            grown[:, : self.capacity] = old
+            setattr(self, name, grown)
+        self.capacity = new_capacity
+
+    def append(self, agent_index: int, entry: Dict[str, Any]) -> None:
+        slot = int(self.lengths[agent_index])
+        if slot >= self.capacity:
+            self._grow()
+        i = agent_index
+
+        keys = tuple(entry)
+        if keys == RAISE_KEYS:
+            self.layout[i, slot] = _LAYOUT_RAISE
+            self.round[i, slot] = entry["round"]
+            self.position[i, slot] = entry["position"]
+            self.loser_factor[i, slot] = entry["loser_factor"]
+            self.remaining_before[i, slot] = entry["remaining_before"]
+            self.planned_raise[i, slot] = entry["planned_raise"]
+            self.bid[i, slot] = entry["new_bid"]
+            self.code[i, slot] = self._intern(self.strategies, 0, entry["strategy"])
+        elif keys == ACTION_KEYS:
+            self.layout[i, slot] = _LAYOUT_ACTION
+            self.round[i, slot] = entry["round"]
+            self.code[i, slot] = self._intern(self.actions, 1, entry["action"])
+            self.reason[i, slot] = self._intern(self.reasons, 2, entry["reason"])
+            self.bid[i, slot] = entry["current_bid"]
+        else:
+            self.layout[i, slot] = _LAYOUT_OTHER
+            self._other[(i, slot)] = dict(entry)
+
+        self.lengths[i] = slot + 1
+
+    def entry(self, agent_index: int, slot: int) -> Dict[str, Any]:
+        i = agent_index
+        layout = self.layout[i, slot]
+        if layout == _LAYOUT_RAISE:
+            return {
+                "round": int(self.round[i, slot]),
+                "position": int(self.position[i, slot]),
+                "loser_factor": float(self.loser_factor[i, slot]),
+                "remaining_before": float(self.remaining_before[i, slot]),
+                "planned_raise": float(self.planned_raise[i, slot]),
+                "new_bid": float(self.bid[i, slot]),
+                "strategy": self.strategies[self.code[i, slot]],
+            }
+        if layout == _LAYOUT_ACTION:
+            return {
+                "round": int(self.round[i, slot]),
+                "action": self.actions[self.code[i, slot]],
+                "reason": self.reasons[self.reason[i, slot]],
+                "current_bid": float(self.bid[i, slot]),
+            }
+        return dict(self._other[(i, slot)])
+
+    def nbytes(self) -> int:
+        return int(self.lengths.nbytes + sum(getattr(self, name).nbytes for name in self._ARRAYS))
+
+
+class AgentHistoryView(Sequence[Dict[str, Any]]):
+    """One agent's history, with the list-of-dicts API Agent.history had."""
+
+    def __init__(self, store: AgentHistoryStore, agent_index: int) -> None:
+        self._store = store
+        self._agent = agent_index
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self._store.append(self._agent, entry)
+
+    def __len__(self) -> int:
+        return int(self._store.lengths[self._agent])
+
+    @overload
+    def __getitem__(self, idx: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("history index out of range")
+        return self._store.entry(self._agent, idx)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for slot in range(len(self)):
+            yield self._store.entry(self._agent, slot)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, AgentHistoryView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"AgentHistoryView({self.to_list()!r})"
+
+
+def new_history_store(num_agents: int, num_rounds: int) -> AgentHistoryStore:
+    """Store sized for one auction: agents raise once per round but the last."""
+    return AgentHistoryStore(num_agents, max(1, num_rounds - 1))
+
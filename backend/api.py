@@ -1,8 +1,40 @@
-from typing import List, Any, Dict
-from fastapi import FastAPI
+import asyncio
+import copy
+import json
+from typing import List, Any, AsyncIterator, Dict, Optional
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from auction_core import rank_profiles
+from auction_core import (
+    is_fallback_reason,
+    rank_auctions_async,
+    rank_profiles_async,
+    rule_keywords_from_config,
+    GeminiScoringOptions,
+    TieringOptions,
+)
+from multi_round_auction import (
+    AuctionRoundResult,
+    _winner_summary,
+    compute_agent_social_scores_async,
+    iter_multi_round_auction,
+    load_config,
+    prepare_agents_from_config,
+)
+from auction_result_cache import (
+    CACHE_MISS,
+    AuctionResultCache,
+    auction_request_key,
+    etag_matches,
+    result_etag,
+)
+from auction_jobs import (
+    KIND_MULTI_ROUND,
+    KIND_RANK,
+    JobQueueFull,
+    get_job_runner,
+)
 
 
 class Profile(BaseModel):
@@ -16,6 +48,40 @@ class Profile(BaseModel):
 class AuctionRequest(BaseModel):
     profiles: List[Profile]
     use_gemini: bool = True
+    tiered: bool = False
+
+
+class BulkAuctionItem(BaseModel):
+    auction_id: str
+    profiles: List[Profile]
+
+
+class BulkAuctionRequest(BaseModel):
+    auctions: List[BulkAuctionItem]
+    use_gemini: bool = True
+
+
+class AgentProfile(Profile):
+    strategy: str = "balanced"
+
+
+class MultiRoundAuctionRequest(BaseModel):
+    agents: List[AgentProfile]
+    # Unset fields fall back to auction_config.json.
+    num_rounds: Optional[int] = None
+    money_weight: Optional[float] = None
+    social_weight: Optional[float] = None
+    random_seed: Optional[int] = None
+    use_gemini: bool = True
+    top_k: Optional[int] = None  # ranking rows per round event (None = all)
+
+
+class AuctionJobRequest(AuctionRequest):
+    priority: int = 0  # higher runs first; FIFO within a priority
+
+
+class MultiRoundAuctionJobRequest(MultiRoundAuctionRequest):
+    priority: int = 0
 
 
 class RankedProfile(BaseModel):
@@ -24,33 +90,368 @@ class RankedProfile(BaseModel):
     social_score: float
     final_score: float
     social_reason: str
-    edge_multiplier_info: str
+    edge_multiplier_info: Optional[str] = None
     profile: Dict[str, Any]
+    social_tier: Optional[str] = None
 
 class AuctionResponse(BaseModel):
     social_mode: str
     winner: RankedProfile
     ranking: List[RankedProfile]
+    tier_counts: Optional[Dict[str, int]] = None
+
+class BulkAuctionResult(BaseModel):
+    auction_id: str
+    social_mode: str
+    winner: RankedProfile
+    ranking: List[RankedProfile]
+    rank_seconds: float
+
+class BulkAuctionResponse(BaseModel):
+    results: List[BulkAuctionResult]
+    profiles_total: int
+    profiles_distinct: int
+    timings: Dict[str, float]
 
 app = FastAPI(title="AI Social Auction API")
 
+CONFIG = load_config("auction_config.json")
+
+# Concurrency for Gemini calls, plus the opt-in rate limit, disk cache, latency
+# budget, hedging and circuit breaker (all off in the shipped config).
+GEMINI_OPTIONS = GeminiScoringOptions.from_config(CONFIG.get("gemini", {}))
+
+GEMINI_MODEL = CONFIG.get("gemini", {}).get("model", "gemini-2.5-flash")
+
+# Keyword lists for rule-based scoring and Gemini fallbacks, compiled once.
+RULE_KEYWORDS = rule_keywords_from_config(CONFIG.get("rule_based"))
+
+# Finished /run-auction results by normalized request; identical requests in
+# flight at the same time share one computation. None when disabled.
+RESULT_CACHE = AuctionResultCache.from_config(CONFIG.get("result_cache", {}))
+
+# Rounds computed ahead of a streaming client. When the buffer is full the
+# auction pauses until the client reads, so a slow reader costs at most this
+# many serialized rounds of memory.
+STREAM_BUFFER_ROUNDS = 4
+
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "AI Auction API is running. POST /run-auction to evaluate profiles."}
 
 
+def _has_fallback_scores(body: Dict[str, Any], use_gemini: bool) -> bool:
+    """Gemini was asked for, but some scores came from the rule engine (no client, breaker, deadline, ...)."""
+    if not use_gemini:
+        return False
+    if body["social_mode"] == "rule-based":
+        return True
+    return any(is_fallback_reason(row["social_reason"]) for row in body["ranking"])
+
+
 @app.post("/run-auction", response_model=AuctionResponse)
-def run_auction(req: AuctionRequest):
+async def run_auction(
+    req: AuctionRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    Identical requests (same profiles, flags and model) are answered from
+    RESULT_CACHE or joined onto the one already in flight; X-Cache says
+    which. The ETag lets a client send If-None-Match and get 304. Results
+    with fallback scores are only kept for degraded_ttl_seconds.
+    """
     profiles_list = [p.model_dump() for p in req.profiles]
 
-    result = rank_profiles(
-        profiles=profiles_list,
+    # Awaits Gemini (client.aio) and ranks in a worker thread, so concurrent
+    # auctions never tie up the server's threadpool or the event loop.
+    async def compute() -> Dict[str, Any]:
+        result = await rank_profiles_async(
+            profiles=profiles_list,
+            use_gemini=req.use_gemini,
+            model_name=GEMINI_MODEL,
+            tiering=TieringOptions() if req.tiered else None,
+            gemini_options=GEMINI_OPTIONS,
+            rule_keywords=RULE_KEYWORDS,
+        )
+        return {
+            "social_mode": result["social_mode"],
+            "winner": result["winner"],
+            "ranking": list(result["ranking"]),
+            "tier_counts": result.get("tier_counts"),
+        }
+
+    if RESULT_CACHE is None:
+        body = await compute()
+        etag, source = result_etag(body), CACHE_MISS
+    else:
+        key = auction_request_key(profiles_list, req.use_gemini, req.tiered, GEMINI_MODEL)
+        entry, source = await RESULT_CACHE.get_or_compute(
+            key, compute, degraded=lambda body: _has_fallback_scores(body, req.use_gemini)
+        )
+        body, etag = entry.result, entry.etag
+
+    headers = {"ETag": etag, "X-Cache": source}
+    if etag_matches(if_none_match, etag):
+        if RESULT_CACHE is not None:
+            RESULT_CACHE.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return body
+
+
+@app.get("/metrics")
+async def metrics():
+    """Hit rate and compute time saved by RESULT_CACHE, and the social score cache's counters."""
+    social_cache = GEMINI_OPTIONS.cache
+    return {
+        "result_cache": RESULT_CACHE.stats() if RESULT_CACHE is not None else None,
+        "social_score_cache": (
+            await asyncio.to_thread(social_cache.stats) if social_cache is not None else None
+        ),
+    }
+
+
+@app.post("/run-auctions", response_model=BulkAuctionResponse)
+async def run_auctions(req: BulkAuctionRequest):
+    """
+    Many auctions in one request. A donor appearing in several auctions is
+    social-scored once; auctions are ranked in parallel. Timings are per
+    phase (dedupe / scoring / ranking) plus rank_seconds per auction.
+    """
+    if not req.auctions:
+        raise HTTPException(status_code=422, detail="No auctions provided")
+    empty = [a.auction_id for a in req.auctions if not a.profiles]
+    if empty:
+        raise HTTPException(status_code=422, detail=f"Auctions without profiles: {', '.join(empty)}")
+
+    bulk = await rank_auctions_async(
+        [[p.model_dump() for p in a.profiles] for a in req.auctions],
         use_gemini=req.use_gemini,
+        model_name=GEMINI_MODEL,
+        gemini_options=GEMINI_OPTIONS,
+        rule_keywords=RULE_KEYWORDS,
     )
 
     return {
-        "social_mode": result["social_mode"],
-        "winner": result["winner"],
-        "ranking": result["ranking"]
+        "results": [
+            {
+                "auction_id": auction.auction_id,
+                "social_mode": result["social_mode"],
+                "winner": result["winner"],
+                "ranking": result["ranking"],
+                "rank_seconds": result["rank_seconds"],
+            }
+            for auction, result in zip(req.auctions, bulk["results"])
+        ],
+        "profiles_total": bulk["profiles_total"],
+        "profiles_distinct": bulk["profiles_distinct"],
+        "timings": bulk["timings"],
+    }
+
+
+# ---------- Multi-round auction streaming (SSE) ----------
+
+def _multi_round_config(req: MultiRoundAuctionRequest) -> Dict[str, Any]:
+    config = copy.deepcopy(CONFIG)
+    params = config["auction_params"]
+    for key in ("num_rounds", "money_weight", "social_weight", "random_seed"):
+        value = getattr(req, key)
+        if value is not None:
+            params[key] = value
+    config["gemini"]["enabled"] = req.use_gemini
+    config["agents"] = [a.model_dump() for a in req.agents]
+
+    if not config["agents"]:
+        raise HTTPException(status_code=422, detail="No agents provided")
+    unknown = sorted({a["strategy"] for a in config["agents"]} - set(config["strategy_params"]))
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown strategies: {', '.join(unknown)}")
+    return config
+
+
+def _sse(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
+
+
+def _round_event(round_result: AuctionRoundResult, top_k: Optional[int]) -> str:
+    ranking = round_result.ranking
+    rows = list(ranking) if top_k is None else ranking[:top_k]
+    return _sse(
+        "round",
+        {
+            "round_index": round_result.round_index,
+            "stop_reason": round_result.stop_reason,
+            "winner": round_result.winner,
+            "ranking": rows,
+        },
+        event_id=round_result.round_index,
+    )
+
+
+async def _auction_events(config: Dict[str, Any], top_k: Optional[int]) -> AsyncIterator[str]:
+    """
+    start -> round (one per round, as soon as it is ranked) -> done | error.
+
+    Social scores are awaited once up front. Rounds are computed in a worker
+    thread into a queue of STREAM_BUFFER_ROUNDS events; the producer waits
+    whenever the client falls that far behind, and is cancelled if the
+    client disconnects.
+    """
+    agents = prepare_agents_from_config(config)
+    social_scores, social_mode = await compute_agent_social_scores_async(
+        config, agents, gemini_options=GEMINI_OPTIONS
+    )
+    yield _sse(
+        "start",
+        {
+            "social_mode": social_mode,
+            "agents": len(agents),
+            "num_rounds": int(config["auction_params"]["num_rounds"]),
+        },
+    )
+
+    rounds = iter_multi_round_auction(config, social_scores, social_mode)
+    summary: Dict[str, Any] = {"social_mode": social_mode}
+
+    def step() -> Optional[str]:
+        round_result = next(rounds, None)
+        if round_result is None:
+            return None
+        summary["final_winner"] = _winner_summary(round_result.winner)
+        summary["stop_reason"] = round_result.stop_reason
+        summary["rounds_played"] = round_result.round_index
+        return _round_event(round_result, top_k)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_BUFFER_ROUNDS)
+
+    async def produce() -> None:
+        try:
+            while True:
+                event = await asyncio.to_thread(step)
+                if event is None:
+                    break
+                await queue.put(event)
+        except Exception as exc:
+            await queue.put(exc)
+        await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                yield _sse("done", summary)
+                return
+            if isinstance(item, Exception):
+                yield _sse("error", {"error": type(item).__name__, "detail": str(item)})
+                return
+            yield item
+    finally:
+        producer.cancel()
+
+
+@app.post("/run-multi-round-auction/stream")
+async def stream_multi_round_auction(req: MultiRoundAuctionRequest):
+    """Server-sent events with each round's ranking as soon as it is computed."""
+    config = _multi_round_config(req)
+    return StreamingResponse(
+        _auction_events(config, req.top_k),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ---------- Background jobs ----------
+
+async def _submit_job(kind: str, payload: Dict[str, Any], priority: int) -> Dict[str, Any]:
+    runner = get_job_runner(CONFIG)
+    try:
+        job = await asyncio.to_thread(runner.submit, kind, payload, priority)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=429, detail=f"Job queue is full: {exc}")
+    return {"job_id": job.job_id, "status": job.status}
+
+
+@app.post("/jobs/run-auction", status_code=202)
+async def submit_auction_job(req: AuctionJobRequest):
+    """Queue /run-auction as a background job; poll GET /jobs/{job_id} for the result."""
+    payload = {
+        "profiles": [p.model_dump() for p in req.profiles],
+        "use_gemini": req.use_gemini,
+        "tiered": req.tiered,
+        "gemini": CONFIG.get("gemini", {}),
+        "rule_based": CONFIG.get("rule_based"),
     }
+    return await _submit_job(KIND_RANK, payload, req.priority)
+
+
+@app.post("/jobs/run-multi-round-auction", status_code=202)
+async def submit_multi_round_job(req: MultiRoundAuctionJobRequest):
+    """Queue a multi-round auction; progress reports rounds played so far."""
+    return await _submit_job(KIND_MULTI_ROUND, {"config": _multi_round_config(req)}, req.priority)
+
+
+@app.get("/jobs")
+async def list_jobs(status: Optional[str] = None, limit: int = 100):
+    jobs = await asyncio.to_thread(get_job_runner(CONFIG).queue.list, status, limit)
+    return {"jobs": [job.to_dict(include_result=False) for job in jobs]}
+
+
+async def _get_job(job_id: str):
+    job = await asyncio.to_thread(get_job_runner(CONFIG).get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    return (await _get_job(job_id)).to_dict()
+
+
+async def _job_events(job_id: str) -> AsyncIterator[str]:
+    """
+    status (whenever status or progress changes) -> done (with the result),
+    or error if the job is pruned from the queue while being watched.
+    """
+    runner = get_job_runner(CONFIG)
+    last = None
+    while True:
+        job = await asyncio.to_thread(runner.get, job_id)
+        if job is None:
+            yield _sse("error", {"error": "JobNotFound", "detail": f"Unknown job: {job_id}"})
+            return
+        if job.done:
+            yield _sse("done", job.to_dict())
+            return
+        state = job.to_dict(include_result=False)
+        if state != last:
+            yield _sse("status", state)
+            last = state
+        await asyncio.sleep(runner.poll_interval)
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job(job_id: str):
+    """Server-sent events with the job's status and progress until it finishes."""
+    await _get_job(job_id)
+    return StreamingResponse(
+        _job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Queued jobs are cancelled at once; running multi-round jobs stop after the current round."""
+    status = await asyncio.to_thread(get_job_runner(CONFIG).cancel, job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return {"job_id": job_id, "status": status}
@@ -0,0 +1,245 @@
+# auction_checkpoint.py
+#
+# Checkpoint / resume for long multi-round auctions. If the process dies in
+# round 7 of 10, resuming continues from the last checkpoint with the same
+# bids, the same random stream and the already-paid-for social scores, and
+# ends with exactly the result an uninterrupted run would have produced.
+#
+#   python auction_checkpoint.py --checkpoint auction.ckpt.json            # start or resume
+#   python auction_checkpoint.py --checkpoint auction.ckpt.json --fresh    # ignore old state
+#
+# Files:
+#   <checkpoint>               state (JSON, replaced atomically)
+#   <checkpoint>.rounds.jsonl  completed rounds, appended one line per round
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from auction_core import SocialScores
+from multi_round_auction import (
+    STOP_NUM_ROUNDS,
+    AuctionRoundResult,
+    MultiRoundAuctionResult,
+    ResumePoint,
+    _resolve_social_mode,
+    _winner_summary,
+    compute_agent_social_scores,
+    iter_multi_round_auction,
+    load_config,
+    prepare_agents_from_config,
+)
+
+CHECKPOINT_VERSION = 1
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    blob = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _rounds_path(path: str) -> str:
+    return path + ".rounds.jsonl"
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _round_record(round_result: AuctionRoundResult) -> Dict[str, Any]:
+    # Full ranking rows (with profile), so resumed results are identical.
+    return {
+        "round_index": round_result.round_index,
+        "ranking": list(round_result.ranking),
+        "winner": round_result.winner,
+        "stop_reason": round_result.stop_reason,
+    }
+
+
+def load_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}: {state.get('version')}")
+    return state
+
+
+def _load_rounds(path: str, count: int) -> List[AuctionRoundResult]:
+    """First `count` rounds; lines past the last checkpoint are ignored."""
+    rounds: List[AuctionRoundResult] = []
+    if count == 0:
+        return rounds
+    with open(_rounds_path(path), "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            rounds.append(
+                AuctionRoundResult(
+                    round_index=record["round_index"],
+                    ranking=record["ranking"],
+                    winner=record["winner"],
+                    stop_reason=record.get("stop_reason"),
+                )
+            )
+            if len(rounds) == count:
+                break
+    if len(rounds) < count:
+        raise ValueError(f"{_rounds_path(path)} has {len(rounds)} rounds, checkpoint expects {count}")
+    return rounds
+
+
+def _truncate_rounds(path: str, count: int) -> None:
+    """Drop rounds appended after the last state write (they get re-run)."""
+    rounds_path = _rounds_path(path)
+    if count == 0:
+        open(rounds_path, "w", encoding="utf-8").close()
+        return
+    with open(rounds_path, "rb+") as f:
+        seen = 0
+        while seen < count and f.readline():
+            seen += 1
+        f.truncate()
+
+
+def run_multi_round_auction_checkpointed(
+    config: Dict[str, Any],
+    checkpoint_path: str,
+    every: int = 1,
+    resume: bool = True,
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+) -> MultiRoundAuctionResult:
+    """
+    run_multi_round_auction() with a checkpoint written every `every` rounds.
+
+    With resume=True and a matching unfinished checkpoint at
+    `checkpoint_path`, the auction picks up after the last checkpointed round
+    instead of starting over; social scores come from the checkpoint, so no
+    LLM call is repeated. The result equals an uninterrupted run's.
+    """
+    every = max(1, every)
+    fingerprint = config_fingerprint(config)
+    state = load_checkpoint(checkpoint_path) if resume else None
+    if state is not None and state["config_fingerprint"] != fingerprint:
+        raise ValueError(
+            f"{checkpoint_path} was written for a different config; pass resume=False to start over"
+        )
+
+    if state is not None:
+        social_scores = {name: (float(v[0]), v[1]) for name, v in state["social_scores"].items()}
+        social_mode = state["social_mode"]
+        rounds = _load_rounds(checkpoint_path, state["rounds_completed"])
+        if state["done"]:
+            return _result(config, rounds, social_mode)
+        _truncate_rounds(checkpoint_path, state["rounds_completed"])
+        resume_point: Optional[ResumePoint] = ResumePoint.from_dict(state["resume"])
+    else:
+        if social_scores is None:
+            social_scores, social_mode = compute_agent_social_scores(
+                config, prepare_agents_from_config(config)
+            )
+        rounds = []
+        resume_point = None
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        _truncate_rounds(checkpoint_path, 0)
+
+    base_state = {
+        "version": CHECKPOINT_VERSION,
+        "config_fingerprint": fingerprint,
+        "social_mode": social_mode,
+        "social_scores": {name: [score, reason] for name, (score, reason) in social_scores.items()},
+    }
+
+    # The first round is always checkpointed, so the social scores (the
+    # expensive part) survive even an early crash.
+    pending_first = [True]
+
+    with open(_rounds_path(checkpoint_path), "a", encoding="utf-8") as rounds_file:
+
+        def on_round(round_result: AuctionRoundResult, point: ResumePoint) -> None:
+            record = _round_record(round_result)
+            rounds_file.write(json.dumps(record) + "\n")
+            rounds.append(
+                AuctionRoundResult(
+                    round_index=record["round_index"],
+                    ranking=record["ranking"],
+                    winner=record["winner"],
+                    stop_reason=record["stop_reason"],
+                )
+            )
+            done = round_result.stop_reason is not None
+            if done or pending_first[0] or round_result.round_index % every == 0:
+                pending_first[0] = False
+                rounds_file.flush()
+                os.fsync(rounds_file.fileno())
+                _write_json_atomic(
+                    checkpoint_path,
+                    dict(
+                        base_state,
+                        rounds_completed=len(rounds),
+                        done=done,
+                        resume=point.to_dict(),
+                    ),
+                )
+
+        for _ in iter_multi_round_auction(
+            config, social_scores, social_mode, resume=resume_point, on_round=on_round
+        ):
+            pass
+
+    return _result(config, rounds, social_mode)
+
+
+def resume_multi_round_auction(
+    checkpoint_path: str, config: Dict[str, Any], every: int = 1
+) -> MultiRoundAuctionResult:
+    """Continue the auction in `checkpoint_path`; errors if there is nothing to resume."""
+    if load_checkpoint(checkpoint_path) is None:
+        raise FileNotFoundError(f"No checkpoint at {checkpoint_path}")
+    return run_multi_round_auction_checkpointed(config, checkpoint_path, every=every, resume=True)
+
+
+def _result(
+    config: Dict[str, Any], rounds: List[AuctionRoundResult], social_mode: Optional[str]
+) -> MultiRoundAuctionResult:
+    last = rounds[-1]
+    return MultiRoundAuctionResult(
+        rounds=rounds,
+        final_winner=_winner_summary(last.winner),
+        social_mode=_resolve_social_mode(config, social_mode),
+        stop_reason=last.stop_reason or STOP_NUM_ROUNDS,
+        rounds_played=len(rounds),
+    )
+
+
+# ---------- CLI ----------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a multi-round auction with checkpoints.")
+    parser.add_argument("--config", default="auction_config.json")
+    parser.add_argument("--checkpoint", default="auction.ckpt.json")
+    parser.add_argument("--every", type=int, default=1, help="checkpoint every N rounds")
+    parser.add_argument("--fresh", action="store_true", help="ignore any existing checkpoint")
+    args = parser.parse_args()
+
+    result = run_multi_round_auction_checkpointed(
+        load_config(args.config), args.checkpoint, every=args.every, resume=not args.fresh
+    )
+    fw = result.final_winner
+    print(f"[CHECKPOINT] {result.rounds_played} rounds ({result.stop_reason}), state in {args.checkpoint}")
+    print(
+        f"Final winner: {fw['name']} "
+        f"(final={fw['final_score']}, money={fw['money_score']}, "
+        f"social={fw['social_score']}, bid={fw['bid']})"
+    )
@@ -2,28 +2,97 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import os
 import re
 import json
-from typing import List, Dict, Any, Tuple, Optional
-
-from dotenv import load_dotenv
-
-try:
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Dict,
+    Any,
+    Awaitable,
+    Callable,
+    Tuple,
+    TypeVar,
+    Optional,
+    Mapping,
+    Sequence,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from keyword_matcher import KeywordMatcher, flatten_keyword_weights
+from rag_index import RagIndex
+from llm_limits import CircuitBreaker, CircuitOpenError, TokenBucket, get_circuit_breaker
+from social_score_cache import SocialScoreCache, social_score_cache_key
+
+if TYPE_CHECKING:
     from google import genai
-except ImportError:
-    genai = None
 
 Profile = Dict[str, Any]
+SocialScores = Dict[str, Tuple[float, str]]
+T = TypeVar("T")
 
 # ---------- Env + Gemini client ----------
+#
+# Loading .env, importing the google-genai SDK and building the client are
+# all deferred to the first get_gemini_client() call, so importing this
+# module (CLI scripts, API workers, rule-based runs) stays cheap.
+
+_gemini_lock = threading.Lock()
+_gemini_initialized = False
+_gemini_client: Optional["genai.Client"] = None
+
+
+def _create_gemini_client() -> Optional["genai.Client"]:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return None
+    try:
+        from google import genai
+    except ImportError:
+        return None
+    return genai.Client(api_key=api_key)
+
+
+def get_gemini_client() -> Optional["genai.Client"]:
+    """Thread-safe, lazily created Gemini client; None if no key or SDK."""
+    global _gemini_client, _gemini_initialized
+    if not _gemini_initialized:
+        with _gemini_lock:
+            if not _gemini_initialized:
+                _gemini_client = _create_gemini_client()
+                _gemini_initialized = True
+    return _gemini_client
 
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
-gemini_client: Optional["genai.Client"] = None
-if GEMINI_API_KEY and genai is not None:
-    gemini_client = genai.Client(api_key=GEMINI_API_KEY)
+def set_gemini_client(client: Optional[Any]) -> None:
+    """Install a client explicitly (e.g. FakeGeminiClient); skips env/SDK loading."""
+    global _gemini_client, _gemini_initialized
+    with _gemini_lock:
+        _gemini_client = client
+        _gemini_initialized = True
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards compatible module attributes, resolved on first access.
+    if name == "gemini_client":
+        return get_gemini_client()
+    if name == "GEMINI_API_KEY":
+        get_gemini_client()
+        return os.getenv("GEMINI_API_KEY")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------- Helpers ----------
@@ -51,21 +120,80 @@ def extract_json_from_text(text: str) -> Dict[str, Any]:
     return json.loads(json_str)
 
 
-def compute_money_scores(profiles: List[Dict[str, Any]]) -> Dict[str, float]:
-    max_bids = [p["max_bid"] for p in profiles]
-    min_bid = min(max_bids)
-    max_bid = max(max_bids)
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
 
-    scores: Dict[str, float] = {}
 
-    for p in profiles:
-        if max_bid == min_bid:
-            score = 1.0
+def extract_json_array_from_text(text: str) -> List[Dict[str, Any]]:
+    """
+    Tolerant parser for batched answers. Accepts a JSON array of objects,
+    optionally fenced, wrapped in an object ({"results": [...]}), keyed by
+    name ({"Ann": {...}}), with trailing commas, or truncated mid-array, in
+    which case every complete object is salvaged. Raises ValueError if
+    nothing usable is found.
+    """
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.strip("`")
+        if cleaned[:4].lower() == "json":
+            cleaned = cleaned[4:]
+    cleaned = _TRAILING_COMMA_RE.sub(r"\1", cleaned)
+
+    start = cleaned.find("[")
+    end = cleaned.rfind("]")
+    if start != -1 and end > start:
+        try:
+            items = [d for d in json.loads(cleaned[start: end + 1]) if isinstance(d, dict)]
+            if items:
+                return items
+        except ValueError:
+            pass
+
+    try:
+        obj = extract_json_from_text(cleaned)
+    except ValueError:
+        obj = None
+    if isinstance(obj, dict):
+        if "social_score" in obj:
+            return [obj]
+        keyed = [dict(v, name=k) for k, v in obj.items() if isinstance(v, dict)]
+        if keyed:
+            return keyed
+
+    decoder = json.JSONDecoder()
+    items: List[Dict[str, Any]] = []
+    pos = cleaned.find("{")
+    while pos != -1:
+        try:
+            item, pos = decoder.raw_decode(cleaned, pos)
+        except ValueError:
+            pos += 1
         else:
-            score = (p["max_bid"] - min_bid) / (max_bid - min_bid)
-        scores[p["name"]] = clamp(score)
+            if isinstance(item, dict) and "social_score" in item:
+                items.append(item)
+        pos = cleaned.find("{", pos)
 
-    return scores
+    if not items:
+        raise ValueError("No JSON array found")
+    return items
+
+
+def compute_money_scores_array(bids: np.ndarray) -> np.ndarray:
+    """
+    Min-max normalize a bid column into [0, 1].
+    All-equal bids score 1.0, same as compute_money_scores().
+    """
+    bids = np.asarray(bids, dtype=np.float64)
+    min_bid = bids.min()
+    max_bid = bids.max()
+    if max_bid == min_bid:
+        return np.ones_like(bids)
+    return np.clip((bids - min_bid) / (max_bid - min_bid), 0.0, 1.0)
+
+
+def compute_money_scores(profiles: List[Dict[str, Any]]) -> Dict[str, float]:
+    bids = np.fromiter((p["max_bid"] for p in profiles), dtype=np.float64, count=len(profiles))
+    scores = compute_money_scores_array(bids)
+    return {p["name"]: float(s) for p, s in zip(profiles, scores)}
 
 
 POSITIVE_KEYWORDS = [
@@ -98,8 +226,78 @@ NEGATIVE_PROFESSIONS = [
 ]
 
 
+PROFESSION_BONUS_KEYWORDS = [
+    "lawyer",
+    "doctor",
+    "teacher",
+]
+
+
+class RuleKeywords:
+    """
+    Precompiled keyword matchers for the rule-based scorer.
+
+    positive: {keyword: weight} matched in social_contribution, each distinct hit adds its weight.
+    negative: {keyword: weight} matched in profession, each distinct hit adds its (negative) weight.
+    profession_bonus: {keyword: weight} matched in profession, the largest hit is added once.
+    """
+
+    def __init__(
+        self,
+        positive: Dict[str, float],
+        negative: Dict[str, float],
+        profession_bonus: Dict[str, float],
+    ) -> None:
+        self.positive = KeywordMatcher(positive)
+        self.negative = KeywordMatcher(negative)
+        self.profession_bonus = KeywordMatcher(profession_bonus)
+
+    @classmethod
+    def from_config(cls, rule_cfg: Optional[Dict[str, Any]]) -> "RuleKeywords":
+        """
+        Build from the "rule_based" config section. Each of positive_keywords /
+        negative_professions / profession_bonus may be a list, a {keyword:
+        weight} map, or keywords grouped by impact area; missing ones keep the
+        built-in lists. "keywords_path" points to a JSON file with the same keys,
+        which inline entries override.
+        """
+        rule_cfg = dict(rule_cfg or {})
+        path = rule_cfg.pop("keywords_path", None)
+        if path:
+            with open(path, "r", encoding="utf-8") as f:
+                rule_cfg = {**json.load(f), **rule_cfg}
+
+        def section(key: str, default: List[str], weight: float) -> Dict[str, float]:
+            return flatten_keyword_weights(rule_cfg.get(key, default), weight)
+
+        return cls(
+            positive=section("positive_keywords", POSITIVE_KEYWORDS, 0.05),
+            negative=section("negative_professions", NEGATIVE_PROFESSIONS, -0.3),
+            profession_bonus=section("profession_bonus", PROFESSION_BONUS_KEYWORDS, 0.1),
+        )
+
+
+DEFAULT_RULE_KEYWORDS = RuleKeywords.from_config(None)
+_rule_keywords_by_config: Dict[str, RuleKeywords] = {}
+
+
+def rule_keywords_from_config(rule_cfg: Optional[Dict[str, Any]]) -> RuleKeywords:
+    """RuleKeywords.from_config(), memoized so each distinct config is compiled once."""
+    if not rule_cfg:
+        return DEFAULT_RULE_KEYWORDS
+    key = json.dumps(rule_cfg, sort_keys=True)
+    keywords = _rule_keywords_by_config.get(key)
+    if keywords is None:
+        keywords = RuleKeywords.from_config(rule_cfg)
+        _rule_keywords_by_config[key] = keywords
+    return keywords
+
+
+_DONATION_RE = re.compile(r"\$?\s*([\d,]+)")
+
+
 def extract_donation_amount(text: str) -> float:
-    amounts = re.findall(r"\$?\s*([\d,]+)", text)
+    amounts = _DONATION_RE.findall(text)
     vals = []
     for a in amounts:
         a_clean = a.replace(",", "")
@@ -110,58 +308,102 @@ def extract_donation_amount(text: str) -> float:
     return max(vals) if vals else 0.0
 
 
-def compute_social_score_rule_based(profile: Dict[str, Any]) -> float:
+def rule_based_breakdown(
+    profile: Dict[str, Any], keywords: Optional[RuleKeywords] = None
+) -> Dict[str, Any]:
+    """Rule-based score plus the signals that produced it (`keywords` None = built-in lists)."""
+    keywords = keywords or DEFAULT_RULE_KEYWORDS
     profession = profile.get("profession", "").lower()
     contrib = profile.get("social_contribution", "").lower()
 
-    score = 0.5
-
-    for bad in NEGATIVE_PROFESSIONS:
-        if bad in profession:
-            score -= 0.3
+    score, negative_hits = keywords.negative.score(profession, start=0.5)
 
-    if "lawyer" in profession or "doctor" in profession or "teacher" in profession:
-        score += 0.1
+    bonus_ids = keywords.profession_bonus.matched_ids(profession)
+    profession_bonus = bool(bonus_ids)
+    if profession_bonus:
+        score += max(keywords.profession_bonus.weights[i] for i in bonus_ids)
 
-    for kw in POSITIVE_KEYWORDS:
-        if kw in contrib:
-            score += 0.05
+    score, positive_hits = keywords.positive.score(contrib, start=score)
 
     donation = extract_donation_amount(profile.get("social_contribution", ""))
     donation_bonus = clamp(donation / 10000.0, 0.0, 0.2)
     score += donation_bonus
 
-    return clamp(score)
+    return {
+        "score": clamp(score),
+        "negative_hits": negative_hits,
+        "positive_hits": positive_hits,
+        "profession_bonus": profession_bonus,
+        "donation_bonus": donation_bonus,
+    }
+
+
+def rule_based_confidence(breakdown: Dict[str, Any]) -> float:
+    """
+    How much to trust a rule-based score, in [0, 1].
+
+    A harmful-profession match or several positive keywords are clear-cut;
+    conflicting signals (both) or no signal at all are exactly the profiles
+    where free text needs an LLM to read it.
+    """
+    negative = breakdown["negative_hits"] > 0
+    positive = breakdown["positive_hits"]
+    if negative and positive:
+        return 0.25
+    if negative:
+        return 0.9
+    confidence = 0.2 + 0.2 * positive
+    if breakdown["profession_bonus"]:
+        confidence += 0.1
+    if breakdown["donation_bonus"] > 0:
+        confidence += 0.1
+    return clamp(confidence)
+
+
+def compute_social_score_rule_based(
+    profile: Dict[str, Any], keywords: Optional[RuleKeywords] = None
+) -> float:
+    return rule_based_breakdown(profile, keywords)["score"]
 
 
 def compute_social_scores_rule_based(
-    profiles: List[Dict[str, Any]]
+    profiles: List[Dict[str, Any]], keywords: Optional[RuleKeywords] = None
 ) -> Dict[str, Tuple[float, str]]:
     scores: Dict[str, Tuple[float, str]] = {}
     for p in profiles:
-        s = compute_social_score_rule_based(p)
+        s = compute_social_score_rule_based(p, keywords)
         reason = "Rule-based: profession + keywords + donation amount."
         scores[p["name"]] = (s, reason)
     return scores
 
 
-def _get_rag_context(name: str, rag_index: Optional[Dict[str, List[str]]]) -> str:
+def _rubric_query() -> str:
+    return " ".join([SCORING_RULES, *POSITIVE_KEYWORDS, *NEGATIVE_PROFESSIONS])
+
+
+def _get_rag_context(name: str, rag_index: Optional[Mapping[str, List[str]]]) -> str:
     if not rag_index:
         return ""
+    if isinstance(rag_index, RagIndex):
+        # Only the passages most relevant to the scoring rubric, within budget.
+        return rag_index.context(name, _rubric_query())
     docs = rag_index.get(name, [])
     if not docs:
         return ""
     return "\n\n".join(docs)
 
 
-def compute_social_score_gemini(
-    profile: Dict[str, Any],
-    client: "genai.Client",
-    model_name: str,
-    rag_index: Optional[Dict[str, List[str]]] = None,
-) -> Tuple[float, str]:
-    name = profile.get("name", "")
-    rag_context = _get_rag_context(name, rag_index)
+SCORING_RULES = """
+Scoring rules:
+- Harmful industries (e.g., tobacco, weapons, hard drugs, exploitative gambling) should receive lower scores.
+- Contributions helping vulnerable groups (children, women, refugees, sick people, poor communities) should increase the score.
+- Contributions to education, healthcare, environment, human rights and poverty reduction should increase the score.
+- Donation amount matters, but ethics and impact of the action matter more than raw money.
+- The score MUST be between 0 and 1.
+""".strip()
+
+
+def _build_social_prompt(profile: Dict[str, Any], rag_context: str) -> str:
     rag_block = ""
     if rag_context:
         rag_block = (
@@ -169,7 +411,7 @@ def compute_social_score_gemini(
             f"{rag_context}\n"
         )
 
-    prompt = f"""
+    return f"""
 You are an evaluator that scores people based on positive social impact and ethical alignment.
 
 Profile:
@@ -178,12 +420,7 @@ Profile:
 - Profession: {profile.get("profession")}
 - Social contribution: {profile.get("social_contribution")}{rag_block}
 
-Scoring rules:
-- Harmful industries (e.g., tobacco, weapons, hard drugs, exploitative gambling) should receive lower scores.
-- Contributions helping vulnerable groups (children, women, refugees, sick people, poor communities) should increase the score.
-- Contributions to education, healthcare, environment, human rights and poverty reduction should increase the score.
-- Donation amount matters, but ethics and impact of the action matter more than raw money.
-- The score MUST be between 0 and 1.
+{SCORING_RULES}
 
 Output format:
 Respond STRICTLY as JSON, with NO markdown, NO code fences, and NO extra commentary.
@@ -194,107 +431,1209 @@ The JSON MUST have this exact structure:
 }}
     """.strip()
 
-    response = client.models.generate_content(
-        model=model_name,
-        contents=prompt,
-    )
 
-    raw_text = response.text.strip()
+def _build_batch_social_prompt(profiles: List[Dict[str, Any]], rag_contexts: List[str]) -> str:
+    blocks = []
+    for i, (profile, rag_context) in enumerate(zip(profiles, rag_contexts), start=1):
+        block = (
+            f"Profile {i}:\n"
+            f"- Name: {profile.get('name')}\n"
+            f"- Country: {profile.get('country')}\n"
+            f"- Profession: {profile.get('profession')}\n"
+            f"- Social contribution: {profile.get('social_contribution')}"
+        )
+        if rag_context:
+            block += f"\n- Extra context from knowledge base: {rag_context}"
+        blocks.append(block)
+    profiles_block = "\n\n".join(blocks)
+
+    return f"""
+You are an evaluator that scores people based on positive social impact and ethical alignment.
+Score EACH of the {len(profiles)} profiles below independently.
+
+{profiles_block}
+
+{SCORING_RULES}
+
+Output format:
+Respond STRICTLY as a JSON array, with NO markdown, NO code fences, and NO extra commentary.
+The array MUST contain exactly one object per profile, using the exact profile name:
+[
+  {{"name": "<profile name>", "social_score": <number between 0 and 1>, "reason": "Short 1-3 sentence explanation."}}
+]
+    """.strip()
+
 
+@dataclass
+class GeminiScoringOptions:
+    """
+    Tuning knobs for compute_social_scores_gemini().
+
+    max_concurrency: number of Gemini requests in flight at once (1 = serial).
+    rate_limiter: shared TokenBucket every request must pass through, so
+        concurrent scoring stays within the API quota.
+    cache: persistent SocialScoreCache consulted before any network call.
+    batch_size: profiles packed into one prompt (1 = one prompt per profile).
+        Profiles missing from a batched answer are re-issued one by one.
+    deadline_seconds: latency budget for scoring a whole auction. Whatever has
+        not come back by then is scored rule-based and the call returns.
+    hedge_after_seconds: re-issue a request that has been running this long;
+        the first answer wins.
+    breaker: CircuitBreaker that skips Gemini entirely after repeated
+        failures: request errors, or a scoring pass with requests still out
+        at the deadline (one failure per pass, not per profile).
+    """
+
+    max_concurrency: int = 1
+    rate_limiter: Optional[TokenBucket] = None
+    cache: Optional[SocialScoreCache] = None
+    batch_size: int = 1
+    deadline_seconds: Optional[float] = None
+    hedge_after_seconds: Optional[float] = None
+    breaker: Optional[CircuitBreaker] = None
+
+    @classmethod
+    def from_config(cls, gemini_cfg: Dict[str, Any]) -> "GeminiScoringOptions":
+        rpm = gemini_cfg.get("requests_per_minute")
+        breaker_cfg = gemini_cfg.get("circuit_breaker")
+        breaker = None
+        if breaker_cfg:
+            breaker = get_circuit_breaker(
+                gemini_cfg.get("model", "gemini-2.5-flash"),
+                failure_threshold=int(breaker_cfg.get("failure_threshold", 5)),
+                reset_timeout=float(breaker_cfg.get("reset_timeout_seconds", 30.0)),
+            )
+        return cls(
+            max_concurrency=max(1, int(gemini_cfg.get("max_concurrency", 1))),
+            rate_limiter=TokenBucket.per_minute(float(rpm)) if rpm else None,
+            cache=SocialScoreCache.from_config(gemini_cfg),
+            batch_size=max(1, int(gemini_cfg.get("batch_size", 1))),
+            deadline_seconds=gemini_cfg.get("deadline_seconds"),
+            hedge_after_seconds=gemini_cfg.get("hedge_after_seconds"),
+            breaker=breaker,
+        )
+
+
+def _parse_social_answer(raw_text: str) -> Optional[Tuple[float, str]]:
+    """(clamped score, reason) from a single-profile answer; None if unparseable."""
     try:
-        data = extract_json_from_text(raw_text)
+        data = extract_json_from_text(raw_text.strip())
         score = float(data["social_score"])
-        reason = str(data.get("reason", "")).strip()
-        return clamp(score), reason or "AI-based social impact evaluation."
+        reason = str(data.get("reason", "")).strip() or "AI-based social impact evaluation."
+    except Exception:
+        return None
+    return clamp(score), reason
+
+
+FALLBACK_REASON_PREFIX = "Fallback:"
+
+
+def is_fallback_reason(reason: str) -> bool:
+    """True when a social score came from the rule-based fallback rather than Gemini."""
+    return reason.startswith(FALLBACK_REASON_PREFIX)
+
+
+def _unparseable_fallback(
+    profile: Dict[str, Any], keywords: Optional[RuleKeywords] = None
+) -> Tuple[float, str]:
+    return (
+        compute_social_score_rule_based(profile, keywords),
+        f"{FALLBACK_REASON_PREFIX} Gemini output not parseable as JSON, used rule-based scoring instead.",
+    )
+
+
+def _rule_based_fallback(
+    profile: Dict[str, Any], why: str, keywords: Optional[RuleKeywords] = None
+) -> Tuple[float, str]:
+    return (
+        compute_social_score_rule_based(profile, keywords),
+        f"{FALLBACK_REASON_PREFIX} {why}, used rule-based scoring instead.",
+    )
+
+
+def _fallback_for_outcome(
+    profile: Dict[str, Any],
+    status: str,
+    error: Optional[BaseException],
+    keywords: Optional[RuleKeywords] = None,
+) -> Tuple[float, str]:
+    if status == "timeout":
+        return _rule_based_fallback(profile, "Gemini missed the latency budget", keywords)
+    if isinstance(error, CircuitOpenError):
+        return _rule_based_fallback(profile, "Gemini circuit breaker open", keywords)
+    return _rule_based_fallback(profile, f"Gemini request failed ({type(error).__name__})", keywords)
+
+
+def _parse_batch_answer(
+    profiles: List[Dict[str, Any]], raw_text: str
+) -> Dict[str, Tuple[float, str]]:
+    """{name: (score, reason)} for every profile with a valid entry in a batched answer."""
+    try:
+        items = extract_json_array_from_text(raw_text)
+    except ValueError:
+        return {}
+
+    by_key = {str(p["name"]).strip().lower(): p for p in profiles}
+    scores: Dict[str, Tuple[float, str]] = {}
+    for item in items:
+        profile = by_key.get(str(item.get("name", "")).strip().lower())
+        if profile is None:
+            continue
+        try:
+            score = clamp(float(item["social_score"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+        reason = str(item.get("reason", "")).strip() or "AI-based social impact evaluation."
+        scores[profile["name"]] = (score, reason)
+    return scores
+
+
+def _cache_batch_scores(
+    cache: SocialScoreCache,
+    profiles: List[Dict[str, Any]],
+    rag_contexts: List[str],
+    scores: Dict[str, Tuple[float, str]],
+    model_name: str,
+) -> None:
+    for profile, rag_context in zip(profiles, rag_contexts):
+        if profile["name"] in scores:
+            score, reason = scores[profile["name"]]
+            cache.put(
+                social_score_cache_key(profile, rag_context, model_name),
+                profile["name"],
+                model_name,
+                score,
+                reason,
+            )
+
+
+def _split_cached(
+    profiles: List[Dict[str, Any]],
+    rag_index: Optional[Mapping[str, List[str]]],
+    model_name: str,
+    cache: Optional[SocialScoreCache],
+) -> Tuple[Dict[str, Tuple[float, str]], List[Dict[str, Any]]]:
+    """({name: cached score}, profiles still to score)"""
+    found: Dict[str, Tuple[float, str]] = {}
+    pending: List[Dict[str, Any]] = []
+    for p in profiles:
+        cached = None
+        if cache is not None:
+            rag_context = _get_rag_context(p.get("name", ""), rag_index)
+            cached = cache.get(social_score_cache_key(p, rag_context, model_name))
+        if cached is not None:
+            found[p["name"]] = cached
+        else:
+            pending.append(p)
+    return found, pending
+
+
+# ---------- Gemini scoring ----------
+#
+# One implementation, on asyncio: LLM calls go through client.aio (a
+# sync-only client is called in a worker thread), concurrency is a
+# semaphore, the rate limiter waits with asyncio.sleep, and the SQLite cache
+# runs in worker threads. Event-loop callers (the API) await the *_async
+# functions; the blocking functions after them drive the same coroutines on
+# one shared background event loop (_run_sync), calling the SDK's sync
+# client.models in that loop's worker threads.
+
+# Set for coroutines started by _run_sync(): use client.models, not client.aio.
+_BLOCKING_CALLER: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "gemini_blocking_caller", default=False
+)
+
+async def _call_gemini_async(
+    client: "genai.Client",
+    model_name: str,
+    prompt: str,
+    rate_limiter: Optional[TokenBucket],
+    breaker: Optional[CircuitBreaker],
+) -> str:
+    if breaker is not None and not breaker.allow_request():
+        raise CircuitOpenError("Gemini circuit breaker is open")
+
+    if rate_limiter is not None:
+        await rate_limiter.acquire_async()
+
+    try:
+        aio = getattr(client, "aio", None)
+        if aio is not None and not _BLOCKING_CALLER.get():
+            response = await aio.models.generate_content(model=model_name, contents=prompt)
+        else:
+            # Blocking caller or sync-only client: keep the call off the loop.
+            response = await asyncio.to_thread(
+                client.models.generate_content, model=model_name, contents=prompt
+            )
+        text = response.text
     except Exception:
-        fallback_score = compute_social_score_rule_based(profile)
-        fallback_reason = (
-            "Fallback: Gemini output not parseable as JSON, used rule-based scoring instead."
+        if breaker is not None:
+            breaker.record_failure()
+        raise
+
+    if breaker is not None:
+        breaker.record_success()
+    return text
+
+
+async def compute_social_score_gemini_async(
+    profile: Dict[str, Any],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    cache: Optional[SocialScoreCache] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+    cache_checked: bool = False,
+) -> Tuple[float, str]:
+    """
+    Score one profile. With `cache`, a cached score is returned without
+    calling Gemini and a fresh one is stored; `cache_checked=True` means the
+    caller already missed the cache for this profile, so it is only written.
+    """
+    name = profile.get("name", "")
+    rag_context = _get_rag_context(name, rag_index)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = social_score_cache_key(profile, rag_context, model_name)
+        if not cache_checked:
+            cached = await asyncio.to_thread(cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+    prompt = _build_social_prompt(profile, rag_context)
+    raw_text = await _call_gemini_async(client, model_name, prompt, rate_limiter, breaker)
+
+    parsed = _parse_social_answer(raw_text)
+    if parsed is None:
+        return _unparseable_fallback(profile, rule_keywords)
+
+    if cache is not None:
+        await asyncio.to_thread(cache.put, cache_key, name, model_name, parsed[0], parsed[1])
+    return parsed
+
+
+async def compute_social_scores_gemini_batch_async(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    cache: Optional[SocialScoreCache] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Dict[str, Tuple[float, str]]:
+    """
+    Score several profiles with ONE Gemini request.
+
+    Only profiles that come back with a valid score are returned; callers
+    must re-issue the rest individually. Raises on request failure.
+    """
+    rag_contexts = [_get_rag_context(p.get("name", ""), rag_index) for p in profiles]
+    prompt = _build_batch_social_prompt(profiles, rag_contexts)
+    raw_text = await _call_gemini_async(client, model_name, prompt, rate_limiter, breaker)
+    scores = _parse_batch_answer(profiles, raw_text)
+    if cache is not None:
+        await asyncio.to_thread(
+            _cache_batch_scores, cache, profiles, rag_contexts, scores, model_name
+        )
+    return scores
+
+
+class _DeadlinePassed(Exception):
+    """A queued Gemini call reached its turn after the deadline and was not sent."""
+
+
+def _past_deadline(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.monotonic() >= deadline
+
+
+async def _run_gemini_tasks_async(
+    tasks: List[Callable[[], Awaitable[Any]]],
+    options: GeminiScoringOptions,
+    deadline: Optional[float],
+) -> List[Tuple[str, Any]]:
+    """
+    Run independent Gemini calls, at most options.max_concurrency in flight,
+    in input order.
+
+    Each entry of the result is ("ok", value), ("error", exception) or
+    ("timeout", None) if nothing came back before the absolute `deadline`
+    (time.monotonic()). Slow calls are hedged after options.hedge_after_seconds;
+    calls still running at the deadline are cancelled, and no call (or hedge)
+    is sent once it has passed.
+
+    A deadline miss counts against options.breaker at most once per call of
+    this function, and only if a request was actually out at the deadline
+    (Gemini was slow); work the budget merely cut off counts for nothing.
+    """
+    n = len(tasks)
+    if n == 0:
+        return []
+    if _past_deadline(deadline):
+        return [("timeout", None)] * n
+    semaphore = asyncio.Semaphore(max(1, options.max_concurrency))
+    hedge_after = options.hedge_after_seconds
+
+    sent = [False] * n
+
+    async def run_one(i: int) -> Tuple[str, Any]:
+        started = asyncio.Event()
+
+        async def attempt() -> Any:
+            async with semaphore:
+                if _past_deadline(deadline):
+                    raise _DeadlinePassed()
+                started.set()
+                sent[i] = True
+                return await tasks[i]()
+
+        pending = {asyncio.ensure_future(attempt())}
+        try:
+            if hedge_after is not None:
+                # The hedge clock starts once the call holds a slot.
+                await started.wait()
+                done, _ = await asyncio.wait(pending, timeout=hedge_after)
+                if not done:
+                    pending.add(asyncio.ensure_future(attempt()))
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    exc = future.exception()
+                    if exc is None:
+                        return "ok", future.result()
+                    error = exc
+            if isinstance(error, _DeadlinePassed):
+                return "timeout", None
+            return "error", error
+        finally:
+            for future in pending:
+                future.cancel()
+
+    runners = [asyncio.ensure_future(run_one(i)) for i in range(n)]
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    done, not_done = await asyncio.wait(runners, timeout=timeout)
+    for runner in not_done:
+        runner.cancel()
+    if not_done:
+        await asyncio.gather(*not_done, return_exceptions=True)
+
+    # Also releases a half-open breaker's trial request if it was cut off.
+    if options.breaker is not None and any(sent[i] for i, r in enumerate(runners) if r in not_done):
+        options.breaker.record_failure()
+
+    return [runner.result() if runner in done else ("timeout", None) for runner in runners]
+
+
+async def _score_individually_async(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]],
+    options: GeminiScoringOptions,
+    deadline: Optional[float],
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> List[Tuple[float, str]]:
+    """One request per profile; `profiles` have already missed options.cache."""
+    def task(p: Dict[str, Any]) -> Callable[[], Awaitable[Tuple[float, str]]]:
+        return lambda: compute_social_score_gemini_async(
+            p,
+            client,
+            model_name,
+            rag_index=rag_index,
+            rate_limiter=options.rate_limiter,
+            cache=options.cache,
+            breaker=options.breaker,
+            rule_keywords=rule_keywords,
+            cache_checked=True,
+        )
+
+    outcomes = await _run_gemini_tasks_async([task(p) for p in profiles], options, deadline)
+    return [
+        value if status == "ok" else _fallback_for_outcome(p, status, value, rule_keywords)
+        for p, (status, value) in zip(profiles, outcomes)
+    ]
+
+
+async def _score_in_batches_async(
+    pending: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]],
+    options: GeminiScoringOptions,
+    deadline: Optional[float],
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Dict[str, Tuple[float, str]]:
+    """options.batch_size profiles per request; `pending` have already missed options.cache."""
+    found: Dict[str, Tuple[float, str]] = {}
+    k = options.batch_size
+    batches = [pending[i: i + k] for i in range(0, len(pending), k)]
+
+    def task(batch: List[Dict[str, Any]]) -> Callable[[], Awaitable[Dict[str, Tuple[float, str]]]]:
+        return lambda: compute_social_scores_gemini_batch_async(
+            batch,
+            client,
+            model_name,
+            rag_index=rag_index,
+            rate_limiter=options.rate_limiter,
+            cache=options.cache,
+            breaker=options.breaker,
+        )
+
+    outcomes = await _run_gemini_tasks_async([task(b) for b in batches], options, deadline)
+    for status, batch_scores in outcomes:
+        if status == "ok":
+            found.update(batch_scores)
+
+    # Re-issue profiles a batch left out one by one; past the deadline nothing
+    # is sent and they get the rule-based fallback.
+    missing = [p for p in pending if p["name"] not in found]
+    results = await _score_individually_async(
+        missing, client, model_name, rag_index, options, deadline, rule_keywords
+    )
+    for p, result in zip(missing, results):
+        found[p["name"]] = result
+    return found
+
+
+async def compute_social_scores_gemini_async(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Dict[str, Tuple[float, str]]:
+    """
+    Score every profile with Gemini, falling back to the rule-based scorer
+    (with `rule_keywords`) for any profile whose request fails, misses the
+    deadline, is refused by the circuit breaker, or whose answer cannot be
+    parsed.
+
+    Up to options.max_concurrency requests are in flight at once; with
+    options.batch_size > 1 profiles are packed K per prompt. Results are
+    always returned in input order.
+    """
+    options = options or GeminiScoringOptions()
+    deadline = None
+    if options.deadline_seconds is not None:
+        deadline = time.monotonic() + float(options.deadline_seconds)
+
+    # Every profile is looked up in the cache exactly once, here; hedges and
+    # re-issued batch leftovers only write to it.
+    if options.cache is not None:
+        found, pending = await asyncio.to_thread(
+            _split_cached, profiles, rag_index, model_name, options.cache
+        )
+    else:
+        found, pending = {}, list(profiles)
+
+    if options.batch_size > 1:
+        batch_scores = await _score_in_batches_async(
+            pending, client, model_name, rag_index, options, deadline, rule_keywords
+        )
+        found.update(batch_scores)
+    else:
+        results = await _score_individually_async(
+            pending, client, model_name, rag_index, options, deadline, rule_keywords
         )
-        return fallback_score, fallback_reason
+        found.update((p["name"], result) for p, result in zip(pending, results))
+    return {p["name"]: found[p["name"]] for p in profiles}
+
+
+# Worker threads of the _run_sync() loop: cache access, and every Gemini
+# request of blocking callers (up to max_concurrency each, plus hedges).
+_SYNC_LOOP_THREADS = 32
+
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_thread: Optional[threading.Thread] = None
+_sync_loop_pid: Optional[int] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """The background loop for _run_sync(), started on first use (and again after a fork)."""
+    global _sync_loop, _sync_loop_thread, _sync_loop_pid
+    with _sync_loop_lock:
+        if _sync_loop is None or _sync_loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=_SYNC_LOOP_THREADS, thread_name_prefix="gemini")
+            )
+            thread = threading.Thread(
+                target=loop.run_forever, name="gemini-sync-loop", daemon=True
+            )
+            thread.start()
+            _sync_loop, _sync_loop_thread, _sync_loop_pid = loop, thread, os.getpid()
+        return _sync_loop
+
+
+async def _as_blocking_caller(coro: Awaitable[T]) -> T:
+    _BLOCKING_CALLER.set(True)
+    return await coro
+
+
+def _run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run an async scoring coroutine to completion from blocking code, on the
+    shared background event loop. Works whether or not the calling thread
+    already runs a loop of its own; only that background loop's thread may
+    not call it.
+    """
+    loop = _get_sync_loop()
+    if threading.current_thread() is _sync_loop_thread:
+        raise RuntimeError("_run_sync() called from the Gemini background loop")
+    future = asyncio.run_coroutine_threadsafe(_as_blocking_caller(coro), loop)
+    try:
+        return future.result()
+    except BaseException:
+        # Interrupted caller: don't leave the coroutine running on the loop.
+        future.cancel()
+        raise
+
+
+def compute_social_score_gemini(
+    profile: Dict[str, Any],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    cache: Optional[SocialScoreCache] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Tuple[float, str]:
+    return _run_sync(
+        compute_social_score_gemini_async(
+            profile, client, model_name, rag_index, rate_limiter, cache, breaker, rule_keywords
+        )
+    )
+
+
+def compute_social_scores_gemini_batch(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    cache: Optional[SocialScoreCache] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Dict[str, Tuple[float, str]]:
+    return _run_sync(
+        compute_social_scores_gemini_batch_async(
+            profiles, client, model_name, rag_index, rate_limiter, cache, breaker
+        )
+    )
 
 
 def compute_social_scores_gemini(
     profiles: List[Dict[str, Any]],
     client: "genai.Client",
     model_name: str,
-    rag_index: Optional[Dict[str, List[str]]] = None,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
 ) -> Dict[str, Tuple[float, str]]:
-    scores: Dict[str, Tuple[float, str]] = {}
-    for p in profiles:
-        score, reason = compute_social_score_gemini(p, client, model_name, rag_index=rag_index)
-        scores[p["name"]] = (score, reason)
-    return scores
+    """Blocking compute_social_scores_gemini_async()."""
+    return _run_sync(
+        compute_social_scores_gemini_async(
+            profiles, client, model_name, rag_index=rag_index, options=options,
+            rule_keywords=rule_keywords,
+        )
+    )
+
+
+# ---------- Tiered scoring: rules first, LLM only where it matters ----------
+
+@dataclass
+class TieringOptions:
+    """
+    confidence_threshold: profiles whose rule_based_confidence() is below this
+        are escalated to Gemini.
+    flip_top_k: also escalate profiles among the top K (by rule-based final
+        score) whose position could flip with a neighbour if Gemini moved their
+        social scores; None checks the whole ranking.
+    """
+
+    confidence_threshold: float = 0.6
+    flip_top_k: Optional[int] = 10
+
+    @classmethod
+    def from_config(cls, tiering_cfg: Dict[str, Any]) -> "TieringOptions":
+        return cls(
+            confidence_threshold=float(tiering_cfg.get("confidence_threshold", 0.6)),
+            flip_top_k=tiering_cfg.get("flip_top_k", 10),
+        )
+
+
+async def compute_social_scores_tiered_async(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    weight_social: float = 0.7,
+    weight_money: float = 0.3,
+    tiering: Optional[TieringOptions] = None,
+    options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Tuple[SocialScores, Dict[str, str]]:
+    """
+    Score everyone with the rule engine, then re-score with Gemini only:
+      - profiles in the ambiguous band (low rule-based confidence), and
+      - profiles whose rank could flip with a neighbour, given the weights
+        and how far Gemini could plausibly move each social score
+        (1 - confidence).
+
+    Returns ({name: (score, reason)}, {name: "rule-based" | "gemini"}).
+    """
+    escalated, rule_scores = await asyncio.to_thread(
+        _tiering_plan, profiles, weight_social, weight_money, tiering, rule_keywords
+    )
+    llm_scores = (
+        await compute_social_scores_gemini_async(
+            escalated, client, model_name, rag_index=rag_index, options=options,
+            rule_keywords=rule_keywords,
+        )
+        if escalated
+        else {}
+    )
+    return _merge_tiered_scores(profiles, rule_scores, llm_scores)
+
+
+def compute_social_scores_tiered(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    model_name: str,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    weight_social: float = 0.7,
+    weight_money: float = 0.3,
+    tiering: Optional[TieringOptions] = None,
+    options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Tuple[SocialScores, Dict[str, str]]:
+    """Blocking compute_social_scores_tiered_async()."""
+    return _run_sync(
+        compute_social_scores_tiered_async(
+            profiles, client, model_name, rag_index, weight_social, weight_money, tiering,
+            options, rule_keywords,
+        )
+    )
 
 
-# ---------- Public API: rank_profiles ----------
+def _tiering_plan(
+    profiles: List[Dict[str, Any]],
+    weight_social: float,
+    weight_money: float,
+    tiering: Optional[TieringOptions],
+    keywords: Optional[RuleKeywords] = None,
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """(profiles to escalate to Gemini, rule-based score of every profile)"""
+    tiering = tiering or TieringOptions()
+    n = len(profiles)
+
+    breakdowns = [rule_based_breakdown(p, keywords) for p in profiles]
+    rule_scores = np.fromiter((b["score"] for b in breakdowns), dtype=np.float64, count=n)
+    confidence = np.fromiter(
+        (rule_based_confidence(b) for b in breakdowns), dtype=np.float64, count=n
+    )
+    escalate = confidence < tiering.confidence_threshold
+
+    bids = np.fromiter((p["max_bid"] for p in profiles), dtype=np.float64, count=n)
+    final = weight_social * rule_scores + weight_money * compute_money_scores_array(bids)
+    slack = weight_social * (1.0 - confidence)
+
+    order = np.argsort(-final, kind="stable")
+    if tiering.flip_top_k is not None:
+        order = order[: int(tiering.flip_top_k) + 1]
+    if len(order) > 1:
+        gaps = final[order[:-1]] - final[order[1:]]
+        could_flip = gaps < slack[order[:-1]] + slack[order[1:]]
+        escalate[order[:-1][could_flip]] = True
+        escalate[order[1:][could_flip]] = True
+
+    return [profiles[i] for i in np.flatnonzero(escalate)], rule_scores
+
+
+def _merge_tiered_scores(
+    profiles: List[Dict[str, Any]],
+    rule_scores: np.ndarray,
+    llm_scores: Dict[str, Tuple[float, str]],
+) -> Tuple[SocialScores, Dict[str, str]]:
+    scores: SocialScores = {}
+    tiers: Dict[str, str] = {}
+    for p, rule_score in zip(profiles, rule_scores):
+        name = p["name"]
+        if name in llm_scores:
+            scores[name] = llm_scores[name]
+            tiers[name] = "gemini"
+        else:
+            scores[name] = (
+                float(rule_score),
+                "Rule-based (confident): profession + keywords + donation amount.",
+            )
+            tiers[name] = "rule-based"
+    return scores, tiers
+
+
+# ---------- Columnar ranking ----------
+
+class RankingView(Sequence[Dict[str, Any]]):
+    """
+    Read-only, best-first view over columnar ranking data.
+
+    Row dicts have the same shape rank_profiles() always returned, but are
+    only built (and then cached) for the positions a caller actually reads.
+    """
+
+    def __init__(
+        self,
+        order: np.ndarray,
+        names: Sequence[str],
+        money_scores: np.ndarray,
+        social_scores: np.ndarray,
+        final_scores: np.ndarray,
+        social_reasons: Sequence[str],
+        profiles: Optional[Sequence[Profile]],
+        bids: np.ndarray,
+        social_tiers: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.order = order
+        self.names = names
+        self.money_scores = money_scores
+        self.social_scores = social_scores
+        self.final_scores = final_scores
+        self.social_reasons = social_reasons
+        self.profiles = profiles
+        self.bids = bids
+        self.social_tiers = social_tiers
+        self._rows: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @overload
+    def __getitem__(self, idx: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("ranking index out of range")
+        row = self._rows.get(idx)
+        if row is None:
+            row = self._build_row(int(self.order[idx]))
+            self._rows[idx] = row
+        return row
+
+    def _build_row(self, i: int) -> Dict[str, Any]:
+        if self.profiles is not None:
+            profile = self.profiles[i]
+        else:
+            profile = {"name": self.names[i], "max_bid": float(self.bids[i])}
+        row = {
+            "name": self.names[i],
+            "money_score": round(float(self.money_scores[i]), 3),
+            "social_score": round(float(self.social_scores[i]), 3),
+            "final_score": round(float(self.final_scores[i]), 3),
+            "social_reason": self.social_reasons[i],
+            "profile": profile,
+        }
+        if self.social_tiers is not None:
+            row["social_tier"] = self.social_tiers[i]
+        return row
+
+    def positions(self) -> np.ndarray:
+        """Inverse of `order`: positions()[i] is the rank (0 = best) of input row i."""
+        pos = np.empty_like(self.order)
+        pos[self.order] = np.arange(len(self.order))
+        return pos
+
+
+def rank_columns(
+    names: Sequence[str],
+    bids: Union[Sequence[float], np.ndarray],
+    social_scores: Union[Sequence[float], np.ndarray],
+    social_reasons: Sequence[str],
+    social_mode: str,
+    profiles: Optional[Sequence[Profile]] = None,
+    weight_social: float = 0.7,
+    weight_money: float = 0.3,
+    social_tiers: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Vectorized ranking over parallel columns (row i of every column is one bidder).
+
+    Money scores and final scores are computed in one NumPy pass and ordered
+    with a single stable argsort on the rounded final score, so ties keep input
+    order exactly like rank_profiles() always did. `ranking` is a RankingView;
+    when `social_tiers` is given each row also carries "social_tier".
+
+    Returns the same {"ranking", "winner", "social_mode"} contract as rank_profiles().
+    """
+    if len(names) == 0:
+        raise ValueError("No profiles provided")
+
+    bids_arr = np.asarray(bids, dtype=np.float64)
+    social_arr = np.clip(np.asarray(social_scores, dtype=np.float64), 0.0, 1.0)
+
+    money_arr = compute_money_scores_array(bids_arr)
+    final_arr = weight_social * social_arr + weight_money * money_arr
+    order = np.argsort(-np.round(final_arr, 3), kind="stable")
+
+    ranking = RankingView(
+        order=order,
+        names=names,
+        money_scores=money_arr,
+        social_scores=social_arr,
+        final_scores=final_arr,
+        social_reasons=social_reasons,
+        profiles=profiles,
+        bids=bids_arr,
+        social_tiers=social_tiers,
+    )
+
+    return {
+        "ranking": ranking,
+        "winner": ranking[0],
+        "social_mode": social_mode,
+    }
+
+
+# ---------- Public API: compute_social_scores + rank_profiles ----------
+
+def compute_social_scores(
+    profiles: List[Dict[str, Any]],
+    use_gemini: bool = True,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    model_name: str = "gemini-2.5-flash",
+    gemini_options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Tuple[SocialScores, str]:
+    """
+    Score the social impact of every profile once.
+
+    Returns ({name: (social_score, reason)}, social_mode). Social scores only
+    depend on the profile text (and RAG context), never on bids, so callers
+    that re-rank the same bidders can compute this once and reuse it.
+    `rule_keywords` (see rule_keywords_from_config()) drives rule-based
+    scoring and fallbacks; None uses the built-in lists.
+    """
+    client = get_gemini_client() if use_gemini else None
+    if client is not None:
+        scores = compute_social_scores_gemini(
+            profiles, client, model_name, rag_index=rag_index, options=gemini_options,
+            rule_keywords=rule_keywords,
+        )
+        return scores, "gemini"
+    return compute_social_scores_rule_based(profiles, rule_keywords), "rule-based"
+
+
+async def compute_social_scores_async(
+    profiles: List[Dict[str, Any]],
+    use_gemini: bool = True,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    model_name: str = "gemini-2.5-flash",
+    gemini_options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Tuple[SocialScores, str]:
+    """Awaitable compute_social_scores(); rule-based scoring runs in a worker thread."""
+    client = get_gemini_client() if use_gemini else None
+    if client is not None:
+        scores = await compute_social_scores_gemini_async(
+            profiles, client, model_name, rag_index=rag_index, options=gemini_options,
+            rule_keywords=rule_keywords,
+        )
+        return scores, "gemini"
+    scores = await asyncio.to_thread(compute_social_scores_rule_based, profiles, rule_keywords)
+    return scores, "rule-based"
+
+
+async def _llm_scores_for_ranking_async(
+    profiles: List[Dict[str, Any]],
+    client: "genai.Client",
+    rag_index: Optional[Mapping[str, List[str]]],
+    weight_social: float,
+    weight_money: float,
+    model_name: str,
+    gemini_options: Optional[GeminiScoringOptions],
+    tiering: Optional[TieringOptions],
+    rule_keywords: Optional[RuleKeywords],
+) -> Tuple[SocialScores, str, Optional[Dict[str, str]]]:
+    """(scores, social_mode, tiers) for rank_profiles*() when a Gemini client is available."""
+    if tiering is not None:
+        scores, tiers = await compute_social_scores_tiered_async(
+            profiles,
+            client,
+            model_name,
+            rag_index=rag_index,
+            weight_social=weight_social,
+            weight_money=weight_money,
+            tiering=tiering,
+            options=gemini_options,
+            rule_keywords=rule_keywords,
+        )
+        return scores, "tiered", tiers
+    scores = await compute_social_scores_gemini_async(
+        profiles, client, model_name, rag_index=rag_index, options=gemini_options,
+        rule_keywords=rule_keywords,
+    )
+    return scores, "gemini", None
+
 
 def rank_profiles(
     profiles: List[Dict[str, Any]],
     use_gemini: bool = True,
-    rag_index: Optional[Dict[str, List[str]]] = None,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
     weight_social: float = 0.7,
     weight_money: float = 0.3,
     model_name: str = "gemini-2.5-flash",
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+    gemini_options: Optional[GeminiScoringOptions] = None,
+    tiering: Optional[TieringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
 ) -> Dict[str, Any]:
     """
     Core scoring API.
 
     Args:
         profiles: list of profiles; each must have 'name' and 'max_bid'.
-        use_gemini: if True and gemini_client is available, use Gemini; otherwise rule-based.
-        rag_index: optional {name: [doc1, doc2, ...]} to provide persona/context to Gemini.
+        use_gemini: if True and get_gemini_client() is available, use Gemini; otherwise rule-based.
+        rag_index: optional RagIndex (or plain {name: [doc1, ...]}) giving Gemini persona context.
         weight_social: weight for social_score in final_score.
         weight_money: weight for money_score in final_score.
         model_name: Gemini model name to use.
+        social_scores: optional precomputed {name: (score, reason)} from
+            compute_social_scores(); when given, no social scoring is done.
+        social_mode: mode label to report alongside precomputed social_scores.
+        gemini_options: concurrency / rate limiting for Gemini scoring.
+        tiering: if given (and Gemini is used), score with rules first and only
+            escalate uncertain / rank-deciding profiles to Gemini.
+        rule_keywords: keyword lists for rule-based scoring and fallbacks
+            (rule_keywords_from_config()); None uses the built-in lists.
 
     Returns:
         {
-          "ranking": [ ... ],
+          "ranking": RankingView (sequence of row dicts, best first),
           "winner": {...},
-          "social_mode": "gemini" | "rule-based",
+          "social_mode": "gemini" | "rule-based" | "tiered",
+          "tier_counts": {"rule-based": n, "gemini": m},  # tiered mode only
         }
     """
     if not profiles:
         raise ValueError("No profiles provided")
 
-    money_scores = compute_money_scores(profiles)
+    tiers: Optional[Dict[str, str]] = None
+    client = get_gemini_client() if use_gemini else None
+    if social_scores is None and client is not None:
+        social_scores, social_mode, tiers = _run_sync(
+            _llm_scores_for_ranking_async(
+                profiles, client, rag_index, weight_social, weight_money,
+                model_name, gemini_options, tiering, rule_keywords,
+            )
+        )
+    elif social_scores is None:
+        social_scores = compute_social_scores_rule_based(profiles, rule_keywords)
+        social_mode = "rule-based"
+    elif social_mode is None:
+        social_mode = "gemini" if client is not None else "rule-based"
+
+    return _rank_scored_profiles(
+        profiles, social_scores, social_mode, tiers, weight_social, weight_money
+    )
+
+
+async def rank_profiles_async(
+    profiles: List[Dict[str, Any]],
+    use_gemini: bool = True,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    weight_social: float = 0.7,
+    weight_money: float = 0.3,
+    model_name: str = "gemini-2.5-flash",
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+    gemini_options: Optional[GeminiScoringOptions] = None,
+    tiering: Optional[TieringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Dict[str, Any]:
+    """
+    rank_profiles() for event-loop callers: same arguments, same result.
 
-    if use_gemini and gemini_client is not None:
-        social_scores_raw = compute_social_scores_gemini(
-            profiles, gemini_client, model_name, rag_index=rag_index
+    Gemini scoring is awaited (client.aio), never blocking the loop; the
+    CPU-bound parts (rule-based scoring, ranking) run via asyncio.to_thread.
+    """
+    if not profiles:
+        raise ValueError("No profiles provided")
+
+    tiers: Optional[Dict[str, str]] = None
+    client = get_gemini_client() if use_gemini else None
+    if social_scores is None and client is not None:
+        social_scores, social_mode, tiers = await _llm_scores_for_ranking_async(
+            profiles, client, rag_index, weight_social, weight_money,
+            model_name, gemini_options, tiering, rule_keywords,
+        )
+    elif social_scores is None:
+        social_scores = await asyncio.to_thread(
+            compute_social_scores_rule_based, profiles, rule_keywords
         )
-        social_mode = "gemini"
-    else:
-        social_scores_raw = compute_social_scores_rule_based(profiles)
         social_mode = "rule-based"
+    elif social_mode is None:
+        social_mode = "gemini" if client is not None else "rule-based"
+
+    return await asyncio.to_thread(
+        _rank_scored_profiles,
+        profiles,
+        social_scores,
+        social_mode,
+        tiers,
+        weight_social,
+        weight_money,
+    )
 
-    results = []
-    for p in profiles:
-        name = p["name"]
-        money_score = money_scores[name]
-        social_score, reason = social_scores_raw[name]
-
-        final_score = weight_social * social_score + weight_money * money_score
-
-        results.append(
-            {
-                "name": name,
-                "money_score": round(money_score, 3),
-                "social_score": round(social_score, 3),
-                "final_score": round(final_score, 3),
-                "social_reason": reason,
-                "profile": p,
-            }
+
+def _rank_scored_profiles(
+    profiles: List[Dict[str, Any]],
+    social_scores: SocialScores,
+    social_mode: str,
+    tiers: Optional[Dict[str, str]],
+    weight_social: float,
+    weight_money: float,
+) -> Dict[str, Any]:
+    n = len(profiles)
+    names = [p["name"] for p in profiles]
+    bids = np.fromiter((p["max_bid"] for p in profiles), dtype=np.float64, count=n)
+    social = np.fromiter((social_scores[name][0] for name in names), dtype=np.float64, count=n)
+    reasons = [social_scores[name][1] for name in names]
+
+    result = rank_columns(
+        names,
+        bids,
+        social,
+        reasons,
+        social_mode,
+        profiles=profiles,
+        weight_social=weight_social,
+        weight_money=weight_money,
+        social_tiers=[tiers[name] for name in names] if tiers is not None else None,
+    )
+    if tiers is not None:
+        tier_list = list(tiers.values())
+        result["tier_counts"] = {
+            "rule-based": tier_list.count("rule-based"),
+            "gemini": tier_list.count("gemini"),
+        }
+    return result
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+async def rank_auctions_async(
+    auctions: List[List[Dict[str, Any]]],
+    use_gemini: bool = True,
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    weight_social: float = 0.7,
+    weight_money: float = 0.3,
+    model_name: str = "gemini-2.5-flash",
+    gemini_options: Optional[GeminiScoringOptions] = None,
+    rule_keywords: Optional[RuleKeywords] = None,
+) -> Dict[str, Any]:
+    """
+    Rank many auctions at once, social-scoring every distinct profile once.
+
+    Two profiles are the same donor when everything that feeds the social
+    prompt matches (social_score_cache_key; bids may differ per auction).
+    Scoring is one compute_social_scores_async() pass over the distinct
+    profiles; the auctions are then ranked concurrently in worker threads.
+
+    Returns {
+      "results": [rank_profiles() result + "rank_seconds", ...] (input order),
+      "profiles_total": int, "profiles_distinct": int,
+      "timings": {"dedupe_seconds", "scoring_seconds", "ranking_seconds", "total_seconds"},
+    }
+    """
+    t0 = time.perf_counter()
+    if any(not profiles for profiles in auctions):
+        raise ValueError("No profiles provided")
+
+    keys = [[social_score_cache_key(p, "", model_name) for p in profiles] for profiles in auctions]
+    distinct: Dict[str, Dict[str, Any]] = {}
+    for profiles, auction_keys in zip(auctions, keys):
+        for p, key in zip(profiles, auction_keys):
+            distinct.setdefault(key, p)
+
+    # Scores come back keyed by name, so different donors sharing a name are
+    # scored in separate passes ("layers"); normally there is just one.
+    layers: List[Dict[str, str]] = []
+    for key, p in distinct.items():
+        for layer in layers:
+            if p["name"] not in layer:
+                layer[p["name"]] = key
+                break
+        else:
+            layers.append({p["name"]: key})
+    t_dedupe = time.perf_counter()
+
+    scored = await asyncio.gather(
+        *(
+            compute_social_scores_async(
+                [distinct[key] for key in layer.values()],
+                use_gemini=use_gemini,
+                rag_index=rag_index,
+                model_name=model_name,
+                gemini_options=gemini_options,
+                rule_keywords=rule_keywords,
+            )
+            for layer in layers
+        )
+    )
+    by_key: Dict[str, Tuple[float, str]] = {}
+    social_mode = "rule-based"
+    for layer, (scores, social_mode) in zip(layers, scored):
+        for name, key in layer.items():
+            by_key[key] = scores[name]
+    t_scoring = time.perf_counter()
+
+    async def rank_one(profiles: List[Dict[str, Any]], auction_keys: List[str]) -> Dict[str, Any]:
+        social = {p["name"]: by_key[key] for p, key in zip(profiles, auction_keys)}
+        result, seconds = await asyncio.to_thread(
+            _timed,
+            _rank_scored_profiles,
+            profiles,
+            social,
+            social_mode,
+            None,
+            weight_social,
+            weight_money,
         )
+        result["rank_seconds"] = seconds
+        return result
 
-    results_sorted = sorted(results, key=lambda x: -x["final_score"])
-    winner = results_sorted[0]
+    results = await asyncio.gather(*(rank_one(p, k) for p, k in zip(auctions, keys)))
+    t_end = time.perf_counter()
 
     return {
-        "ranking": results_sorted,
-        "winner": winner,
-        "social_mode": social_mode,
+        "results": list(results),
+        "profiles_total": sum(len(profiles) for profiles in auctions),
+        "profiles_distinct": len(distinct),
+        "timings": {
+            "dedupe_seconds": t_dedupe - t0,
+            "scoring_seconds": t_scoring - t_dedupe,
+            "ranking_seconds": t_end - t_scoring,
+            "total_seconds": t_end - t0,
+        },
     }
 
 
@@ -322,7 +1661,7 @@ if __name__ == "__main__":
         },
     ]
 
-    use_gemini_flag = bool(gemini_client)
+    use_gemini_flag = get_gemini_client() is not None
     result = rank_profiles(
         demo_profiles,
         use_gemini=use_gemini_flag,
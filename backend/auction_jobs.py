@@ -0,0 +1,658 @@
+# auction_jobs.py
+#
+# Background jobs for auctions that outlive an HTTP request (a Gemini-scored
+# multi-round auction can take minutes). submit() returns a job id at once;
+# a JobRunner claims queued jobs by priority and runs them on a pool of
+# worker processes; status, progress and results are read back from the
+# queue backend (polled, or streamed by the API).
+#
+# config["jobs"]:
+#   "backend": "memory"   in-process job table, lost on restart (default)
+#              "sqlite"   jobs table in "sqlite_path"; survives restarts, and
+#                         jobs that were running when the runner died are
+#                         queued again on start
+#   "workers": 2          worker processes = jobs running at once
+#   "max_pending": 1000   submissions beyond this many queued jobs are refused
+#   "finished_ttl_seconds": 3600
+#                         finished jobs (and their results) are dropped this
+#                         long after they end; null keeps them
+#   "max_finished": 1000  at most this many finished jobs are kept (newest)
+#
+# Both backends prune finished jobs on submit, so the job table stays
+# bounded by max_pending + running + max_finished.
+#
+#   python auction_jobs.py --config auction_config.json --priority 5
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import heapq
+import itertools
+import json
+import multiprocessing
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from auction_core import GeminiScoringOptions, TieringOptions, rank_profiles, rule_keywords_from_config
+from multi_round_auction import AuctionRoundResult, load_config, stream_multi_round_auction
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+TERMINAL_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+KIND_RANK = "rank"  # payload: profiles, use_gemini, tiered, gemini (config section)
+KIND_MULTI_ROUND = "multi_round"  # payload: config (full auction config)
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by submit() when max_pending jobs are already queued."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker to stop a job whose cancellation was requested."""
+
+
+@dataclass
+class AuctionJob:
+    job_id: str
+    kind: str
+    payload: Dict[str, Any]
+    priority: int = 0
+    status: str = JOB_QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "priority": self.priority,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+# ---------- Queue backends ----------
+
+class JobQueue(Protocol):
+    def submit(self, job: AuctionJob) -> None: ...
+
+    def claim(self) -> Optional[AuctionJob]:
+        """Mark the highest-priority queued job (oldest first) running and return it."""
+        ...
+
+    def get(self, job_id: str) -> Optional[AuctionJob]: ...
+
+    def update(self, job_id: str, **fields: Any) -> None: ...
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        """Cancel a queued job, or flag a running one; returns its status (None if unknown)."""
+        ...
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[AuctionJob]: ...
+
+    def prune(self) -> int:
+        """Drop finished jobs past finished_ttl_seconds / beyond max_finished; returns how many."""
+        ...
+
+
+class InMemoryJobQueue:
+    """Job table + priority heap in this process. Thread-safe."""
+
+    def __init__(
+        self,
+        max_pending: Optional[int] = None,
+        finished_ttl_seconds: Optional[float] = None,
+        max_finished: Optional[int] = None,
+    ) -> None:
+        self.max_pending = max_pending
+        self.finished_ttl_seconds = finished_ttl_seconds
+        self.max_finished = max_finished
+        self._jobs: Dict[str, AuctionJob] = {}
+        # Finished job ids in the order they finished (for eviction).
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._heap: List[Tuple[int, int, str]] = []  # (-priority, seq, job_id)
+        self._seq = itertools.count()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def submit(self, job: AuctionJob) -> None:
+        with self._lock:
+            self._prune_locked()
+            if self.max_pending is not None and self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} jobs already queued")
+            self._jobs[job.job_id] = replace(job)
+            heapq.heappush(self._heap, (-job.priority, next(self._seq), job.job_id))
+            self._pending += 1
+
+    def claim(self) -> Optional[AuctionJob]:
+        with self._lock:
+            while self._heap:
+                _, _, job_id = heapq.heappop(self._heap)
+                job = self._jobs[job_id]
+                if job.status != JOB_QUEUED:
+                    continue  # cancelled while queued
+                self._pending -= 1
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                return replace(job)
+            return None
+
+    def get(self, job_id: str) -> Optional[AuctionJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job is not None else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return  # already evicted
+            for key, value in fields.items():
+                setattr(job, key, value)
+            if job.done:
+                self._finished[job_id] = job.finished_at or time.time()
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status == JOB_QUEUED:
+                job.status = JOB_CANCELLED
+                job.finished_at = time.time()
+                self._pending -= 1
+                self._finished[job_id] = job.finished_at
+            elif job.status == JOB_RUNNING:
+                job.cancel_requested = True
+            return job.status
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[AuctionJob]:
+        with self._lock:
+            jobs = [j for j in self._jobs.values() if status is None or j.status == status]
+        jobs.sort(key=lambda j: j.submitted_at, reverse=True)
+        return [replace(j) for j in jobs[:limit]]
+
+    def prune(self) -> int:
+        with self._lock:
+            return self._prune_locked()
+
+    def _prune_locked(self) -> int:
+        cutoff = None if self.finished_ttl_seconds is None else time.time() - self.finished_ttl_seconds
+        evicted = 0
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            expired = cutoff is not None and finished_at < cutoff
+            if not expired and (self.max_finished is None or len(self._finished) <= self.max_finished):
+                break
+            del self._finished[job_id]
+            del self._jobs[job_id]
+            evicted += 1
+        return evicted
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id           TEXT PRIMARY KEY,
+    kind             TEXT NOT NULL,
+    payload          TEXT NOT NULL,
+    priority         INTEGER NOT NULL,
+    status           TEXT NOT NULL,
+    submitted_at     REAL NOT NULL,
+    started_at       REAL,
+    finished_at      REAL,
+    progress         TEXT NOT NULL,
+    result           TEXT,
+    error            TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, priority DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at);
+"""
+
+_JSON_COLUMNS = ("payload", "progress", "result")
+
+
+class SQLiteJobQueue:
+    """
+    Jobs table in SQLite (WAL). Claiming is a single UPDATE ... RETURNING, so
+    several processes may submit to and read from one file; it should have
+    one JobRunner, since that runner re-queues "running" jobs when it starts.
+    """
+
+    def __init__(
+        self,
+        path: str = "auction_jobs.sqlite3",
+        max_pending: Optional[int] = None,
+        requeue_running: bool = True,
+        finished_ttl_seconds: Optional[float] = None,
+        max_finished: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self.max_pending = max_pending
+        self.finished_ttl_seconds = finished_ttl_seconds
+        self.max_finished = max_finished
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        if requeue_running:
+            with self._lock, self._db:
+                self._db.execute(
+                    "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?",
+                    (JOB_QUEUED, JOB_RUNNING),
+                )
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> AuctionJob:
+        data = dict(row)
+        for column in _JSON_COLUMNS:
+            if data[column] is not None:
+                data[column] = json.loads(data[column])
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        return AuctionJob(**data)
+
+    def submit(self, job: AuctionJob) -> None:
+        with self._lock, self._db:
+            self._prune_locked()
+            if self.max_pending is not None:
+                (pending,) = self._db.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = ?", (JOB_QUEUED,)
+                ).fetchone()
+                if pending >= self.max_pending:
+                    raise JobQueueFull(f"{pending} jobs already queued")
+            self._db.execute(
+                "INSERT INTO jobs (job_id, kind, payload, priority, status, submitted_at, progress) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.job_id,
+                    job.kind,
+                    json.dumps(job.payload),
+                    job.priority,
+                    job.status,
+                    job.submitted_at,
+                    json.dumps(job.progress),
+                ),
+            )
+
+    def claim(self) -> Optional[AuctionJob]:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE job_id = ("
+                "  SELECT job_id FROM jobs WHERE status = ? ORDER BY priority DESC, rowid LIMIT 1"
+                ") RETURNING *",
+                (JOB_RUNNING, time.time(), JOB_QUEUED),
+            ).fetchone()
+        return self._job(row) if row is not None else None
+
+    def get(self, job_id: str) -> Optional[AuctionJob]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job(row) if row is not None else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        columns = []
+        values: List[Any] = []
+        for key, value in fields.items():
+            if key in _JSON_COLUMNS and value is not None:
+                value = json.dumps(value)
+            columns.append(f"{key} = ?")
+            values.append(value)
+        with self._lock, self._db:
+            self._db.execute(f"UPDATE jobs SET {', '.join(columns)} WHERE job_id = ?", (*values, job_id))
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE job_id = ? AND status = ?",
+                (JOB_CANCELLED, time.time(), job_id, JOB_QUEUED),
+            )
+            self._db.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = ?",
+                (job_id, JOB_RUNNING),
+            )
+            row = self._db.execute("SELECT status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return row["status"] if row is not None else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[AuctionJob]:
+        query = "SELECT * FROM jobs"
+        params: Tuple[Any, ...] = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY submitted_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._db.execute(query, (*params, limit)).fetchall()
+        return [self._job(row) for row in rows]
+
+    def prune(self) -> int:
+        with self._lock, self._db:
+            return self._prune_locked()
+
+    def _prune_locked(self) -> int:
+        # Finished jobs are exactly those with finished_at set.
+        evicted = 0
+        if self.finished_ttl_seconds is not None:
+            evicted += self._db.execute(
+                "DELETE FROM jobs WHERE finished_at < ?",
+                (time.time() - self.finished_ttl_seconds,),
+            ).rowcount
+        if self.max_finished is not None:
+            evicted += self._db.execute(
+                "DELETE FROM jobs WHERE job_id IN ("
+                "  SELECT job_id FROM jobs WHERE finished_at IS NOT NULL"
+                "  ORDER BY finished_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_finished,),
+            ).rowcount
+        return evicted
+
+
+def make_job_queue(jobs_cfg: Dict[str, Any]) -> JobQueue:
+    backend = jobs_cfg.get("backend", "memory")
+    retention = {
+        "max_pending": jobs_cfg.get("max_pending"),
+        "finished_ttl_seconds": jobs_cfg.get("finished_ttl_seconds", 3600),
+        "max_finished": jobs_cfg.get("max_finished", 1000),
+    }
+    if backend == "memory":
+        return InMemoryJobQueue(**retention)
+    if backend == "sqlite":
+        return SQLiteJobQueue(jobs_cfg.get("sqlite_path", "auction_jobs.sqlite3"), **retention)
+    raise ValueError(f"Unknown jobs backend: {backend!r} (expected 'memory' or 'sqlite')")
+
+
+# ---------- Worker side (runs in the pool processes) ----------
+
+# GeminiScoringOptions per gemini config, built once per worker process so
+# its rate limiter and cache connection are reused across jobs.
+_worker_options: Dict[str, GeminiScoringOptions] = {}
+
+
+def _gemini_options(gemini_cfg: Dict[str, Any]) -> GeminiScoringOptions:
+    key = json.dumps(gemini_cfg, sort_keys=True)
+    options = _worker_options.get(key)
+    if options is None:
+        options = _worker_options[key] = GeminiScoringOptions.from_config(gemini_cfg)
+    return options
+
+
+def _run_rank_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    gemini_cfg = payload.get("gemini", {})
+    result = rank_profiles(
+        payload["profiles"],
+        use_gemini=bool(payload.get("use_gemini", True)),
+        model_name=gemini_cfg.get("model", "gemini-2.5-flash"),
+        tiering=TieringOptions() if payload.get("tiered") else None,
+        gemini_options=_gemini_options(gemini_cfg),
+        rule_keywords=rule_keywords_from_config(payload.get("rule_based")),
+    )
+    return {
+        "social_mode": result["social_mode"],
+        "winner": result["winner"],
+        "ranking": list(result["ranking"]),
+        "tier_counts": result.get("tier_counts"),
+    }
+
+
+def _run_multi_round_job(job_id: str, payload: Dict[str, Any], control: Any) -> Dict[str, Any]:
+    config = payload["config"]
+    num_rounds = int(config["auction_params"]["num_rounds"])
+    rounds: List[AuctionRoundResult] = []
+
+    def sink(round_result: AuctionRoundResult) -> None:
+        rounds.append(round_result)
+        control[(job_id, "progress")] = {
+            "phase": "rounds",
+            "rounds_played": round_result.round_index,
+            "num_rounds": num_rounds,
+        }
+        if control.get((job_id, "cancel")):
+            raise JobCancelled(job_id)
+
+    control[(job_id, "progress")] = {"phase": "scoring", "rounds_played": 0, "num_rounds": num_rounds}
+    result = stream_multi_round_auction(config, sink)
+    result.rounds = rounds
+    return result.to_dict()
+
+
+def _run_job(job_id: str, kind: str, payload: Dict[str, Any], control: Any) -> Dict[str, Any]:
+    if control.get((job_id, "cancel")):
+        raise JobCancelled(job_id)
+    if kind == KIND_RANK:
+        return _run_rank_job(payload)
+    if kind == KIND_MULTI_ROUND:
+        return _run_multi_round_job(job_id, payload, control)
+    raise ValueError(f"Unknown job kind: {kind!r}")
+
+
+# ---------- Runner ----------
+
+class JobRunner:
+    """
+    Claims queued jobs (highest priority first) whenever one of `workers`
+    process slots is free and runs them there, so at most `workers` auctions
+    execute at once and API threads only ever submit and read.
+
+    Cancelling a queued job removes it; a running multi-round job stops
+    after its current round (a rank job runs to completion, its result is
+    discarded). Progress is copied into the queue every `poll_interval`.
+    """
+
+    def __init__(self, queue: JobQueue, workers: int = 2, poll_interval: float = 0.2) -> None:
+        self.queue = queue
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self._ctx = multiprocessing.get_context("spawn")
+        self._manager: Any = None
+        self._control: Any = None  # Manager dict: (job_id, "progress" | "cancel") -> value
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._running: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "JobRunner":
+        jobs_cfg = config.get("jobs", {})
+        return cls(
+            make_job_queue(jobs_cfg),
+            workers=int(jobs_cfg.get("workers", 2)),
+            poll_interval=float(jobs_cfg.get("poll_interval_seconds", 0.2)),
+        )
+
+    # --- lifecycle ---
+
+    def start(self) -> "JobRunner":
+        if self._thread is not None:
+            return self
+        self._manager = self._ctx.Manager()
+        self._control = self._manager.dict()
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._ctx)
+        self._thread = threading.Thread(target=self._dispatch_loop, name="auction-jobs", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self, cancel_running: bool = True) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join()
+        with self._lock:
+            running = list(self._running)
+        if cancel_running:
+            for job_id in running:
+                self._control[(job_id, "cancel")] = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._manager.shutdown()
+        self._thread = None
+
+    # --- client API ---
+
+    def submit(self, kind: str, payload: Dict[str, Any], priority: int = 0) -> AuctionJob:
+        job = AuctionJob(job_id=uuid.uuid4().hex, kind=kind, payload=payload, priority=priority)
+        self.queue.submit(job)
+        self._wake.set()
+        return job
+
+    def get(self, job_id: str) -> Optional[AuctionJob]:
+        return self.queue.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        status = self.queue.request_cancel(job_id)
+        if status == JOB_RUNNING and self._control is not None:
+            self._control[(job_id, "cancel")] = True
+        return status
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[AuctionJob]:
+        """Poll until the job is finished (or `timeout`); returns its latest state."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job.done:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(self.poll_interval)
+
+    # --- dispatcher ---
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopped.is_set():
+            self._sync_running()
+            while True:
+                with self._lock:
+                    if len(self._running) >= self.workers:
+                        break
+                job = self.queue.claim()
+                if job is None:
+                    break
+                self._start_job(job)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _start_job(self, job: AuctionJob) -> None:
+        if job.cancel_requested:
+            self._control[(job.job_id, "cancel")] = True
+        try:
+            future = self._executor.submit(_run_job, job.job_id, job.kind, job.payload, self._control)
+        except BrokenProcessPool:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._ctx)
+            future = self._executor.submit(_run_job, job.job_id, job.kind, job.payload, self._control)
+        with self._lock:
+            self._running[job.job_id] = future
+        future.add_done_callback(lambda f, job_id=job.job_id: self._finish(job_id, f))
+
+    def _sync_running(self) -> None:
+        """Copy worker progress into the queue; forward cancels requested through it."""
+        with self._lock:
+            running = list(self._running)
+        for job_id in running:
+            progress = self._control.get((job_id, "progress"))
+            if progress is not None:
+                self.queue.update(job_id, progress=progress)
+            job = self.queue.get(job_id)
+            if job is not None and job.cancel_requested:
+                self._control[(job_id, "cancel")] = True
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        fields: Dict[str, Any] = {"finished_at": time.time()}
+        try:
+            progress = self._control.pop((job_id, "progress"), None)
+            cancel = self._control.pop((job_id, "cancel"), False)
+        except (OSError, EOFError):  # manager already shut down
+            progress, cancel = None, False
+        if progress is not None:
+            fields["progress"] = progress
+
+        exc = None if future.cancelled() else future.exception()
+        if future.cancelled() or isinstance(exc, JobCancelled) or (cancel and exc is None):
+            fields["status"] = JOB_CANCELLED
+        elif exc is not None:
+            fields["status"] = JOB_FAILED
+            fields["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            fields["status"] = JOB_SUCCEEDED
+            fields["result"] = future.result()
+        self.queue.update(job_id, **fields)
+
+        with self._lock:
+            self._running.pop(job_id, None)
+        if isinstance(exc, BrokenProcessPool) and not self._stopped.is_set():
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._ctx)
+        self._wake.set()
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner(config: Optional[Dict[str, Any]] = None) -> JobRunner:
+    """Process-wide runner, started on first use (worker processes spawn lazily)."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner.from_config(config or load_config("auction_config.json")).start()
+            atexit.register(_runner.shutdown)
+        return _runner
+
+
+# ---------- CLI ----------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the config's multi-round auction as a background job.")
+    parser.add_argument("--config", default="auction_config.json")
+    parser.add_argument("--priority", type=int, default=0)
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    runner = JobRunner.from_config(config).start()
+    try:
+        job = runner.submit(KIND_MULTI_ROUND, {"config": config}, priority=args.priority)
+        print(f"[JOBS] submitted {job.job_id}")
+        last = None
+        while not job.done:
+            time.sleep(runner.poll_interval)
+            job = runner.get(job.job_id)
+            state = (job.status, json.dumps(job.progress, sort_keys=True))
+            if state != last:
+                print(f"[JOBS] {job.status} {job.progress}")
+                last = state
+        if job.status == JOB_SUCCEEDED:
+            fw = job.result["final_winner"]
+            print(f"Final winner: {fw['name']} (final={fw['final_score']}, bid={fw['bid']})")
+        else:
+            print(f"[JOBS] {job.status}: {job.error}")
+    finally:
+        runner.shutdown()
@@ -0,0 +1,240 @@
+# auction_result_cache.py
+#
+# Result cache + single-flight for POST /run-auction. Frontend refreshes and
+# retries send identical payloads at the same moment; they are hashed after
+# normalization (auction_request_key), concurrent duplicates share one
+# in-flight computation, and finished results stay in a bounded in-memory
+# LRU with a TTL. Each entry carries a content ETag so a client holding the
+# same result can send If-None-Match and get 304 instead of the body.
+# Degraded results (some scores fell back to the rule engine because Gemini
+# was down, slow or unconfigured) are shared with coalesced waiters but kept
+# only for `degraded_ttl_seconds` (default 0: not cached), so the next
+# request retries Gemini instead of serving fallbacks for the full TTL.
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from social_score_cache import CACHE_PROFILE_FIELDS
+
+# Request-level fields on top of CACHE_PROFILE_FIELDS: bids change the
+# ranking, so unlike the social score cache they are part of the key.
+REQUEST_PROFILE_FIELDS = CACHE_PROFILE_FIELDS + ("start_bid", "max_bid")
+
+CACHE_HIT = "HIT"
+CACHE_MISS = "MISS"
+CACHE_COALESCED = "COALESCED"  # joined an identical request already in flight
+
+
+def auction_request_key(
+    profiles: Any, use_gemini: bool, tiered: bool, model_name: str
+) -> str:
+    """
+    Content hash of everything that determines a /run-auction response:
+    canonical JSON of the profile fields (key order, formatting and extra
+    fields don't matter; bids compare as floats, so `100` == `100.0`).
+    Text is hashed as sent, since the response echoes it back. Profile
+    order is kept: it breaks ties in the ranking.
+    """
+    payload = {
+        "profiles": [
+            {
+                field: float(p.get(field) or 0.0) if field in ("start_bid", "max_bid") else str(p.get(field) or "")
+                for field in REQUEST_PROFILE_FIELDS
+            }
+            for p in profiles
+        ],
+        "use_gemini": bool(use_gemini),
+        "tiered": bool(tiered),
+        "model": model_name,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def result_etag(result: Dict[str, Any]) -> str:
+    """Strong ETag over the response body (same result -> same tag, even after recompute)."""
+    blob = json.dumps(result, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return '"' + hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match semantics: "*", or any listed tag (weak W/ prefix ignored)."""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+
+
+@dataclass
+class CachedResult:
+    result: Dict[str, Any]
+    etag: str
+    created_at: float
+    compute_seconds: float
+    ttl_seconds: Optional[float] = None
+
+
+class AuctionResultCache:
+    """
+    In-memory LRU (`max_entries`) with TTL (`ttl_seconds`) over finished
+    auction results, plus single-flight coalescing of identical requests.
+
+    get_or_compute() is used from the API's event loop; the computation runs
+    as its own task, so one caller disconnecting does not cancel it for the
+    others. Failures are handed to every waiter and never cached; results the
+    caller's `degraded` check flags live for `degraded_ttl_seconds` (0 = not
+    stored at all).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 300,
+        degraded_ttl_seconds: float = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.degraded_ttl_seconds = degraded_ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.degraded = 0
+        self.compute_seconds = 0.0
+        self.saved_compute_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, cache_cfg: Dict[str, Any]) -> Optional["AuctionResultCache"]:
+        max_entries = int(cache_cfg.get("max_entries", 1024))
+        if max_entries <= 0:
+            return None
+        return cls(
+            max_entries=max_entries,
+            ttl_seconds=cache_cfg.get("ttl_seconds", 300),
+            degraded_ttl_seconds=float(cache_cfg.get("degraded_ttl_seconds", 0)),
+        )
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Fresh entry for `key` (marked recently used), or None. Does not count as a lookup."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.ttl_seconds is not None and now - entry.created_at > entry.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        compute_seconds: float,
+        ttl_seconds: Optional[float] = None,
+    ) -> CachedResult:
+        """Store `result`; `ttl_seconds` None means the cache-wide ttl_seconds."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = CachedResult(result, result_etag(result), self._clock(), compute_seconds, ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        degraded: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Tuple[CachedResult, str]:
+        """
+        (entry, CACHE_HIT | CACHE_COALESCED | CACHE_MISS). `degraded(result)`
+        True marks a result that should not be served for the full TTL.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.saved_compute_seconds += entry.compute_seconds
+            return entry, CACHE_HIT
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            entry = await asyncio.shield(task)
+            self.saved_compute_seconds += entry.compute_seconds
+            return entry, CACHE_COALESCED
+
+        self.misses += 1
+        task = asyncio.ensure_future(self._compute(key, compute, degraded))
+        # Retrieve the exception even if every waiter has gone away.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return await asyncio.shield(task), CACHE_MISS
+
+    async def _compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        degraded: Optional[Callable[[Dict[str, Any]], bool]],
+    ) -> CachedResult:
+        try:
+            t0 = time.perf_counter()
+            result = await compute()
+            elapsed = time.perf_counter() - t0
+            self.compute_seconds += elapsed
+            if degraded is not None and degraded(result):
+                self.degraded += 1
+                if self.degraded_ttl_seconds <= 0:
+                    return CachedResult(result, result_etag(result), self._clock(), elapsed, 0)
+                return self.put(key, result, elapsed, ttl_seconds=self.degraded_ttl_seconds)
+            return self.put(key, result, elapsed)
+        finally:
+            self._inflight.pop(key, None)
+
+    def record_not_modified(self) -> None:
+        self.not_modified += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.hits + self.coalesced + self.misses
+        return {
+            "entries": len(self),
+            "inflight": len(self._inflight),
+            "requests": requests,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.coalesced) / requests, 3) if requests else 0.0,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "degraded": self.degraded,
+            "compute_seconds": round(self.compute_seconds, 4),
+            "saved_compute_seconds": round(self.saved_compute_seconds, 4),
+        }
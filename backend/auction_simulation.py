@@ -0,0 +1,258 @@
+# auction_simulation.py
+#
+# Monte Carlo mode: many seeded multi-round auction trajectories fanned out
+# over a process pool, folded into winner / clearing-bid / strategy
+# distributions as they complete.
+#
+#   python auction_simulation.py --runs 5000 --workers 4 --seed 0
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from auction_core import SocialScores
+from multi_round_auction import (
+    MultiRoundAuctionResult,
+    compute_agent_social_scores,
+    load_config,
+    prepare_agents_from_config,
+)
+from round_engine import run_multi_round_auction_vectorized
+from worker_pool import chunks, map_chunks, worker_state
+
+DEFAULT_CHUNK_SIZE = 64
+HISTOGRAM_BINS = 50
+
+
+def run_seeds(base_seed: int, num_runs: int) -> List[int]:
+    """
+    Seed for every run, derived from SeedSequence(base_seed) by run index,
+    so run i gets the same independent stream whatever the worker count.
+    """
+    root = np.random.SeedSequence(base_seed)
+    return [int(child.generate_state(1)[0]) for child in root.spawn(num_runs)]
+
+
+# ---------- Incremental aggregation ----------
+
+@dataclass
+class SimulationSummary:
+    """Running distributions over simulated auctions; never holds per-run results."""
+
+    bid_low: float
+    bid_high: float
+    runs: int = 0
+    winner_counts: Dict[str, int] = field(default_factory=dict)
+    strategy_wins: Dict[str, int] = field(default_factory=dict)
+    clearing_bid_sum: float = 0.0
+    clearing_bid_sq_sum: float = 0.0
+    clearing_bid_min: float = float("inf")
+    clearing_bid_max: float = float("-inf")
+    winner_final_score_sum: float = 0.0
+    rounds_played_sum: int = 0
+    stop_reasons: Dict[str, int] = field(default_factory=dict)
+    histogram: np.ndarray = field(default_factory=lambda: np.zeros(HISTOGRAM_BINS, dtype=np.int64))
+
+    def record(self, result: MultiRoundAuctionResult, strategy: str) -> None:
+        winner = result.final_winner
+        bid = float(winner["bid"])
+        self.runs += 1
+        self.winner_counts[winner["name"]] = self.winner_counts.get(winner["name"], 0) + 1
+        self.strategy_wins[strategy] = self.strategy_wins.get(strategy, 0) + 1
+        self.clearing_bid_sum += bid
+        self.clearing_bid_sq_sum += bid * bid
+        self.clearing_bid_min = min(self.clearing_bid_min, bid)
+        self.clearing_bid_max = max(self.clearing_bid_max, bid)
+        self.winner_final_score_sum += float(winner["final_score"])
+        self.rounds_played_sum += result.rounds_played
+        self.stop_reasons[result.stop_reason] = self.stop_reasons.get(result.stop_reason, 0) + 1
+        self.histogram[self._bin(bid)] += 1
+
+    def _bin(self, bid: float) -> int:
+        span = self.bid_high - self.bid_low
+        if span <= 0:
+            return 0
+        idx = int((bid - self.bid_low) / span * HISTOGRAM_BINS)
+        return min(max(idx, 0), HISTOGRAM_BINS - 1)
+
+    def merge(self, other: "SimulationSummary") -> None:
+        self.runs += other.runs
+        for name, count in other.winner_counts.items():
+            self.winner_counts[name] = self.winner_counts.get(name, 0) + count
+        for strategy, count in other.strategy_wins.items():
+            self.strategy_wins[strategy] = self.strategy_wins.get(strategy, 0) + count
+        self.clearing_bid_sum += other.clearing_bid_sum
+        self.clearing_bid_sq_sum += other.clearing_bid_sq_sum
+        self.clearing_bid_min = min(self.clearing_bid_min, other.clearing_bid_min)
+        self.clearing_bid_max = max(self.clearing_bid_max, other.clearing_bid_max)
+        self.winner_final_score_sum += other.winner_final_score_sum
+        self.rounds_played_sum += other.rounds_played_sum
+        for reason, count in other.stop_reasons.items():
+            self.stop_reasons[reason] = self.stop_reasons.get(reason, 0) + count
+        self.histogram += other.histogram
+
+    def clearing_bid_quantile(self, q: float) -> float:
+        """Approximate quantile, interpolated within the histogram bin."""
+        if self.runs == 0:
+            return 0.0
+        target = q * self.runs
+        cumulative = np.cumsum(self.histogram)
+        idx = int(np.searchsorted(cumulative, target, side="left"))
+        idx = min(idx, HISTOGRAM_BINS - 1)
+        before = cumulative[idx - 1] if idx else 0
+        in_bin = self.histogram[idx]
+        frac = (target - before) / in_bin if in_bin else 0.0
+        width = (self.bid_high - self.bid_low) / HISTOGRAM_BINS
+        value = self.bid_low + (idx + frac) * width
+        return float(min(max(value, self.clearing_bid_min), self.clearing_bid_max))
+
+    def to_dict(self, strategy_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        runs = max(self.runs, 1)
+        mean = self.clearing_bid_sum / runs
+        var = max(0.0, self.clearing_bid_sq_sum / runs - mean * mean)
+        strategy_rates = {}
+        for strategy, wins in sorted(self.strategy_wins.items()):
+            entry = {"wins": wins, "win_rate": round(wins / runs, 4)}
+            if strategy_counts and strategy_counts.get(strategy):
+                # Share of wins relative to how many agents play the strategy.
+                entry["win_rate_per_agent"] = round(wins / runs / strategy_counts[strategy], 4)
+            strategy_rates[strategy] = entry
+        return {
+            "runs": self.runs,
+            "winner_probabilities": {
+                name: round(count / runs, 4)
+                for name, count in sorted(self.winner_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+            },
+            "clearing_bid": {
+                "mean": round(mean, 2),
+                "std": round(var ** 0.5, 2),
+                "min": round(self.clearing_bid_min, 2) if self.runs else 0.0,
+                "p05": round(self.clearing_bid_quantile(0.05), 2),
+                "p50": round(self.clearing_bid_quantile(0.50), 2),
+                "p95": round(self.clearing_bid_quantile(0.95), 2),
+                "max": round(self.clearing_bid_max, 2) if self.runs else 0.0,
+                "histogram": {
+                    "low": self.bid_low,
+                    "high": self.bid_high,
+                    "counts": self.histogram.tolist(),
+                },
+            },
+            "expected_winner_final_score": round(self.winner_final_score_sum / runs, 4),
+            "strategy_win_rates": strategy_rates,
+            "mean_rounds_played": round(self.rounds_played_sum / runs, 3),
+            "stop_reasons": dict(sorted(self.stop_reasons.items())),
+        }
+
+
+# ---------- Workers ----------
+
+def _worker_setup(
+    config: Dict[str, Any], social_scores: SocialScores, social_mode: str
+) -> Dict[str, Any]:
+    agents = prepare_agents_from_config(config)
+    return dict(
+        config=config,
+        social_scores=social_scores,
+        social_mode=social_mode,
+        strategy_by_name={agent.name: agent.strategy for agent in agents},
+        bid_range=_bid_range(agents),
+    )
+
+
+def _bid_range(agents: Iterable[Any]) -> Tuple[float, float]:
+    agents = list(agents)
+    low = min(agent.current_bid for agent in agents)
+    high = max(agent.true_max_bid for agent in agents)
+    return low, high
+
+
+def _run_chunk(seeds: List[int]) -> SimulationSummary:
+    config = dict(worker_state["config"])
+    config["auction_params"] = dict(config["auction_params"])
+    low, high = worker_state["bid_range"]
+    summary = SimulationSummary(bid_low=low, bid_high=high)
+    for seed in seeds:
+        config["auction_params"]["random_seed"] = seed
+        result = run_multi_round_auction_vectorized(
+            config,
+            social_scores=worker_state["social_scores"],
+            social_mode=worker_state["social_mode"],
+        )
+        summary.record(result, worker_state["strategy_by_name"][result.final_winner["name"]])
+    return summary
+
+
+# ---------- Public API ----------
+
+def simulate_auctions(
+    config: Dict[str, Any],
+    num_runs: int,
+    base_seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run `num_runs` independently seeded trajectories of the auction in
+    `config` and return their aggregated distributions.
+
+    Social scores are computed once here (or taken from `social_scores`) and
+    handed to every worker. Chunks are merged in submission order, so the
+    summary is identical for any `workers` value; workers=1 runs inline.
+    """
+    agents = prepare_agents_from_config(config)
+    if social_scores is None:
+        social_scores, social_mode = compute_agent_social_scores(config, agents)
+    social_mode = social_mode or "rule-based"
+
+    strategy_counts: Dict[str, int] = {}
+    for agent in agents:
+        strategy_counts[agent.strategy] = strategy_counts.get(agent.strategy, 0) + 1
+
+    low, high = _bid_range(agents)
+    summary = SimulationSummary(bid_low=low, bid_high=high)
+    seed_chunks = chunks(run_seeds(base_seed, num_runs), max(1, chunk_size))
+    workers = workers or os.cpu_count() or 1
+    for partial in map_chunks(
+        _run_chunk, seed_chunks, workers, _worker_setup, config, social_scores, social_mode
+    ):
+        summary.merge(partial)
+
+    out = summary.to_dict(strategy_counts)
+    out["social_mode"] = social_mode
+    out["base_seed"] = base_seed
+    return out
+
+
+# ---------- CLI ----------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of multi-round auctions.")
+    parser.add_argument("--config", default="auction_config.json")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="default: all CPUs")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--out", default=None, help="write the summary JSON here")
+    args = parser.parse_args()
+
+    summary = simulate_auctions(
+        load_config(args.config),
+        num_runs=args.runs,
+        base_seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    text = json.dumps(summary, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
@@ -0,0 +1,213 @@
+# auction_strategies.py
+#
+# Bidding strategies for multi-round auctions. A strategy plans raises for
+# a whole batch of agents at once (every agent using it, once per round);
+# engines handle positions, the true_max_bid cap and bid rounding.
+#
+# Adding a behavior:
+#
+#   @register_strategy("my_strategy")
+#   class MyStrategy:
+#       def __init__(self, params): ...
+#       def planned_raise(self, batch: RaiseBatch) -> np.ndarray: ...
+#
+# then give agents "strategy": "my_strategy" and its params under
+# config["strategy_params"]["my_strategy"].
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Protocol, Sequence, Type
+
+import numpy as np
+
+from auction_rng import AuctionRng
+
+
+@dataclass
+class RaiseBatch:
+    """
+    The agents one strategy plans for this round; every array is aligned
+    (entry j = j-th agent of the batch, in agent order). Only agents with
+    headroom (remaining > 0) are included.
+
+    `noise` holds one U[0, 1) draw per agent, taken from the auction's
+    random stream in agent order before any strategy runs, so strategies
+    never change which numbers other agents get. Strategies that need more
+    randomness draw it from `rng`, the auction's own stream.
+    """
+
+    round_index: int
+    total_rounds: int
+    position: np.ndarray
+    loser_factor: np.ndarray
+    current_bid: np.ndarray
+    true_max_bid: np.ndarray
+    remaining: np.ndarray
+    noise: np.ndarray
+    rng: Optional[AuctionRng] = None
+
+    @property
+    def rounds_left(self) -> int:
+        return max(1, self.total_rounds - self.round_index)
+
+    def __len__(self) -> int:
+        return len(self.remaining)
+
+
+class BatchStrategy(Protocol):
+    def planned_raise(self, batch: RaiseBatch) -> np.ndarray:
+        """Raise amount per agent in `batch` (before the true_max_bid cap)."""
+        ...
+
+
+_REGISTRY: Dict[str, Callable[[Mapping[str, Any]], BatchStrategy]] = {}
+
+
+def register_strategy(name: str) -> Callable[[Type[Any]], Type[Any]]:
+    def decorator(cls: Type[Any]) -> Type[Any]:
+        _REGISTRY[name] = cls
+        return cls
+
+    return decorator
+
+
+def registered_strategies() -> Dict[str, Callable[[Mapping[str, Any]], BatchStrategy]]:
+    return dict(_REGISTRY)
+
+
+def build_strategy(name: str, params: Mapping[str, Any]) -> BatchStrategy:
+    """
+    Instantiate strategy `name` with its config params. Names that are not
+    registered use LinearRaiseStrategy, which is what every strategy name
+    in a config meant before the registry existed.
+    """
+    return _REGISTRY.get(name, LinearRaiseStrategy)(params)
+
+
+# ---------- Planning a round ----------
+
+@dataclass
+class RaisePlan:
+    """
+    One round's raises for every agent (entry i = agent i). Agents without
+    headroom have raising[i] False, planned_raise 0 and new_bid unchanged.
+    """
+
+    raising: np.ndarray
+    loser_factor: np.ndarray
+    remaining: np.ndarray
+    planned_raise: np.ndarray
+    new_bid: np.ndarray
+
+
+def plan_raises(
+    strategies: Sequence[BatchStrategy],
+    members: Sequence[np.ndarray],
+    positions: np.ndarray,
+    current_bid: np.ndarray,
+    true_max_bid: np.ndarray,
+    round_index: int,
+    total_rounds: int,
+    rng: AuctionRng,
+    num_ranked: Optional[int] = None,
+) -> RaisePlan:
+    """
+    Plan every agent's raise for one round; `members[s]` are the indices of
+    the agents using `strategies[s]`, and each strategy is called once with
+    all of its raising agents. `positions[i]` is agent i's rank in the last
+    ranking of `num_ranked` rows (default: every agent), 0 = best.
+
+    Noise is drawn from `rng` in one call, one number per agent that still
+    has headroom, in agent order and before any strategy runs. New bids are
+    capped at true_max_bid and rounded to cents with Python round().
+    """
+    num_agents = len(current_bid)
+    num_ranked = num_agents if num_ranked is None else num_ranked
+    if num_ranked > 1:
+        loser_factor = positions / (num_ranked - 1)
+    else:
+        loser_factor = np.zeros(num_agents, dtype=np.float64)
+
+    remaining = np.maximum(0.0, true_max_bid - current_bid)
+    raising = remaining > 0
+    planned = np.zeros(num_agents, dtype=np.float64)
+    new_bid = current_bid.copy()
+    count = int(np.count_nonzero(raising))
+    if count == 0:
+        return RaisePlan(raising, loser_factor, remaining, planned, new_bid)
+
+    noise = np.zeros(num_agents, dtype=np.float64)
+    noise[raising] = rng.uniform(count)
+
+    for strategy, group in zip(strategies, members):
+        idx = group[raising[group]]
+        if idx.size == 0:
+            continue
+        batch = RaiseBatch(
+            round_index=round_index,
+            total_rounds=total_rounds,
+            position=positions[idx],
+            loser_factor=loser_factor[idx],
+            current_bid=current_bid[idx],
+            true_max_bid=true_max_bid[idx],
+            remaining=remaining[idx],
+            noise=noise[idx],
+            rng=rng,
+        )
+        planned[idx] = strategy.planned_raise(batch)
+        new_bid[idx] = np.minimum(batch.current_bid + planned[idx], batch.true_max_bid)
+
+    new_bid[raising] = [round(x, 2) for x in new_bid[raising].tolist()]
+    return RaisePlan(raising, loser_factor, remaining, planned, new_bid)
+
+
+# ---------- Built-in strategies ----------
+
+@register_strategy("greedy")
+@register_strategy("cautious")
+@register_strategy("balanced")
+class LinearRaiseStrategy:
+    """
+    The original decide_raise rule: raise a noisy fraction of the remaining
+    headroom, more the further behind the agent is, never more than an even
+    share of the remaining rounds. greedy / cautious / balanced differ only
+    in their params.
+    """
+
+    def __init__(self, params: Mapping[str, Any]) -> None:
+        self.base_fraction = float(params["base_fraction"])
+        self.rand_min = float(params["rand_min"])
+        self.rand_max = float(params["rand_max"])
+        self.loser_factor_min = float(params["loser_factor_min"])
+        self.loser_factor_max = float(params["loser_factor_max"])
+
+    def planned_raise(self, batch: RaiseBatch) -> np.ndarray:
+        loser_influence = (
+            self.loser_factor_min
+            + (self.loser_factor_max - self.loser_factor_min) * batch.loser_factor
+        )
+        raise_fraction = self.base_fraction * loser_influence
+        raise_fraction *= self.rand_min + (self.rand_max - self.rand_min) * batch.noise
+        planned = batch.remaining * raise_fraction
+        return np.minimum(planned, batch.remaining / batch.rounds_left)
+
+
+@register_strategy("sniper")
+class SniperStrategy:
+    """
+    Holds its bid until the last `snipe_rounds` rounds, then commits
+    `snipe_fraction` of its headroom (times noise in [rand_min, rand_max]).
+    """
+
+    def __init__(self, params: Mapping[str, Any]) -> None:
+        self.snipe_rounds = int(params.get("snipe_rounds", 1))
+        self.snipe_fraction = float(params.get("snipe_fraction", 0.9))
+        self.rand_min = float(params.get("rand_min", 1.0))
+        self.rand_max = float(params.get("rand_max", 1.0))
+
+    def planned_raise(self, batch: RaiseBatch) -> np.ndarray:
+        if batch.rounds_left > self.snipe_rounds:
+            return np.zeros_like(batch.remaining)
+        noise = self.rand_min + (self.rand_max - self.rand_min) * batch.noise
+        return batch.remaining * self.snipe_fraction * noise
@@ -0,0 +1,86 @@
+# bench_agent_history.py
+#
+# Memory of Agent.history as list-of-dicts vs the columnar AgentHistoryStore,
+# filled with entries shaped exactly like multi_round_auction.raise_agents writes them.
+#
+#   python bench_agent_history.py --agents 10000 --rounds 100
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from agent_history import AgentHistoryStore
+
+STRATEGIES = ("greedy", "cautious", "balanced")
+
+
+def make_entry(rng: random.Random, agent: int, round_index: int, num_agents: int) -> Dict[str, Any]:
+    if rng.random() < 0.1:
+        return {
+            "round": round_index,
+            "action": "no_raise",
+            "reason": "reached true_max_bid",
+            "current_bid": round(rng.uniform(100, 20000), 2),
+        }
+    position = rng.randrange(num_agents)
+    return {
+        "round": round_index,
+        "position": position,
+        "loser_factor": round(position / max(1, num_agents - 1), 3),
+        "remaining_before": round(rng.uniform(0, 20000), 2),
+        "planned_raise": round(rng.uniform(0, 2000), 2),
+        "new_bid": round(rng.uniform(100, 20000), 2),
+        "strategy": STRATEGIES[agent % len(STRATEGIES)],
+    }
+
+
+def fill(
+    make_histories: Callable[[], Tuple[Any, List[Any]]], num_agents: int, num_rounds: int
+) -> Tuple[Any, float, int]:
+    rng = random.Random(0)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    owner, histories = make_histories()
+    for r in range(1, num_rounds + 1):
+        for i, history in enumerate(histories):
+            history.append(make_entry(rng, i, r, num_agents))
+    seconds = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (owner, histories), seconds, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Agent.history memory: dicts vs columnar store.")
+    parser.add_argument("--agents", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+    n, r = args.agents, args.rounds
+
+    def lists() -> Tuple[None, List[List[Dict[str, Any]]]]:
+        return None, [[] for _ in range(n)]
+
+    def columnar() -> Tuple[AgentHistoryStore, List[Any]]:
+        store = AgentHistoryStore(n, r)
+        return store, [store.view(i) for i in range(n)]
+
+    (_, dict_histories), dict_s, dict_bytes = fill(lists, n, r)
+    (store, views), store_s, store_bytes = fill(columnar, n, r)
+
+    identical = all(views[i] == dict_histories[i] for i in range(0, n, max(1, n // 200)))
+    del dict_histories
+
+    print(f"{n} agents x {r} rounds ({n * r:,} entries)")
+    print(f"{'layout':>12} {'MB':>9} {'bytes/entry':>12} {'fill_s':>8}")
+    print(f"{'dicts':>12} {dict_bytes / 1e6:>9.1f} {dict_bytes / (n * r):>12.1f} {dict_s:>8.2f}")
+    print(f"{'columnar':>12} {store_bytes / 1e6:>9.1f} {store_bytes / (n * r):>12.1f} {store_s:>8.2f}")
+    print(f"reduction: {dict_bytes / store_bytes:.1f}x; sampled entries identical: {identical}")
+    print("(fill_s is measured under tracemalloc, so both are inflated)")
+
+
+if __name__ == "__main__":
+    main()
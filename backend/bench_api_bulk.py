@@ -0,0 +1,96 @@
+# bench_api_bulk.py
+#
+# M auctions drawn from one donor pool (so donors overlap across auctions):
+# M concurrent POST /run-auction calls vs one POST /run-auctions, against
+# FakeGeminiClient. Reports LLM requests, wall time, and whether both give
+# the same rankings.
+#
+#   python bench_api_bulk.py --auctions 20 --profiles 25 --donors 100
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import random
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+import api
+from auction_core import set_gemini_client
+from bench_gemini_concurrency import make_profiles
+from fake_gemini_client import FakeGeminiClient
+
+PROFILE_KEYS = ("name", "country", "start_bid", "max_bid", "profession", "social_contribution")
+
+
+def make_auctions(num_auctions: int, per_auction: int, num_donors: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    donors = [{k: p[k] for k in PROFILE_KEYS} for p in make_profiles(num_donors)]
+    auctions = []
+    for a in range(num_auctions):
+        profiles = []
+        for donor in rng.sample(donors, per_auction):
+            bid = round(rng.uniform(100, 20000), 2)  # same donor, auction-specific bid
+            profiles.append(dict(donor, start_bid=bid, max_bid=bid))
+        auctions.append({"auction_id": f"auction-{a}", "profiles": profiles})
+    return auctions
+
+
+def ranking_names(result: Dict[str, Any]) -> List[Any]:
+    return [(row["name"], row["final_score"]) for row in result["ranking"]]
+
+
+async def run(auctions: List[Dict[str, Any]], latency: float) -> None:
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        fake = FakeGeminiClient(latency_seconds=latency)
+        set_gemini_client(fake)
+        t0 = time.perf_counter()
+        separate = await asyncio.gather(
+            *(client.post("/run-auction", json={"profiles": a["profiles"]}) for a in auctions)
+        )
+        t_separate = time.perf_counter() - t0
+        calls_separate = fake.call_count
+
+        fake = FakeGeminiClient(latency_seconds=latency)
+        set_gemini_client(fake)
+        t0 = time.perf_counter()
+        bulk = await client.post("/run-auctions", json={"auctions": auctions})
+        t_bulk = time.perf_counter() - t0
+        calls_bulk = fake.call_count
+
+    body = bulk.json()
+    same = all(
+        ranking_names(r.json()) == ranking_names(b) for r, b in zip(separate, body["results"])
+    )
+    print(
+        f"{len(auctions)} auctions, {body['profiles_total']} profiles, "
+        f"{body['profiles_distinct']} distinct donors"
+    )
+    print(f"{'mode':>9} {'llm_calls':>10} {'wall_s':>7}")
+    print(f"{'separate':>9} {calls_separate:>10} {t_separate:>7.2f}")
+    print(f"{'bulk':>9} {calls_bulk:>10} {t_bulk:>7.2f}")
+    print("bulk timings:", {k: round(v, 4) for k, v in body["timings"].items()})
+    print(f"max rank_seconds: {max(r['rank_seconds'] for r in body['results']):.4f}")
+    print("identical rankings:", same)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark /run-auctions against per-auction calls.")
+    parser.add_argument("--auctions", type=int, default=20)
+    parser.add_argument("--profiles", type=int, default=25, help="profiles per auction")
+    parser.add_argument("--donors", type=int, default=100, help="size of the shared donor pool")
+    parser.add_argument("--latency", type=float, default=0.1, help="fake seconds per LLM request")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # No shared rate limit or disk cache: measure deduplication, not caching.
+    api.GEMINI_OPTIONS = dataclasses.replace(api.GEMINI_OPTIONS, rate_limiter=None, cache=None)
+    asyncio.run(run(make_auctions(args.auctions, args.profiles, args.donors, args.seed), args.latency))
+
+
+if __name__ == "__main__":
+    main()
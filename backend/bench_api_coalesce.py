@@ -0,0 +1,96 @@
+# bench_api_coalesce.py
+#
+# Bursts of identical POST /run-auction payloads (refreshes / retries) with
+# api.RESULT_CACHE off vs on, against FakeGeminiClient. Each burst fires
+# `--duplicates` copies of each of `--distinct` payloads at once; a second
+# wave re-sends them with If-None-Match. Reports LLM requests, wall time,
+# 304s and the /metrics counters.
+#
+#   python bench_api_coalesce.py --distinct 10 --duplicates 20 --profiles 8
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+import api
+from auction_core import set_gemini_client
+from auction_result_cache import AuctionResultCache
+from bench_api_load import make_payloads
+from fake_gemini_client import FakeGeminiClient
+
+
+async def run(payloads: List[Dict[str, Any]], duplicates: int, latency: float) -> Dict[str, Any]:
+    fake = FakeGeminiClient(latency_seconds=latency)
+    set_gemini_client(fake)
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        t0 = time.perf_counter()
+        burst = await asyncio.gather(
+            *(client.post("/run-auction", json=p) for p in payloads for _ in range(duplicates))
+        )
+        t_burst = time.perf_counter() - t0
+        calls_burst = fake.call_count
+
+        etags = {i: burst[i * duplicates].headers["ETag"] for i in range(len(payloads))}
+        t0 = time.perf_counter()
+        revalidate = await asyncio.gather(
+            *(
+                client.post("/run-auction", json=p, headers={"If-None-Match": etags[i]})
+                for i, p in enumerate(payloads)
+                for _ in range(duplicates)
+            )
+        )
+        t_revalidate = time.perf_counter() - t0
+        metrics = (await client.get("/metrics")).json()["result_cache"]
+
+    first = [burst[i * duplicates].json()["ranking"] for i in range(len(payloads))]
+    return {
+        "burst_s": t_burst,
+        "burst_calls": calls_burst,
+        "revalidate_s": t_revalidate,
+        "revalidate_calls": fake.call_count - calls_burst,
+        "not_modified": sum(1 for r in revalidate if r.status_code == 304),
+        "consistent": all(
+            r.json()["ranking"] == first[i // duplicates] for i, r in enumerate(burst)
+        ),
+        "metrics": metrics,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark single-flight + result cache on /run-auction.")
+    parser.add_argument("--distinct", type=int, default=10, help="distinct payloads")
+    parser.add_argument("--duplicates", type=int, default=20, help="concurrent copies of each payload")
+    parser.add_argument("--profiles", type=int, default=8, help="profiles per auction")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake seconds per LLM request")
+    args = parser.parse_args()
+
+    # No shared rate limit or disk cache: measure the result cache alone.
+    api.GEMINI_OPTIONS = dataclasses.replace(api.GEMINI_OPTIONS, rate_limiter=None, cache=None)
+    payloads = make_payloads(args.distinct, args.profiles)
+    total = args.distinct * args.duplicates
+
+    print(f"{total} requests per wave ({args.distinct} distinct x {args.duplicates} copies)")
+    print(
+        f"{'cache':>5} {'burst_calls':>12} {'burst_s':>8} {'reval_calls':>12} "
+        f"{'reval_s':>8} {'304s':>5} {'consistent':>11}"
+    )
+    for label, cache in (("off", None), ("on", AuctionResultCache(max_entries=1024, ttl_seconds=300))):
+        api.RESULT_CACHE = cache
+        out = asyncio.run(run(payloads, args.duplicates, args.latency))
+        print(
+            f"{label:>5} {out['burst_calls']:>12} {out['burst_s']:>8.2f} {out['revalidate_calls']:>12} "
+            f"{out['revalidate_s']:>8.2f} {out['not_modified']:>5} {str(out['consistent']):>11}"
+        )
+        if out["metrics"] is not None:
+            print("metrics:", out["metrics"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# bench_api_load.py
+#
+# Load test for POST /run-auction against FakeGeminiClient: the previous
+# sync endpoint (blocking rank_profiles on FastAPI's threadpool) vs the
+# async one in api.py. Fires N concurrent auctions, in process over httpx's
+# ASGI transport, and times a GET / issued while they are in flight.
+#
+#   python bench_api_load.py --concurrency 10,50,200 --profiles 8 --latency 0.2
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+
+import httpx
+from fastapi import FastAPI
+
+import api
+from auction_core import TieringOptions, rank_profiles, set_gemini_client
+from bench_gemini_concurrency import make_profiles
+from fake_gemini_client import FakeGeminiClient
+
+
+def make_sync_app() -> FastAPI:
+    """The endpoints as they were before the async path: plain `def` handlers."""
+    app = FastAPI()
+
+    @app.get("/")
+    def root():
+        return {"message": "AI Auction API is running. POST /run-auction to evaluate profiles."}
+
+    @app.post("/run-auction", response_model=api.AuctionResponse)
+    def run_auction(req: api.AuctionRequest):
+        result = rank_profiles(
+            profiles=[p.model_dump() for p in req.profiles],
+            use_gemini=req.use_gemini,
+            tiering=TieringOptions() if req.tiered else None,
+            gemini_options=api.GEMINI_OPTIONS,
+        )
+        return {
+            "social_mode": result["social_mode"],
+            "winner": result["winner"],
+            "ranking": result["ranking"],
+            "tier_counts": result.get("tier_counts"),
+        }
+
+    return app
+
+
+def make_payloads(num_requests: int, num_profiles: int) -> List[Dict[str, Any]]:
+    keys = ("name", "country", "start_bid", "max_bid", "profession", "social_contribution")
+    pool = make_profiles(num_requests * num_profiles)
+    return [
+        {"profiles": [{k: p[k] for k in keys} for p in pool[i * num_profiles: (i + 1) * num_profiles]]}
+        for i in range(num_requests)
+    ]
+
+
+async def run_load(app: FastAPI, payloads: List[Dict[str, Any]]) -> Tuple[float, List[float], float, int]:
+    """(wall seconds, per-request latencies, GET / latency under load, non-200 responses)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def one(payload: Dict[str, Any]) -> Tuple[float, int]:
+            t0 = time.perf_counter()
+            response = await client.post("/run-auction", json=payload)
+            return time.perf_counter() - t0, response.status_code
+
+        async def probe() -> float:
+            await asyncio.sleep(0.05)  # let the auctions occupy the server first
+            t0 = time.perf_counter()
+            await client.get("/")
+            return time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        results, root_latency = await asyncio.gather(
+            asyncio.gather(*(one(p) for p in payloads)), probe()
+        )
+        wall = time.perf_counter() - t0
+
+    latencies = [latency for latency, _ in results]
+    errors = sum(1 for _, status in results if status != 200)
+    return wall, latencies, root_latency, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test /run-auction: sync vs async endpoint.")
+    parser.add_argument("--concurrency", default="10,50,200")
+    parser.add_argument("--profiles", type=int, default=8, help="profiles per auction")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake seconds per LLM request")
+    args = parser.parse_args()
+
+    set_gemini_client(FakeGeminiClient(latency_seconds=args.latency))
+    # Concurrency (and any deadline / hedging) from auction_config.json, but no shared
+    # rate limit or disk cache, so the endpoints themselves are what's measured.
+    api.GEMINI_OPTIONS = dataclasses.replace(api.GEMINI_OPTIONS, rate_limiter=None, cache=None)
+
+    apps = {"sync": make_sync_app(), "async": api.app}
+    print(
+        f"{'endpoint':>8} {'requests':>9} {'wall_s':>7} {'req/s':>7} "
+        f"{'p50_s':>6} {'p95_s':>6} {'GET /_s':>8} {'errors':>6}"
+    )
+    for n in [int(x) for x in args.concurrency.split(",")]:
+        payloads = make_payloads(n, args.profiles)
+        for label, app in apps.items():
+            wall, latencies, root_latency, errors = asyncio.run(run_load(app, payloads))
+            p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+            print(
+                f"{label:>8} {n:>9} {wall:>7.2f} {n / wall:>7.1f} "
+                f"{statistics.median(latencies):>6.2f} {p95:>6.2f} {root_latency:>8.3f} {errors:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# bench_api_stream.py
+#
+# Time-to-first-round of POST /run-multi-round-auction/stream vs the whole
+# auction, and how far the server runs ahead of a slow reader. The ASGI app
+# is driven directly (httpx's ASGI transport buffers whole responses), so
+# every SSE chunk is timestamped when the server sends it.
+#
+#   python bench_api_stream.py --agents 200,1000 --rounds 30 --slow-reader 0.05
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Tuple
+
+import api
+from bench_round_engine import make_config
+from multi_round_auction import load_config
+
+# Rounds the server has computed so far (see count_produced_rounds).
+_produced = [0]
+
+
+def count_produced_rounds() -> None:
+    original = api.iter_multi_round_auction
+
+    def counting(*args: Any, **kwargs: Any):
+        for round_result in original(*args, **kwargs):
+            _produced[0] += 1
+            yield round_result
+
+    api.iter_multi_round_auction = counting
+
+
+async def stream(payload: Dict[str, Any], read_delay: float) -> Tuple[List[Tuple[float, str]], int]:
+    """
+    ([(seconds since request, event name)] per SSE event, max rounds the
+    server had computed beyond what this client had received).
+    """
+    body = json.dumps(payload).encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/run-multi-round-auction/stream",
+        "raw_path": b"/run-multi-round-auction/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "server": ("bench", 80),
+        "client": ("bench", 1234),
+    }
+    request_sent = [False]
+    finished = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        if not request_sent[0]:
+            request_sent[0] = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    events: List[Tuple[float, str]] = []
+    received_rounds = [0]
+    max_lead = [0]
+    _produced[0] = 0
+    t0 = time.perf_counter()
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] != "http.response.body" or not message.get("body"):
+            return
+        for chunk in message["body"].decode("utf-8").split("\n\n"):
+            if not chunk.startswith("event: "):
+                continue
+            name = chunk.split("\n", 1)[0][len("event: "):]
+            events.append((time.perf_counter() - t0, name))
+            if name == "round":
+                received_rounds[0] += 1
+                max_lead[0] = max(max_lead[0], _produced[0] - received_rounds[0])
+        if read_delay:
+            await asyncio.sleep(read_delay)  # a slow client: the server's send() waits on us
+
+    await api.app(scope, receive, send)
+    finished.set()
+    return events, max_lead[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the SSE multi-round auction stream.")
+    parser.add_argument("--agents", default="200,1000")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--slow-reader", type=float, default=0.05, help="seconds a slow client takes per event")
+    args = parser.parse_args()
+
+    count_produced_rounds()
+    base = load_config("auction_config.json")
+    print(f"buffer: {api.STREAM_BUFFER_ROUNDS} rounds")
+    print(
+        f"{'agents':>7} {'rounds':>7} {'first_round_s':>14} {'total_s':>8} "
+        f"{'first/total':>12} {'max_lead_slow':>14}"
+    )
+    for n in [int(x) for x in args.agents.split(",")]:
+        config = make_config(base, n, args.rounds, args.seed)
+        payload = {
+            "agents": config["agents"],
+            "num_rounds": args.rounds,
+            "random_seed": args.seed,
+            "use_gemini": False,
+        }
+        events, _ = asyncio.run(stream(payload, 0.0))
+        _, lead = asyncio.run(stream(payload, args.slow_reader))
+
+        rounds = sum(1 for _, name in events if name == "round")
+        first = next(t for t, name in events if name == "round")
+        total = events[-1][0]
+        print(
+            f"{n:>7} {rounds:>7} {first:>14.3f} {total:>8.3f} "
+            f"{first / total:>12.2f} {lead:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
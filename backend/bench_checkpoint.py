@@ -0,0 +1,56 @@
+# bench_checkpoint.py
+#
+# Cost of checkpointing a multi-round auction (state JSON + per-round JSONL,
+# both fsync'd) relative to a plain run.
+#
+#   python bench_checkpoint.py --agents 100,500 --rounds 20 --every 1,5
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from auction_checkpoint import run_multi_round_auction_checkpointed
+from auction_core import compute_social_scores
+from bench_round_engine import make_config
+from multi_round_auction import load_config, run_multi_round_auction
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark auction checkpoint overhead.")
+    parser.add_argument("--agents", default="100,500")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--every", default="1,5")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    base = load_config("auction_config.json")
+    print(f"{'agents':>7} {'every':>6} {'seconds':>8} {'overhead':>9} {'state_kb':>9} {'rounds_kb':>10}")
+    for n in [int(x) for x in args.agents.split(",")]:
+        config = make_config(base, n, args.rounds, args.seed)
+        social, mode = compute_social_scores(config["agents"], use_gemini=False)
+
+        t0 = time.perf_counter()
+        expected = run_multi_round_auction(config, social, mode).to_dict()
+        plain = time.perf_counter() - t0
+        print(f"{n:>7} {'-':>6} {plain:>8.3f} {'':>9} {'':>9} {'':>10}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for every in [int(x) for x in args.every.split(",")]:
+                path = os.path.join(tmp, f"auction_{every}.ckpt.json")
+                t0 = time.perf_counter()
+                result = run_multi_round_auction_checkpointed(
+                    config, path, every=every, resume=False, social_scores=social, social_mode=mode
+                )
+                seconds = time.perf_counter() - t0
+                assert result.to_dict() == expected
+                print(
+                    f"{n:>7} {every:>6} {seconds:>8.3f} {100 * (seconds / plain - 1):>8.1f}% "
+                    f"{os.path.getsize(path) / 1e3:>9.1f} {os.path.getsize(path + '.rounds.jsonl') / 1e3:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
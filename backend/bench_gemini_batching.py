@@ -0,0 +1,50 @@
+# bench_gemini_batching.py
+#
+# Offline benchmark for batched Gemini prompts: requests and seconds per
+# 1k profiles for several batch sizes, using FakeGeminiClient.
+#
+#   python bench_gemini_batching.py --profiles 1000 --batch-sizes 1,5,10,25
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from bench_gemini_concurrency import make_profiles
+from fake_gemini_client import FakeGeminiClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched Gemini scoring offline.")
+    parser.add_argument("--profiles", type=int, default=1000)
+    parser.add_argument("--batch-sizes", default="1,5,10,25")
+    parser.add_argument("--latency", type=float, default=0.05, help="fixed fake seconds per request")
+    parser.add_argument(
+        "--per-profile", type=float, default=0.002, help="fake seconds per profile in a prompt"
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--drop-rate", type=float, default=0.02, help="profiles missing from batches")
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.profiles)
+    per_1k = 1000.0 / len(profiles)
+
+    print(f"{'batch':>5} {'requests/1k':>12} {'seconds/1k':>11}")
+    for k in [int(x) for x in args.batch_sizes.split(",")]:
+        client = FakeGeminiClient(
+            latency_seconds=args.latency,
+            per_profile_seconds=args.per_profile,
+            batch_drop_rate=args.drop_rate,
+        )
+        options = GeminiScoringOptions(max_concurrency=args.concurrency, batch_size=k)
+        t0 = time.perf_counter()
+        scores = compute_social_scores_gemini(profiles, client, "fake-model", options=options)
+        elapsed = time.perf_counter() - t0
+        assert list(scores) == [p["name"] for p in profiles]
+
+        print(f"{k:>5} {client.call_count * per_1k:>12.0f} {elapsed * per_1k:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# bench_gemini_concurrency.py
+#
+# Offline benchmark for compute_social_scores_gemini() concurrency, using
+# FakeGeminiClient so no API key or network is needed.
+#
+#   python bench_gemini_concurrency.py --profiles 200 --latency 0.05 --concurrency 1,4,16
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from fake_gemini_client import FakeGeminiClient
+from llm_limits import TokenBucket
+
+
+def make_profiles(n: int) -> List[Dict[str, Any]]:
+    professions = ["Human rights lawyer", "Tobacco factory owner", "Teacher", "Crypto fund manager"]
+    contributions = [
+        "Donated 5000 for hungry children and funded a school.",
+        "Donated $1000 for planting trees.",
+        "Volunteers at a hospital for refugees.",
+        "No recorded contributions.",
+    ]
+    return [
+        {
+            "name": f"Bidder {i}",
+            "country": "United States",
+            "profession": professions[i % len(professions)],
+            "social_contribution": contributions[(i // 2) % len(contributions)],
+            "start_bid": 0.0,
+            "max_bid": 1000.0 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent Gemini scoring offline.")
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", default="1,4,16,32")
+    parser.add_argument("--rpm", type=float, default=None, help="optional requests/minute cap")
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.profiles)
+    baseline = None
+
+    print(f"{'concurrency':>11} {'seconds':>9} {'req/s':>8} {'speedup':>8}")
+    for c in [int(x) for x in args.concurrency.split(",")]:
+        client = FakeGeminiClient(
+            latency_seconds=args.latency,
+            jitter_seconds=args.jitter,
+            failure_rate=args.failure_rate,
+        )
+        options = GeminiScoringOptions(
+            max_concurrency=c,
+            rate_limiter=TokenBucket.per_minute(args.rpm, burst=c) if args.rpm else None,
+        )
+        t0 = time.perf_counter()
+        scores = compute_social_scores_gemini(profiles, client, "fake-model", options=options)
+        elapsed = time.perf_counter() - t0
+        assert list(scores) == [p["name"] for p in profiles]
+
+        baseline = baseline or elapsed
+        print(
+            f"{c:>11} {elapsed:>9.2f} {client.call_count / elapsed:>8.1f} "
+            f"{baseline / elapsed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# bench_gemini_deadline.py
+#
+# Auction-level scoring latency (p50/p99) against a fake Gemini with a slow
+# tail, with and without a latency budget / hedged requests.
+#
+#   python bench_gemini_deadline.py --auctions 50 --profiles 20 --slow-rate 0.05
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from bench_gemini_concurrency import make_profiles
+from fake_gemini_client import FakeGeminiClient
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def run(args: argparse.Namespace, deadline: Optional[float], hedge: Optional[float]) -> None:
+    client = FakeGeminiClient(
+        latency_seconds=args.latency,
+        jitter_seconds=args.latency / 2,
+        slow_rate=args.slow_rate,
+        slow_seconds=args.slow_seconds,
+        seed=1,
+    )
+    options = GeminiScoringOptions(
+        max_concurrency=args.concurrency,
+        deadline_seconds=deadline,
+        hedge_after_seconds=hedge,
+    )
+    profiles = make_profiles(args.profiles)
+
+    latencies: List[float] = []
+    fallbacks = 0
+    for _ in range(args.auctions):
+        t0 = time.perf_counter()
+        scores = compute_social_scores_gemini(profiles, client, "fake-model", options=options)
+        latencies.append(time.perf_counter() - t0)
+        fallbacks += sum(1 for _, reason in scores.values() if reason.startswith("Fallback"))
+
+    label = f"deadline={deadline} hedge={hedge}"
+    print(
+        f"{label:<28} p50={percentile(latencies, 0.5):.3f}s p99={percentile(latencies, 0.99):.3f}s "
+        f"max={max(latencies):.3f}s requests={client.call_count} "
+        f"fallback_rate={fallbacks / (args.auctions * args.profiles):.3f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Gemini deadlines and hedging offline.")
+    parser.add_argument("--auctions", type=int, default=50)
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-seconds", type=float, default=1.0)
+    parser.add_argument("--deadline", type=float, default=0.25)
+    parser.add_argument("--hedge-after", type=float, default=0.1)
+    args = parser.parse_args()
+
+    run(args, deadline=None, hedge=None)
+    run(args, deadline=args.deadline, hedge=None)
+    run(args, deadline=None, hedge=args.hedge_after)
+    run(args, deadline=args.deadline, hedge=args.hedge_after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# bench_import_time.py
+#
+# Cold-start cost of importing the backend entry points, each in a fresh
+# interpreter. Optionally compares against another git revision.
+#
+#   python bench_import_time.py --runs 10
+#   python bench_import_time.py --runs 10 --compare-ref HEAD~1
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from typing import Dict, List
+
+MODULES = ["auction_core", "multi_round_auction", "api", "run_full_demo"]
+
+
+def time_import(module: str, cwd: str, runs: int) -> float:
+    """Median wall-clock seconds for `python -c "import <module>"`, minus bare interpreter start."""
+
+    def median_run(code: str) -> float:
+        samples: List[float] = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=cwd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+            )
+            samples.append(time.perf_counter() - t0)
+        return statistics.median(samples)
+
+    return median_run(f"import {module}") - median_run("pass")
+
+
+def export_ref(ref: str, dest: str) -> str:
+    """Extract backend/ at `ref` into `dest` via git archive; returns the backend dir."""
+    repo_root = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    archive = os.path.join(dest, "ref.tar")
+    with open(archive, "wb") as f:
+        subprocess.run(["git", "archive", ref, "backend"], cwd=repo_root, stdout=f, check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(dest)
+    return os.path.join(dest, "backend")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark backend import (cold start) time.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--compare-ref", default=None, help="git revision to compare against")
+    args = parser.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    columns: Dict[str, str] = {"current": here}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.compare_ref:
+            columns = {args.compare_ref: export_ref(args.compare_ref, tmp), **columns}
+
+        print(f"{'module':<22}" + "".join(f"{name:>14}" for name in columns))
+        for module in MODULES:
+            cells = []
+            for cwd in columns.values():
+                try:
+                    cells.append(f"{time_import(module, cwd, args.runs) * 1000:>12.1f}ms")
+                except subprocess.CalledProcessError:
+                    cells.append(f"{'error':>14}")
+            print(f"{module:<22}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
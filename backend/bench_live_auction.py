@@ -0,0 +1,89 @@
+# bench_live_auction.py
+#
+# Per-bid cost of LiveAuction (incremental treap) vs re-running
+# rank_columns() over everyone after every bid. Each event is one bid
+# followed by a leader + rank-of-bidder query.
+#
+# Workloads:
+#   random     a random bidder raises 0-2%
+#   monotonic  the same bidder raises 1% every time (worst case: it moves the
+#              max bid on every event, so every query rebuilds, and its old
+#              max-heap entries never reach the top to be dropped lazily)
+#
+# heap = min + max heap entries at the end (bounded by 4 x bidders).
+#
+#   python bench_live_auction.py --bidders 1000,10000,100000 --events 2000
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import time
+
+import numpy as np
+
+from auction_core import compute_social_scores, rank_columns
+from bench_gemini_concurrency import make_profiles
+from live_auction import LiveAuction
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental live-auction ranking.")
+    parser.add_argument("--bidders", default="1000,10000,100000")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--full-events", type=int, default=200, help="events for the full re-rank baseline")
+    parser.add_argument("--workloads", default="random,monotonic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'workload':>9} {'bidders':>8} {'live_us':>9} {'live_p50':>9} {'full_us':>10} "
+        f"{'speedup':>8} {'rebuilds':>9} {'heap':>7}"
+    )
+    for workload, n in itertools.product(args.workloads.split(","), [int(x) for x in args.bidders.split(",")]):
+        rng = random.Random(args.seed)
+        profiles = make_profiles(n)
+        for p in profiles:
+            p["max_bid"] = round(rng.uniform(100, 10000), 2)
+        social, mode = compute_social_scores(profiles, use_gemini=False)
+        names = [p["name"] for p in profiles]
+        if workload == "monotonic":
+            events = [(0, 1.01)] * args.events
+        else:
+            events = [(rng.randrange(n), rng.uniform(1.0, 1.02)) for _ in range(args.events)]
+
+        live = LiveAuction(profiles, social)
+        live.leader()
+        per_event = []
+        clock = time.perf_counter
+        for i, factor in events:
+            t0 = clock()
+            live.place_bid(names[i], round(float(live.bids[i]) * factor, 2))
+            live.leader()
+            live.rank_of(names[i])
+            per_event.append(clock() - t0)
+        live_us = 1e6 * sum(per_event) / len(events)
+        live_p50 = 1e6 * float(np.median(per_event))
+
+        bids = np.array([p["max_bid"] for p in profiles], dtype=np.float64)
+        social_col = np.array([social[name][0] for name in names])
+        reasons = [social[name][1] for name in names]
+        full_events = events[: args.full_events]
+        t0 = time.perf_counter()
+        for i, factor in full_events:
+            bids[i] = round(float(bids[i]) * factor, 2)
+            ranking = rank_columns(names, bids, social_col, reasons, mode)["ranking"]
+            ranking[0]
+            int(ranking.positions()[i])
+        full_us = 1e6 * (time.perf_counter() - t0) / len(full_events)
+
+        stats = live.stats()
+        print(
+            f"{workload:>9} {n:>8} {live_us:>9.1f} {live_p50:>9.1f} {full_us:>10.1f} "
+            f"{full_us / live_us:>7.1f}x {stats['rebuilds']:>9} {stats['heap_entries']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# bench_rag_index.py
+#
+# Build and query cost of the BM25 RagIndex as the persona knowledge base
+# grows, and how much prompt context it saves versus concatenating every doc.
+#
+#   python bench_rag_index.py --names 1000 --docs-per-name 5,20,50
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from auction_core import _get_rag_context
+from rag_index import RagIndex, estimate_tokens
+
+_FILLER = (
+    "attended a networking dinner discussed quarterly results travelled to a conference "
+    "met with investors reviewed a contract posted on social media renovated an office"
+).split()
+_RELEVANT = (
+    "donated to a children's hospital funded school scholarships for girls volunteered "
+    "at a refugee shelter planted trees for climate resilience supported clean water wells"
+).split()
+
+
+def make_docs(names: int, docs_per_name: int, rng: random.Random) -> List[Dict[str, Any]]:
+    docs = []
+    for n in range(names):
+        for _ in range(docs_per_name):
+            vocab = _RELEVANT if rng.random() < 0.2 else _FILLER
+            text = " ".join(rng.choice(vocab) for _ in range(rng.randint(40, 120)))
+            docs.append({"name": f"Person {n}", "text": text})
+    return docs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark RagIndex build/query cost.")
+    parser.add_argument("--names", type=int, default=1000)
+    parser.add_argument("--docs-per-name", default="5,20,50")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'docs/name':>9} {'passages':>9} {'build_s':>8} {'query_ms':>9} "
+        f"{'all_docs_tok':>12} {'top_k_tok':>10}"
+    )
+    for per_name in [int(x) for x in args.docs_per_name.split(",")]:
+        rng = random.Random(args.seed)
+        docs = make_docs(args.names, per_name, rng)
+        index = RagIndex(docs)
+
+        names = [f"Person {rng.randrange(args.names)}" for _ in range(args.queries)]
+        t0 = time.perf_counter()
+        contexts = [_get_rag_context(name, index) for name in names]
+        query_ms = 1000.0 * (time.perf_counter() - t0) / len(names)
+
+        full_tokens = sum(estimate_tokens("\n\n".join(index[name])) for name in names) / len(names)
+        ranked_tokens = sum(estimate_tokens(c) for c in contexts) / len(names)
+        stats = index.stats()
+        print(
+            f"{per_name:>9} {stats['passages']:>9} {stats['build_seconds']:>8.2f} {query_ms:>9.3f} "
+            f"{full_tokens:>12.0f} {ranked_tokens:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
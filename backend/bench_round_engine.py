@@ -0,0 +1,66 @@
+# bench_round_engine.py
+#
+# Agent-based engine (multi_round_auction) vs the structure-of-arrays round engine on
+# synthetic auctions, checking both produce identical results.
+#
+#   python bench_round_engine.py --agents 100,1000,10000 --rounds 10
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import time
+from typing import Any, Dict
+
+from auction_core import compute_social_scores
+from bench_gemini_concurrency import make_profiles
+from multi_round_auction import load_config, run_multi_round_auction
+from round_engine import run_multi_round_auction_vectorized
+
+
+def make_config(base: Dict[str, Any], num_agents: int, num_rounds: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    config = copy.deepcopy(base)
+    config["auction_params"]["num_rounds"] = num_rounds
+    config["auction_params"]["random_seed"] = seed
+    config["gemini"]["enabled"] = False
+    strategies = sorted(config["strategy_params"])
+    agents = []
+    for p in make_profiles(num_agents):
+        start = round(rng.uniform(100, 5000), 2)
+        p["start_bid"] = start
+        p["max_bid"] = round(start + rng.uniform(0, 20000), 2)
+        p["strategy"] = rng.choice(strategies)
+        agents.append(p)
+    config["agents"] = agents
+    config["rag_docs"] = []
+    return config
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized round engine.")
+    parser.add_argument("--agents", default="100,1000,10000")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    base = load_config("auction_config.json")
+    print(f"{'agents':>7} {'agents_s':>9} {'vector_s':>9} {'speedup':>8} {'identical':>9}")
+    for n in [int(x) for x in args.agents.split(",")]:
+        config = make_config(base, n, args.rounds, args.seed)
+        social, mode = compute_social_scores(config["agents"], use_gemini=False)
+
+        t0 = time.perf_counter()
+        old = run_multi_round_auction(config, social_scores=social, social_mode=mode).to_dict()
+        t_old = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        new = run_multi_round_auction_vectorized(config, social_scores=social, social_mode=mode).to_dict()
+        t_new = time.perf_counter() - t0
+
+        print(f"{n:>7} {t_old:>9.3f} {t_new:>9.3f} {t_old / t_new:>7.1f}x {str(old == new):>9}")
+
+
+if __name__ == "__main__":
+    main()
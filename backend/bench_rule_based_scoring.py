@@ -0,0 +1,90 @@
+# bench_rule_based_scoring.py
+#
+# Compares the per-keyword substring scan the rule-based scorer used to do
+# with the precompiled KeywordMatcher, across profile counts and keyword-list
+# sizes.
+#
+#   python bench_rule_based_scoring.py --profiles 1000,10000 --keywords 18,1000,5000
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from keyword_matcher import KeywordMatcher
+
+_SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa", "qu", "xi"]
+
+
+def make_keywords(n: int, rng: random.Random) -> Dict[str, float]:
+    keywords: Dict[str, float] = {}
+    while len(keywords) < n:
+        word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if rng.random() < 0.3:
+            word += " " + "".join(rng.choice(_SYLLABLES) for _ in range(2))
+        keywords[word] = round(rng.uniform(0.01, 0.1), 3)
+    return keywords
+
+
+def make_texts(n: int, keywords: List[str], rng: random.Random) -> List[str]:
+    texts = []
+    for _ in range(n):
+        words = [rng.choice(keywords) if rng.random() < 0.2 else rng.choice(_SYLLABLES) * 2 for _ in range(30)]
+        texts.append(" ".join(words))
+    return texts
+
+
+def scan_naive(texts: List[str], keywords: Dict[str, float]) -> float:
+    total = 0.0
+    for text in texts:
+        for kw, w in keywords.items():
+            if kw in text:
+                total += w
+    return total
+
+
+def scan_matcher(texts: List[str], matcher: KeywordMatcher) -> float:
+    total = 0.0
+    for text in texts:
+        total += matcher.score(text)[0]
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rule-based keyword matching.")
+    parser.add_argument("--profiles", default="1000,10000")
+    parser.add_argument("--keywords", default="18,1000,5000")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'profiles':>8} {'keywords':>8} {'build_s':>8} {'naive_s':>8} {'matcher_s':>9} {'speedup':>8}")
+    for num_keywords in [int(x) for x in args.keywords.split(",")]:
+        rng = random.Random(args.seed)
+        keywords = make_keywords(num_keywords, rng)
+
+        t0 = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        build_s = time.perf_counter() - t0
+
+        for num_profiles in [int(x) for x in args.profiles.split(",")]:
+            texts = make_texts(num_profiles, list(keywords), rng)
+
+            t0 = time.perf_counter()
+            naive_total = scan_naive(texts, keywords)
+            naive_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            matcher_total = scan_matcher(texts, matcher)
+            matcher_s = time.perf_counter() - t0
+
+            assert abs(naive_total - matcher_total) < 1e-6 * max(1.0, naive_total)
+            print(
+                f"{num_profiles:>8} {num_keywords:>8} {build_s:>8.3f} {naive_s:>8.3f} "
+                f"{matcher_s:>9.3f} {naive_s / matcher_s:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# bench_strategies.py
+#
+# Per-round cost of the strategy step versus agent count: one batched
+# planned_raise() call per strategy (round_engine.apply_raises) against one
+# batch-of-one call per agent (what Agent.decide_raise does on its own).
+#
+#   python bench_strategies.py --agents 100,1000,10000,100000 --reps 5
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from auction_rng import AuctionRng
+from auction_strategies import RaiseBatch
+from bench_round_engine import make_config
+from multi_round_auction import load_config
+from round_engine import AgentArrays, apply_raises
+
+
+def per_agent_round(
+    state: AgentArrays, positions: np.ndarray, round_index: int, total_rounds: int, rng: AuctionRng
+) -> None:
+    n = len(state)
+    for i in range(n):
+        remaining = max(0.0, float(state.true_max_bid[i] - state.current_bid[i]))
+        if remaining <= 0:
+            continue
+        batch = RaiseBatch(
+            round_index=round_index,
+            total_rounds=total_rounds,
+            position=positions[i : i + 1],
+            loser_factor=np.array([positions[i] / max(1, n - 1)], dtype=np.float64),
+            current_bid=state.current_bid[i : i + 1],
+            true_max_bid=state.true_max_bid[i : i + 1],
+            remaining=np.array([remaining], dtype=np.float64),
+            noise=rng.uniform(1),
+            rng=rng,
+        )
+        planned = float(state.strategies[state.strategy_index[i]].planned_raise(batch)[0])
+        state.current_bid[i] = round(min(state.current_bid[i] + planned, state.true_max_bid[i]), 2)
+
+
+def time_round(fn, state: AgentArrays, positions: np.ndarray, reps: int) -> float:
+    start_bids = state.current_bid.copy()
+    best = float("inf")
+    for _ in range(reps):
+        state.current_bid[:] = start_bids
+        rng = AuctionRng.from_seed(0)
+        t0 = time.perf_counter()
+        fn(state, positions, 1, 10, rng)
+        best = min(best, time.perf_counter() - t0)
+    state.current_bid[:] = start_bids
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched strategy evaluation.")
+    parser.add_argument("--agents", default="100,1000,10000,100000")
+    parser.add_argument("--reps", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    base = load_config("auction_config.json")
+    print(f"{'agents':>7} {'batched_ms':>11} {'ns/agent':>9} {'per_agent_ms':>13} {'ns/agent':>9} {'speedup':>8}")
+    for n in [int(x) for x in args.agents.split(",")]:
+        state = AgentArrays.from_config(make_config(base, n, 10, args.seed))
+        positions = np.random.default_rng(args.seed).permutation(n)
+
+        t_batch = time_round(apply_raises, state, positions, args.reps)
+        t_agent = time_round(per_agent_round, state, positions, args.reps)
+
+        print(
+            f"{n:>7} {t_batch * 1e3:>11.2f} {t_batch / n * 1e9:>9.0f} "
+            f"{t_agent * 1e3:>13.2f} {t_agent / n * 1e9:>9.0f} {t_agent / t_batch:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
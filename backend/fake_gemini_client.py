@@ -0,0 +1,148 @@
+# fake_gemini_client.py
+#
+# Offline stand-in for google.genai.Client, for benchmarks and local runs
+# without an API key. Only the surface auction_core uses is implemented:
+#   client.models.generate_content(model=..., contents=prompt).text
+#   await client.aio.models.generate_content(model=..., contents=prompt)
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from auction_core import compute_social_score_rule_based
+
+_FIELD_RE = re.compile(r"^- (Name|Country|Profession|Social contribution): (.*)$", re.MULTILINE)
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _FakeModels:
+    def __init__(self, client: "FakeGeminiClient") -> None:
+        self._client = client
+
+    def generate_content(self, model: str, contents: str, **kwargs: Any) -> FakeResponse:
+        return self._client._generate(model, contents)
+
+
+class _FakeAsyncModels:
+    def __init__(self, client: "FakeGeminiClient") -> None:
+        self._client = client
+
+    async def generate_content(self, model: str, contents: str, **kwargs: Any) -> FakeResponse:
+        return await self._client._generate_async(model, contents)
+
+
+class _FakeAio:
+    def __init__(self, client: "FakeGeminiClient") -> None:
+        self.models = _FakeAsyncModels(client)
+
+
+class FakeGeminiClient:
+    """
+    Sleeps `latency_seconds` (+ up to `jitter_seconds`, + `per_profile_seconds`
+    for every profile in the prompt) per request, then answers with the
+    rule-based score of each profile found in the prompt, formatted the way
+    Gemini is asked to answer (an object, or an array for batched prompts).
+
+    `failure_rate` makes a fraction of requests raise and `batch_drop_rate`
+    leaves a fraction of profiles out of batched answers, to exercise the
+    fallback / re-issue paths. `slow_rate` requests take an extra
+    `slow_seconds`, to model Gemini's latency tail.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.2,
+        jitter_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = 0,
+        per_profile_seconds: float = 0.0,
+        batch_drop_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_seconds: float = 0.0,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.failure_rate = failure_rate
+        self.per_profile_seconds = per_profile_seconds
+        self.batch_drop_rate = batch_drop_rate
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.models = _FakeModels(self)
+        self.aio = _FakeAio(self)
+        self.call_count = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self, count_call: bool = True) -> float:
+        with self._lock:
+            if count_call:
+                self.call_count += 1
+            return self._rng.random()
+
+    def _delay(self, u: float, num_profiles: int) -> float:
+        delay = (
+            self.latency_seconds
+            + self.jitter_seconds * u
+            + self.per_profile_seconds * num_profiles
+        )
+        if self.slow_rate and self._draw(count_call=False) < self.slow_rate:
+            delay += self.slow_seconds
+        return delay
+
+    def _generate(self, model: str, contents: str) -> FakeResponse:
+        u = self._draw()
+        profiles = self._parse_profiles(contents)
+        time.sleep(self._delay(u, len(profiles)))
+        return self._respond(u, contents, profiles)
+
+    async def _generate_async(self, model: str, contents: str) -> FakeResponse:
+        u = self._draw()
+        profiles = self._parse_profiles(contents)
+        await asyncio.sleep(self._delay(u, len(profiles)))
+        return self._respond(u, contents, profiles)
+
+    def _respond(self, u: float, contents: str, profiles: List[Dict[str, str]]) -> FakeResponse:
+        if u < self.failure_rate:
+            raise RuntimeError("FakeGeminiClient: simulated request failure")
+        return FakeResponse(self._answer(contents, profiles))
+
+    @staticmethod
+    def _parse_profiles(prompt: str) -> List[Dict[str, str]]:
+        profiles: List[Dict[str, str]] = []
+        for field_name, value in _FIELD_RE.findall(prompt):
+            key = field_name.lower().replace(" ", "_")
+            if key == "name":
+                profiles.append({})
+            if profiles:
+                profiles[-1][key] = value.strip()
+        return profiles
+
+    @staticmethod
+    def _score_item(p: Dict[str, str]) -> Dict[str, Any]:
+        return {
+            "social_score": round(compute_social_score_rule_based(p), 3),
+            "reason": "Fake Gemini: mirrors the rule-based score.",
+        }
+
+    def _answer(self, prompt: str, profiles: List[Dict[str, str]]) -> str:
+        if not profiles:
+            return "I could not find a profile to score."
+        if "JSON array" not in prompt:
+            return json.dumps(self._score_item(profiles[0]))
+
+        items = []
+        for p in profiles:
+            if self.batch_drop_rate and self._draw(count_call=False) < self.batch_drop_rate:
+                continue
+            items.append(dict(name=p.get("name", ""), **self._score_item(p)))
+        return json.dumps(items)
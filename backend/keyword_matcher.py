@@ -0,0 +1,127 @@
+# keyword_matcher.py
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of weighted keywords.
+
+    Built once, then every call finds all keyword occurrences (including
+    overlapping ones, e.g. "children" inside "hungry children") in a single
+    pass over the text, independent of how many keywords there are.
+    Matching is case-sensitive; lower-case text and keywords beforehand.
+
+    For tiny lists (at most `scan_threshold` keywords) a plain `in` scan per
+    keyword runs in C and beats walking the automaton in Python, so that is
+    used instead; results are identical either way.
+    """
+
+    def __init__(self, weights: Mapping[str, float], scan_threshold: int = 32) -> None:
+        self.keywords: List[str] = [kw for kw in weights if kw]
+        self.weights: List[float] = [float(weights[kw]) for kw in self.keywords]
+        self._scan = len(self.keywords) <= scan_threshold
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for idx, kw in enumerate(self.keywords):
+            self._insert(kw, idx)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, idx: int) -> None:
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (idx,)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(ch, 0)
+                self._fail[nxt] = cand if cand != nxt else 0
+                # Fold the suffix state's matches in, so matched_ids() never walks fail links for output.
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def matched_ids(self, text: str) -> Set[int]:
+        """Indices (into self.keywords) of every keyword that occurs in `text`."""
+        if self._scan:
+            return {i for i, kw in enumerate(self.keywords) if kw in text}
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def matches(self, text: str) -> List[str]:
+        """Distinct keywords found in `text`, in keyword-list order."""
+        return [self.keywords[i] for i in sorted(self.matched_ids(text))]
+
+    def score(self, text: str, start: float = 0.0) -> Tuple[float, int]:
+        """
+        `start` plus the weight of every distinct keyword found, added in
+        keyword-list order. Returns (total, number_of_distinct_hits).
+        """
+        ids = sorted(self.matched_ids(text))
+        total = start
+        for i in ids:
+            total += self.weights[i]
+        return total, len(ids)
+
+
+def flatten_keyword_weights(
+    spec: object, default_weight: float
+) -> Dict[str, float]:
+    """
+    Normalize a keyword spec into {keyword: weight}. Accepts a list of
+    keywords (all `default_weight`), {keyword: weight}, or keywords grouped by
+    impact area ({"education": {"school": 0.05}, ...}). Keywords are
+    lower-cased; a keyword listed in several areas keeps its largest |weight|.
+    """
+    flat: Dict[str, float] = {}
+
+    def add(keyword: str, weight: float) -> None:
+        keyword = keyword.strip().lower()
+        if keyword and (keyword not in flat or abs(weight) > abs(flat[keyword])):
+            flat[keyword] = weight
+
+    def walk(node: object) -> None:
+        if isinstance(node, Mapping):
+            for key, value in node.items():
+                if isinstance(value, (Mapping, list, tuple)):
+                    walk(value)
+                else:
+                    add(str(key), float(value) if value is not None else default_weight)
+        elif isinstance(node, Iterable) and not isinstance(node, str):
+            for keyword in node:
+                add(str(keyword), default_weight)
+
+    walk(spec)
+    return flat
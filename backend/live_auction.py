@@ -0,0 +1,384 @@
+# live_auction.py
+#
+# Event-driven auction: bids arrive one at a time via place_bid() and the
+# ranking is maintained incrementally in an order-statistic treap, so
+# "current leader", "rank of X" and "top-k" are O(log N) (+k) instead of a
+# full rank_profiles() per bid.
+#
+# Money scores are min-max normalized, so a bid that moves the overall
+# min or max bid changes every bidder's final score. That case marks the
+# index stale and the next query rebuilds it in bulk (vectorized rescore +
+# one argsort), answering from the sorted order until a bid that leaves
+# min/max alone needs the treap (O(N) build, then a single O(log N)
+# delete + insert per such bid). A bidder who keeps moving the max pays
+# one argsort per query, never a treap build.
+#
+# Min / max bid come from two heaps with lazy deletion (each bid pushes a new
+# entry; stale ones are skipped when they reach the top). A bidder who keeps
+# raising stays on top of the max heap, so its old entries never surface;
+# once the heaps hold more than 2x one entry per bidder they are rebuilt
+# from the current bids (O(N), amortized O(1) per bid).
+
+from __future__ import annotations
+
+import heapq
+import random
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from auction_core import Profile, SocialScores
+
+Key = Tuple[float, int]  # (-round(final_score, 3), bidder index): same order as rank_columns()
+
+
+# ---------- Order-statistic treap ----------
+
+class _Node:
+    __slots__ = ("key", "prio", "left", "right", "size")
+
+    def __init__(self, key: Key, prio: float) -> None:
+        self.key = key
+        self.prio = prio
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.size = 1
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _update(node: _Node) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _split(node: Optional[_Node], key: Key) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """(< key, >= key)"""
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        _update(node)
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    _update(node)
+    return left, node
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """All keys in `a` are < all keys in `b`."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+class OrderStatisticTreap:
+    """Treap keyed by unique, comparable keys, with subtree sizes for rank / k-th queries."""
+
+    def __init__(self, seed: Optional[int] = 0) -> None:
+        self.root: Optional[_Node] = None
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def insert(self, key: Key) -> None:
+        left, right = _split(self.root, key)
+        self.root = _merge(_merge(left, _Node(key, self._rng.random())), right)
+
+    def remove(self, key: Key) -> None:
+        parent: Optional[_Node] = None
+        node = self.root
+        path: List[_Node] = []
+        while node is not None and node.key != key:
+            path.append(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+        if node is None:
+            raise KeyError(key)
+        replacement = _merge(node.left, node.right)
+        if parent is None:
+            self.root = replacement
+        elif parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        for ancestor in path:
+            ancestor.size -= 1
+
+    def rank(self, key: Key) -> int:
+        """Number of keys < `key` (0 = first)."""
+        node = self.root
+        count = 0
+        while node is not None:
+            if key <= node.key:
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+
+    def kth(self, k: int) -> Key:
+        node = self.root
+        if not 0 <= k < _size(node):
+            raise IndexError("rank out of range")
+        while node is not None:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.key
+            else:
+                k -= left + 1
+                node = node.right
+        raise IndexError("rank out of range")  # unreachable with consistent sizes
+
+    def iter_keys(self, limit: Optional[int] = None) -> Iterator[Key]:
+        """In-order keys, smallest first, stopping after `limit`."""
+        stack: List[_Node] = []
+        node = self.root
+        produced = 0
+        while (stack or node is not None) and (limit is None or produced < limit):
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            produced += 1
+            node = node.right
+
+    def build_sorted(self, keys: Sequence[Key]) -> None:
+        """Replace the contents with already-sorted `keys` in O(N) (Cartesian-tree build)."""
+        rand = self._rng.random
+        stack: List[_Node] = []
+        for key in keys:
+            node = _Node(key, rand())
+            last: Optional[_Node] = None
+            while stack and stack[-1].prio < node.prio:
+                last = stack.pop()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        self.root = stack[0] if stack else None
+        self._fix_sizes()
+
+    def _fix_sizes(self) -> None:
+        if self.root is None:
+            return
+        order: List[_Node] = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        for node in reversed(order):
+            _update(node)
+
+
+# ---------- Live auction ----------
+
+class LiveAuction:
+    """
+    Continuously ranked auction over a fixed set of bidders.
+
+    Ordering, money / final scores and row dicts are exactly what
+    rank_columns() would produce for the current bids; social scores are
+    fixed per bidder (compute them once with compute_social_scores()).
+    """
+
+    def __init__(
+        self,
+        profiles: Sequence[Profile],
+        social_scores: SocialScores,
+        weight_social: float = 0.7,
+        weight_money: float = 0.3,
+        seed: Optional[int] = 0,
+    ) -> None:
+        if not profiles:
+            raise ValueError("No profiles provided")
+        self.weight_social = weight_social
+        self.weight_money = weight_money
+        self.profiles = list(profiles)
+        self.names = [p["name"] for p in self.profiles]
+        self._index = {name: i for i, name in enumerate(self.names)}
+        if len(self._index) != len(self.names):
+            raise ValueError("Bidder names must be unique")
+
+        self.bids = np.array([float(p.get("max_bid", 0.0)) for p in self.profiles], dtype=np.float64)
+        self.social = np.clip(
+            np.array([social_scores[name][0] for name in self.names], dtype=np.float64), 0.0, 1.0
+        )
+        self.reasons = [social_scores[name][1] for name in self.names]
+
+        self._tree = OrderStatisticTreap(seed)
+        self._keys: List[Key] = []
+        self._min_heap: List[Tuple[float, int]] = []
+        self._max_heap: List[Tuple[float, int]] = []
+        self._rebuild_heaps()
+        self._lo, self._hi = self._current_min_max()
+        self._dirty = True  # scores need a bulk rescore
+        self._tree_stale = True  # _order / _positions are current, the treap is not
+        self._neg_rounded = np.empty(0)
+        self._order = np.empty(0, dtype=np.intp)
+        self._positions = np.empty(0, dtype=np.intp)
+
+        self.bids_placed = 0
+        self.incremental_updates = 0
+        self.rebuilds = 0
+        self.tree_builds = 0
+        self.heap_rebuilds = 0
+
+    # --- bids ---
+
+    def place_bid(self, name: str, amount: float) -> None:
+        i = self._index[name]
+        amount = float(amount)
+        if not np.isfinite(amount) or amount < 0:
+            raise ValueError(f"Invalid bid amount: {amount!r}")
+        self.bids_placed += 1
+        if amount == self.bids[i]:
+            return
+
+        self.bids[i] = amount
+        if len(self._max_heap) >= 2 * len(self.bids) or len(self._min_heap) >= 2 * len(self.bids):
+            self._rebuild_heaps()
+            self.heap_rebuilds += 1
+        else:
+            heapq.heappush(self._min_heap, (amount, i))
+            heapq.heappush(self._max_heap, (-amount, i))
+
+        lo, hi = self._current_min_max()
+        if lo != self._lo or hi != self._hi:
+            # Every money score moved: defer to one bulk rescore on the next query.
+            self._lo, self._hi = lo, hi
+            self._dirty = True
+            return
+        if self._dirty:
+            return
+
+        self._ensure_tree()
+        self._tree.remove(self._keys[i])
+        self._keys[i] = self._key(i)
+        self._tree.insert(self._keys[i])
+        self.incremental_updates += 1
+
+    def _rebuild_heaps(self) -> None:
+        """One entry per bidder, from the current bids (drops every stale entry)."""
+        bids = self.bids.tolist()
+        self._min_heap = [(b, i) for i, b in enumerate(bids)]
+        self._max_heap = [(-b, i) for i, b in enumerate(bids)]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+
+    def _current_min_max(self) -> Tuple[float, float]:
+        # Lazy deletion: drop heap entries whose bid has since changed.
+        bids = self.bids
+        while bids[self._min_heap[0][1]] != self._min_heap[0][0]:
+            heapq.heappop(self._min_heap)
+        while bids[self._max_heap[0][1]] != -self._max_heap[0][0]:
+            heapq.heappop(self._max_heap)
+        return self._min_heap[0][0], -self._max_heap[0][0]
+
+    # --- scoring ---
+
+    def _money(self, i: int) -> float:
+        if self._hi == self._lo:
+            return 1.0
+        return min(max((self.bids[i] - self._lo) / (self._hi - self._lo), 0.0), 1.0)
+
+    def _final(self, i: int) -> float:
+        return self.weight_social * float(self.social[i]) + self.weight_money * float(self._money(i))
+
+    def _key(self, i: int) -> Key:
+        return (-float(np.round(self._final(i), 3)), i)
+
+    def _rebuild(self) -> None:
+        if self._hi == self._lo:
+            money = np.ones_like(self.bids)
+        else:
+            money = np.clip((self.bids - self._lo) / (self._hi - self._lo), 0.0, 1.0)
+        self._neg_rounded = -np.round(self.weight_social * self.social + self.weight_money * money, 3)
+        self._order = np.argsort(self._neg_rounded, kind="stable")
+        self._positions = np.empty_like(self._order)
+        self._positions[self._order] = np.arange(len(self._order))
+        self._dirty = False
+        self._tree_stale = True
+        self.rebuilds += 1
+
+    def _ensure_tree(self) -> None:
+        if not self._tree_stale:
+            return
+        neg_list = self._neg_rounded.tolist()
+        self._keys = [(neg_list[i], i) for i in range(len(neg_list))]
+        self._tree.build_sorted([self._keys[i] for i in self._order.tolist()])
+        self._tree_stale = False
+        self.tree_builds += 1
+
+    def _fresh(self) -> Optional[OrderStatisticTreap]:
+        """The treap if it is current, else None (answer from _order / _positions)."""
+        if self._dirty:
+            self._rebuild()
+        return None if self._tree_stale else self._tree
+
+    # --- queries ---
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        bid = float(self.bids[i])
+        profile = dict(self.profiles[i])
+        profile["start_bid"] = bid
+        profile["max_bid"] = bid
+        return {
+            "name": self.names[i],
+            "money_score": round(float(self._money(i)), 3),
+            "social_score": round(float(self.social[i]), 3),
+            "final_score": round(self._final(i), 3),
+            "social_reason": self.reasons[i],
+            "profile": profile,
+        }
+
+    def leader(self) -> Dict[str, Any]:
+        tree = self._fresh()
+        return self._row(int(self._order[0]) if tree is None else tree.kth(0)[1])
+
+    def rank_of(self, name: str) -> int:
+        """0-based position of `name` in the current ranking."""
+        i = self._index[name]
+        tree = self._fresh()
+        return int(self._positions[i]) if tree is None else tree.rank(self._keys[i])
+
+    def top_k(self, k: int) -> List[Dict[str, Any]]:
+        tree = self._fresh()
+        if tree is None:
+            return [self._row(i) for i in self._order[: max(k, 0)].tolist()]
+        return [self._row(key[1]) for key in tree.iter_keys(limit=k)]
+
+    def ranking(self) -> List[Dict[str, Any]]:
+        return self.top_k(len(self.names))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "bidders": len(self.names),
+            "bids_placed": self.bids_placed,
+            "incremental_updates": self.incremental_updates,
+            "rebuilds": self.rebuilds,
+            "tree_builds": self.tree_builds,
+            "heap_rebuilds": self.heap_rebuilds,
+            "heap_entries": len(self._min_heap) + len(self._max_heap),
+            "min_bid": self._lo,
+            "max_bid": self._hi,
+        }
@@ -2,32 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-
-from auction_core import rank_profiles, Profile  # import from the other file
+from typing import List, Dict, Any, Callable, Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from auction_core import (  # import from the other file
+    GeminiScoringOptions,
+    compute_social_scores,
+    compute_social_scores_async,
+    rank_columns,
+    rule_keywords_from_config,
+    Profile,
+    SocialScores,
+)
+from agent_history import AgentHistoryStore, AgentHistoryView
+from auction_rng import AuctionRng
+from auction_strategies import BatchStrategy, build_strategy, plan_raises
+from rag_index import RagIndex
 
 # Config loading + RAG index
 
 def load_config(path: str = "auction_config.json") -> Dict[str, Any]:
+    """
+    Read the JSON config. A relative gemini.cache_path is resolved against
+    the config file's directory, so the cache lands in the same place
+    whichever directory the server or CLI was started from.
+    """
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        config = json.load(f)
+    gemini_cfg = config.get("gemini") or {}
+    cache_path = gemini_cfg.get("cache_path")
+    if cache_path and cache_path != ":memory:":
+        config_dir = os.path.dirname(os.path.abspath(path))
+        gemini_cfg["cache_path"] = os.path.join(config_dir, cache_path)
+    return config
 
 
-def build_rag_index(config: Dict[str, Any]) -> Dict[str, List[str]]:
-    index: Dict[str, List[str]] = {}
-    for doc in config.get("rag_docs", []):
-        name = doc.get("name")
-        text = (doc.get("text") or "").strip()
-        if not name or not text:
-            continue
-        index.setdefault(name, []).append(text)
-    return index
+def build_rag_index(config: Dict[str, Any]) -> RagIndex:
+    """
+    BM25 index over config["rag_docs"], built once per config. It still maps
+    name -> [doc, ...], but prompts only get the top-k rubric-relevant
+    passages within config["rag"]["token_budget"].
+    """
+    return RagIndex.from_config(config)
 
 
 # Agent + Auction data structures
 
+# MultiRoundAuctionResult.stop_reason values
+STOP_NUM_ROUNDS = "num_rounds"
+STOP_ALL_CAPPED = "all_capped"
+STOP_STABLE_RANKING = "stable_ranking"
+STOP_LEADER_UNBEATABLE = "leader_unbeatable"
+
+
 @dataclass
 class Agent:
     name: str
@@ -36,13 +68,17 @@ class Agent:
     true_max_bid: float
     strategy: str
     strategy_params: Dict[str, Any]
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    # A plain list, or a view into a shared AgentHistoryStore (same API).
+    history: Union[List[Dict[str, Any]], AgentHistoryView] = field(default_factory=list)
+    # Built from strategy / strategy_params on first use (see auction_strategies).
+    raise_strategy: Optional[BatchStrategy] = field(default=None, repr=False, compare=False)
 
     def decide_raise(
         self,
         round_index: int,
         total_rounds: int,
         last_ranking: Optional[List[Dict[str, Any]]],
+        rng: AuctionRng,
     ) -> None:
         # Determine position from last ranking: 0 = best
         position = None
@@ -58,48 +94,87 @@ class Agent:
             position = 0
 
         num_agents = len(last_ranking) if last_ranking else 1
-        if num_agents > 1:
-            loser_factor = position / (num_agents - 1)
-        else:
-            loser_factor = 0.0
-
-        remaining = max(0.0, self.true_max_bid - self.current_bid)
-        if remaining <= 0:
-            self.history.append(
+        strategy = self.raise_strategy
+        if strategy is None:
+            strategy = self.raise_strategy = build_strategy(self.strategy, self.strategy_params)
+
+        # A batch of one; the auction engines pass every agent of a strategy at once.
+        raise_agents(
+            [self],
+            ([strategy], [np.zeros(1, dtype=np.intp)]),
+            np.array([position]),
+            round_index,
+            total_rounds,
+            rng,
+            num_ranked=num_agents,
+        )
+
+
+def strategy_groups(agents: List[Agent]) -> Tuple[List[BatchStrategy], List[np.ndarray]]:
+    """(one strategy per strategy name, indices of the agents using it), in first-seen order."""
+    strategies: List[BatchStrategy] = []
+    members: List[List[int]] = []
+    lookup: Dict[str, int] = {}
+    for i, agent in enumerate(agents):
+        s = lookup.get(agent.strategy)
+        if s is None:
+            s = lookup[agent.strategy] = len(strategies)
+            if agent.raise_strategy is None:
+                agent.raise_strategy = build_strategy(agent.strategy, agent.strategy_params)
+            strategies.append(agent.raise_strategy)
+            members.append([])
+        members[s].append(i)
+    return strategies, [np.array(m, dtype=np.intp) for m in members]
+
+
+def raise_agents(
+    agents: List[Agent],
+    groups: Tuple[List[BatchStrategy], List[np.ndarray]],
+    positions: np.ndarray,
+    round_index: int,
+    total_rounds: int,
+    rng: AuctionRng,
+    num_ranked: Optional[int] = None,
+) -> None:
+    """
+    One round of raises for `agents`: auction_strategies.plan_raises() calls
+    each strategy once (`groups` from strategy_groups()), then every agent
+    gets its history entry and new current_bid from the batched plan.
+    """
+    strategies, members = groups
+    plan = plan_raises(
+        strategies,
+        members,
+        positions,
+        np.fromiter((a.current_bid for a in agents), dtype=np.float64, count=len(agents)),
+        np.fromiter((a.true_max_bid for a in agents), dtype=np.float64, count=len(agents)),
+        round_index,
+        total_rounds,
+        rng,
+        num_ranked=num_ranked,
+    )
+
+    rows = zip(
+        agents,
+        plan.raising.tolist(),
+        positions.tolist(),
+        plan.loser_factor.tolist(),
+        plan.remaining.tolist(),
+        plan.planned_raise.tolist(),
+        plan.new_bid.tolist(),
+    )
+    for agent, raising, position, loser_factor, remaining, planned_raise, new_bid in rows:
+        if not raising:
+            agent.history.append(
                 {
                     "round": round_index,
                     "action": "no_raise",
                     "reason": "reached true_max_bid",
-                    "current_bid": self.current_bid,
+                    "current_bid": agent.current_bid,
                 }
             )
-            return
-
-        rounds_left = max(1, total_rounds - round_index)
-
-        base_fraction = float(self.strategy_params["base_fraction"])
-        rand_min = float(self.strategy_params["rand_min"])
-        rand_max = float(self.strategy_params["rand_max"])
-        loser_factor_min = float(self.strategy_params["loser_factor_min"])
-        loser_factor_max = float(self.strategy_params["loser_factor_max"])
-
-        loser_influence = loser_factor_min + (loser_factor_max - loser_factor_min) * loser_factor
-
-        import random
-        raise_fraction = base_fraction * loser_influence
-        noise = random.uniform(rand_min, rand_max)
-        raise_fraction *= noise
-
-        planned_raise = remaining * raise_fraction
-        planned_raise = min(planned_raise, remaining / rounds_left)
-
-        new_bid = self.current_bid + planned_raise
-        if new_bid > self.true_max_bid:
-            new_bid = self.true_max_bid
-
-        new_bid = round(new_bid, 2)
-
-        self.history.append(
+            continue
+        agent.history.append(
             {
                 "round": round_index,
                 "position": position,
@@ -107,10 +182,20 @@ class Agent:
                 "remaining_before": round(remaining, 2),
                 "planned_raise": round(planned_raise, 2),
                 "new_bid": new_bid,
-                "strategy": self.strategy,
+                "strategy": agent.strategy,
             }
         )
-        self.current_bid = new_bid
+        agent.current_bid = new_bid
+
+
+def _ranking_positions(ranking: Any, names: List[str], unique_names: bool) -> np.ndarray:
+    """Each agent's rank in `ranking` (0 = best); a shared name takes its first row, as decide_raise does."""
+    if unique_names:
+        return ranking.positions()
+    first: Dict[str, int] = {}
+    for rank, i in enumerate(ranking.order.tolist()):
+        first.setdefault(names[i], rank)
+    return np.array([first[name] for name in names], dtype=np.intp)
 
 
 @dataclass
@@ -118,6 +203,8 @@ class AuctionRoundResult:
     round_index: int
     ranking: List[Dict[str, Any]]
     winner: Dict[str, Any]
+    # Set on the last round only: why the auction ended after it.
+    stop_reason: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -149,17 +236,189 @@ class MultiRoundAuctionResult:
     rounds: List[AuctionRoundResult]
     final_winner: Dict[str, Any]
     social_mode: str
+    stop_reason: str = STOP_NUM_ROUNDS
+    rounds_played: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "social_mode": self.social_mode,
             "final_winner": self.final_winner,
+            "stop_reason": self.stop_reason,
+            "rounds_played": self.rounds_played,
             "rounds": [r.to_dict() for r in self.rounds],
         }
 
+# Stopping rules
+
+@dataclass
+class StoppingRules:
+    """
+    Early-termination rules, from config["auction_params"]["stopping"].
+    All are off by default, so an auction runs exactly num_rounds rounds.
+
+    - all_capped: every agent is at true_max_bid, so no later round can differ.
+    - stable_rounds: stop once the ranking order was unchanged for this many
+      consecutive rounds (0 = off).
+    - leader_unbeatable: stop once no challenger can overtake the leader even
+      if every remaining bid went to its cap (the winner is then decided; the
+      clearing bid is the leader's bid at that round).
+    """
+
+    all_capped: bool = False
+    stable_rounds: int = 0
+    leader_unbeatable: bool = False
+
+    @classmethod
+    def from_config(cls, stopping_cfg: Optional[Dict[str, Any]]) -> "StoppingRules":
+        stopping_cfg = stopping_cfg or {}
+        return cls(
+            all_capped=bool(stopping_cfg.get("all_capped", False)),
+            stable_rounds=int(stopping_cfg.get("stable_rounds", 0) or 0),
+            leader_unbeatable=bool(stopping_cfg.get("leader_unbeatable", False)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.all_capped or self.stable_rounds > 0 or self.leader_unbeatable
+
+
+def leader_is_unbeatable(
+    ranking: Any,
+    cap_low: float,
+    cap_high: float,
+    weight_social: float,
+    weight_money: float,
+) -> bool:
+    """
+    True if the current leader stays first for any future bids, given bids
+    never fall and never exceed true_max_bid (cap_low / cap_high are the
+    smallest and largest true_max_bid). `ranking` is a RankingView.
+
+    The leader's money score can't drop below
+        (b_L - cap_low) / (cap_high - min(current bids))
+    and a challenger's can't exceed 1, so the leader is safe when its
+    worst-case final score beats every challenger's best case by more than
+    the 3-decimal rounding used for ordering.
+    """
+    if len(ranking) < 2:
+        return True
+    bids = ranking.bids
+    social = ranking.social_scores
+    leader = int(ranking.order[0])
+
+    spread = cap_high - float(bids.min())
+    if spread > 0:
+        money_lb = max(0.0, (float(bids[leader]) - cap_low) / spread)
+    else:
+        money_lb = 1.0
+    leader_social = float(social[leader])
+    leader_lb = weight_social * leader_social + weight_money * money_lb
+
+    best_social = float(social.max())
+    if best_social <= leader_social:
+        others = social.copy()
+        others[leader] = -np.inf
+        best_social = float(others.max())
+    best_challenger = weight_social * best_social + weight_money * 1.0
+    return best_challenger + 1e-3 < leader_lb
+
+
+class ConvergenceTracker:
+    """Applies StoppingRules round by round; check() returns a STOP_* reason or None."""
+
+    def __init__(
+        self,
+        rules: StoppingRules,
+        true_max_bids: np.ndarray,
+        weight_social: float,
+        weight_money: float,
+    ) -> None:
+        self.rules = rules
+        self.true_max_bids = true_max_bids
+        self._cap_low = float(true_max_bids.min()) if len(true_max_bids) else 0.0
+        self._cap_high = float(true_max_bids.max()) if len(true_max_bids) else 0.0
+        self.weight_social = weight_social
+        self.weight_money = weight_money
+        self._last_order: Optional[np.ndarray] = None
+        self._stable = 0
+
+    def check(self, ranking: Any) -> Optional[str]:
+        rules = self.rules
+        if not rules.enabled:
+            return None
+
+        if rules.all_capped and bool(np.all(ranking.bids >= self.true_max_bids)):
+            return STOP_ALL_CAPPED
+
+        if rules.stable_rounds > 0:
+            order = ranking.order
+            if self._last_order is not None and np.array_equal(order, self._last_order):
+                self._stable += 1
+            else:
+                self._stable = 0
+            self._last_order = order
+            if self._stable >= rules.stable_rounds:
+                return STOP_STABLE_RANKING
+
+        if rules.leader_unbeatable and leader_is_unbeatable(
+            ranking, self._cap_low, self._cap_high, self.weight_social, self.weight_money
+        ):
+            return STOP_LEADER_UNBEATABLE
+
+        return None
+
+    def state(self) -> Tuple[Optional[List[int]], int]:
+        last = None if self._last_order is None else self._last_order.tolist()
+        return last, self._stable
+
+    def restore(self, last_order: Optional[List[int]], stable: int) -> None:
+        self._last_order = None if last_order is None else np.asarray(last_order, dtype=np.intp)
+        self._stable = stable
+
+
+@dataclass
+class ResumePoint:
+    """
+    Everything needed to continue an auction deterministically: round
+    `round_index` has been ranked and handed out, its raises have not been
+    applied yet. `rng_state` is the auction's AuctionRng.getstate().
+    """
+
+    round_index: int
+    bids: List[float]
+    rng_state: Any
+    last_order: Optional[List[int]] = None
+    stable_rounds: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "round_index": self.round_index,
+            "bids": self.bids,
+            "rng_state": self.rng_state,
+            "last_order": self.last_order,
+            "stable_rounds": self.stable_rounds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResumePoint":
+        return cls(
+            round_index=int(data["round_index"]),
+            bids=[float(b) for b in data["bids"]],
+            rng_state=data["rng_state"],
+            last_order=data.get("last_order"),
+            stable_rounds=int(data.get("stable_rounds", 0)),
+        )
+
 # Agent preparation
 
-def prepare_agents_from_config(config: Dict[str, Any]) -> List[Agent]:
+def prepare_agents_from_config(
+    config: Dict[str, Any],
+    history: Optional[AgentHistoryStore] = None,
+) -> List[Agent]:
+    """
+    Build the agents for `config`. With `history`, each Agent.history is a
+    view into that columnar store instead of a list of dicts.
+    """
     auction_params = config["auction_params"]
     buyer_name = auction_params["buyer_name"]
     track_min_bid = float(auction_params["track_min_bid"])
@@ -169,6 +428,7 @@ def prepare_agents_from_config(config: Dict[str, Any]) -> List[Agent]:
     agents_config = config["agents"]
 
     agents: List[Agent] = []
+    strategies: Dict[str, BatchStrategy] = {}
 
     for p in agents_config:
         name = p["name"]
@@ -183,6 +443,9 @@ def prepare_agents_from_config(config: Dict[str, Any]) -> List[Agent]:
         if start_bid > max_bid:
             start_bid = max_bid
 
+        if strategy not in strategies:
+            strategies[strategy] = build_strategy(strategy, strategy_params_map[strategy])
+
         agents.append(
             Agent(
                 name=name,
@@ -191,9 +454,14 @@ def prepare_agents_from_config(config: Dict[str, Any]) -> List[Agent]:
                 true_max_bid=max_bid,
                 strategy=strategy,
                 strategy_params=strategy_params_map[strategy],
+                raise_strategy=strategies[strategy],
             )
         )
 
+    if history is not None:
+        for i, agent in enumerate(agents):
+            agent.history = history.view(i)
+
     return agents
 
 
@@ -212,79 +480,244 @@ def _round_profiles_for_agents(agents: List[Agent]) -> List[Profile]:
         round_profiles.append(prof)
     return round_profiles
 
+def compute_agent_social_scores(
+    config: Dict[str, Any],
+    agents: List[Agent],
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+) -> Tuple[SocialScores, str]:
+    """
+    Social scores only depend on each agent's base_profile (never on bids),
+    so they are computed once per auction and reused for every round.
+    """
+    gemini_cfg = config.get("gemini", {})
+    if rag_index is None:
+        rag_index = build_rag_index(config)
+    return compute_social_scores(
+        [agent.base_profile for agent in agents],
+        use_gemini=bool(gemini_cfg.get("enabled", True)),
+        rag_index=rag_index,
+        model_name=gemini_cfg.get("model", "gemini-2.5-flash"),
+        gemini_options=GeminiScoringOptions.from_config(gemini_cfg),
+        rule_keywords=rule_keywords_from_config(config.get("rule_based")),
+    )
+
+async def compute_agent_social_scores_async(
+    config: Dict[str, Any],
+    agents: List[Agent],
+    rag_index: Optional[Mapping[str, List[str]]] = None,
+    gemini_options: Optional[GeminiScoringOptions] = None,
+) -> Tuple[SocialScores, str]:
+    """
+    compute_agent_social_scores() for event-loop callers: Gemini calls are
+    awaited and building the RAG index runs in a worker thread.
+    """
+    gemini_cfg = config.get("gemini", {})
+    if rag_index is None:
+        rag_index = await asyncio.to_thread(build_rag_index, config)
+    return await compute_social_scores_async(
+        [agent.base_profile for agent in agents],
+        use_gemini=bool(gemini_cfg.get("enabled", True)),
+        rag_index=rag_index,
+        model_name=gemini_cfg.get("model", "gemini-2.5-flash"),
+        gemini_options=gemini_options or GeminiScoringOptions.from_config(gemini_cfg),
+        rule_keywords=rule_keywords_from_config(config.get("rule_based")),
+    )
+
 # Multi-round auction runner
 
-def run_multi_round_auction(config: Dict[str, Any]) -> MultiRoundAuctionResult:
+def _winner_summary(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": entry["name"],
+        "final_score": entry["final_score"],
+        "money_score": entry["money_score"],
+        "social_score": entry["social_score"],
+        "bid": entry["profile"]["max_bid"],
+        "social_reason": entry["social_reason"],
+    }
+
+
+def _resolve_social_mode(config: Dict[str, Any], social_mode: Optional[str]) -> str:
+    use_gemini_flag = bool(config.get("gemini", {}).get("enabled", True))
+    return social_mode or ("gemini" if use_gemini_flag else "rule-based")
+
+
+def iter_multi_round_auction(
+    config: Dict[str, Any],
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+    history: Optional[AgentHistoryStore] = None,
+    resume: Optional[ResumePoint] = None,
+    on_round: Optional[Callable[[AuctionRoundResult, ResumePoint], None]] = None,
+    rng: Optional[AuctionRng] = None,
+) -> Iterator[AuctionRoundResult]:
+    """
+    Yield each round's AuctionRoundResult as soon as it is ranked. The last
+    one carries stop_reason (num_rounds, or the StoppingRules rule that fired).
+
+    Nothing is kept once the next round starts, so memory stays flat in
+    num_rounds as long as the consumer drops rounds it has handled. For the
+    same reason each Agent.history only holds its latest action, unless a
+    `history` store (see agent_history.new_history_store) is passed to
+    record every action compactly. Social scores are computed on the first
+    next() unless given.
+
+    `on_round(round_result, resume_point)` is called before each round is
+    yielded, e.g. to checkpoint it; passing that ResumePoint back as `resume`
+    continues with the next round exactly as the original run would have.
+
+    All randomness comes from `rng` (by default AuctionRng.from_config() on
+    auction_params), never the global `random` module, so concurrent
+    auctions in one process don't disturb each other.
+    """
     auction_params = config["auction_params"]
     num_rounds = int(auction_params["num_rounds"])
     weight_money = float(auction_params["money_weight"])
     weight_social = float(auction_params["social_weight"])
 
-    gemini_cfg = config.get("gemini", {})
-    model_name = gemini_cfg.get("model", "gemini-2.5-flash")
-    use_gemini_flag = bool(gemini_cfg.get("enabled", True))
+    if rng is None:
+        rng = AuctionRng.from_config(auction_params)
 
-    seed = auction_params.get("random_seed", None)
-    if seed is not None:
-        import random
-        random.seed(seed)
+    agents = prepare_agents_from_config(config, history)
 
-    rag_index = build_rag_index(config)
-    agents = prepare_agents_from_config(config)
+    if social_scores is None:
+        social_scores, social_mode = compute_agent_social_scores(config, agents)
+    mode = _resolve_social_mode(config, social_mode)
 
-    rounds: List[AuctionRoundResult] = []
-    social_mode: Optional[str] = None
-    final_winner: Optional[Dict[str, Any]] = None
-    last_ranking: Optional[List[Dict[str, Any]]] = None
+    names = [agent.name for agent in agents]
+    unique_names = len(set(names)) == len(names)
+    groups = strategy_groups(agents)
+    social_column = np.fromiter(
+        (social_scores[name][0] for name in names), dtype=np.float64, count=len(names)
+    )
+    reason_column = [social_scores[name][1] for name in names]
+
+    tracker = ConvergenceTracker(
+        StoppingRules.from_config(auction_params.get("stopping")),
+        np.fromiter((agent.true_max_bid for agent in agents), dtype=np.float64, count=len(agents)),
+        weight_social,
+        weight_money,
+    )
+
+    first_round = 1
+    if resume is not None:
+        for agent, bid in zip(agents, resume.bids):
+            agent.current_bid = bid
+        rng.setstate(resume.rng_state)
+        tracker.restore(resume.last_order, resume.stable_rounds)
+        first_round = resume.round_index
 
-    for r in range(1, num_rounds + 1):
+    for r in range(first_round, num_rounds + 1):
         round_profiles = _round_profiles_for_agents(agents)
+        bids = np.fromiter(
+            (agent.current_bid for agent in agents), dtype=np.float64, count=len(agents)
+        )
 
-        result = rank_profiles(
-            round_profiles,
-            use_gemini=use_gemini_flag,
-            rag_index=rag_index,
+        result = rank_columns(
+            names,
+            bids,
+            social_column,
+            reason_column,
+            mode,
+            profiles=round_profiles,
             weight_social=weight_social,
             weight_money=weight_money,
-            model_name=model_name,
         )
 
-        if social_mode is None:
-            social_mode = result["social_mode"]
-
-        round_ranking = result["ranking"]
-        round_winner = result["winner"]
-
-        rounds.append(
-            AuctionRoundResult(
+        last_ranking = result["ranking"]
+        # A resumed round was already handed out; only its raises are left.
+        if resume is None or r != resume.round_index:
+            stop_reason = STOP_NUM_ROUNDS if r == num_rounds else tracker.check(last_ranking)
+            round_result = AuctionRoundResult(
                 round_index=r,
-                ranking=round_ranking,
-                winner=round_winner,
+                ranking=last_ranking,
+                winner=result["winner"],
+                stop_reason=stop_reason,
             )
-        )
-        final_winner = round_winner
-        last_ranking = round_ranking
+            if on_round is not None:
+                last_order, stable = tracker.state()
+                on_round(
+                    round_result,
+                    ResumePoint(
+                        round_index=r,
+                        bids=bids.tolist(),
+                        rng_state=rng.getstate(),
+                        last_order=last_order,
+                        stable_rounds=stable,
+                    ),
+                )
+            yield round_result
+            if stop_reason is not None:
+                return
 
         if r < num_rounds:
-            for agent in agents:
-                agent.decide_raise(
-                    round_index=r,
-                    total_rounds=num_rounds,
-                    last_ranking=last_ranking,
-                )
+            positions = _ranking_positions(last_ranking, names, unique_names)
+            raise_agents(agents, groups, positions, r, num_rounds, rng)
+            if history is None:
+                for agent in agents:
+                    del agent.history[:-1]
+
+
+def stream_multi_round_auction(
+    config: Dict[str, Any],
+    sink: Callable[[AuctionRoundResult], None],
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+    rng: Optional[AuctionRng] = None,
+    history: Optional[AgentHistoryStore] = None,
+) -> MultiRoundAuctionResult:
+    """
+    Run the auction, handing every round to `sink` (persist, forward to a
+    UI, ...) instead of keeping it. The returned result has the final
+    winner and an empty `rounds` list. Pass a `history` store to keep every
+    agent's full history (see iter_multi_round_auction()).
+    """
+    if social_scores is None:
+        social_scores, social_mode = compute_agent_social_scores(
+            config, prepare_agents_from_config(config)
+        )
+
+    final_winner: Optional[Dict[str, Any]] = None
+    stop_reason = STOP_NUM_ROUNDS
+    rounds_played = 0
+    rounds = iter_multi_round_auction(config, social_scores, social_mode, history=history, rng=rng)
+    for round_result in rounds:
+        final_winner = _winner_summary(round_result.winner)
+        stop_reason = round_result.stop_reason or stop_reason
+        rounds_played = round_result.round_index
+        sink(round_result)
 
     return MultiRoundAuctionResult(
-        rounds=rounds,
-        final_winner={
-            "name": final_winner["name"],
-            "final_score": final_winner["final_score"],
-            "money_score": final_winner["money_score"],
-            "social_score": final_winner["social_score"],
-            "bid": final_winner["profile"]["max_bid"],
-            "social_reason": final_winner["social_reason"],
-        },
-        social_mode=social_mode or ("gemini" if use_gemini_flag else "rule-based"),
+        rounds=[],
+        final_winner=final_winner,
+        social_mode=_resolve_social_mode(config, social_mode),
+        stop_reason=stop_reason,
+        rounds_played=rounds_played,
+    )
+
+
+def run_multi_round_auction(
+    config: Dict[str, Any],
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+    rng: Optional[AuctionRng] = None,
+    history: Optional[AgentHistoryStore] = None,
+) -> MultiRoundAuctionResult:
+    """
+    Run the full multi-round auction described by `config`.
+
+    Social scores are computed once up front (or taken from `social_scores`,
+    e.g. a cache shared across many runs); each round only re-ranks money.
+    Noise comes from `rng`, or a fresh AuctionRng seeded from
+    auction_params["random_seed"]. Every agent's full raise history is
+    recorded in `history` (agent_history.new_history_store()) when given;
+    agent i's is history.view(i).
+    """
+    rounds: List[AuctionRoundResult] = []
+    result = stream_multi_round_auction(
+        config, rounds.append, social_scores, social_mode, rng, history
     )
+    result.rounds = rounds
+    return result
 
 # CLI demo – reads EVERYTHING from JSON
 
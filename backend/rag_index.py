@@ -0,0 +1,177 @@
+# rag_index.py
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (~4 characters per token), good enough for budgeting prompts."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def split_passages(text: str, max_words: int) -> List[str]:
+    """Split a document on blank lines, then cap each paragraph at `max_words` words."""
+    passages: List[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        words = paragraph.split()
+        for i in range(0, len(words), max_words):
+            passages.append(" ".join(words[i: i + max_words]))
+    return passages
+
+
+class RagIndex(Mapping[str, List[str]]):
+    """
+    In-process BM25 index over config["rag_docs"].
+
+    Still behaves like the old {name: [doc, ...]} dict, but
+    context(name, query) returns only the top-k passages about `name`
+    ranked by BM25 against `query`, within a token budget, instead of
+    every document ever written about them.
+
+    Postings are kept per name, so a query only touches that person's
+    passages; IDF and average passage length are corpus-wide.
+    """
+
+    def __init__(
+        self,
+        rag_docs: Iterable[Dict[str, Any]],
+        top_k: int = 3,
+        token_budget: int = 400,
+        max_passage_words: int = 120,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        t0 = time.perf_counter()
+        self.top_k = top_k
+        self.token_budget = token_budget
+        self.k1 = k1
+        self.b = b
+
+        self._docs: Dict[str, List[str]] = {}
+        self._passages: List[str] = []
+        self._lengths: List[int] = []
+        self._passages_by_name: Dict[str, List[int]] = {}
+        self._postings: Dict[str, Dict[str, List[Tuple[int, int]]]] = {}
+        df: Dict[str, int] = {}
+
+        for doc in rag_docs:
+            name = doc.get("name")
+            text = (doc.get("text") or "").strip()
+            if not name or not text:
+                continue
+            self._docs.setdefault(name, []).append(text)
+            name_postings = self._postings.setdefault(name, {})
+            for passage in split_passages(text, max_passage_words):
+                pid = len(self._passages)
+                terms = tokenize(passage)
+                self._passages.append(passage)
+                self._lengths.append(len(terms))
+                self._passages_by_name.setdefault(name, []).append(pid)
+                counts: Dict[str, int] = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    name_postings.setdefault(term, []).append((pid, tf))
+                    df[term] = df.get(term, 0) + 1
+
+        n = len(self._passages)
+        self._avg_len = (sum(self._lengths) / n) if n else 0.0
+        self._idf = {
+            term: math.log(1.0 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()
+        }
+        self._context_cache: Dict[Tuple[str, str], str] = {}
+
+        self.build_seconds = time.perf_counter() - t0
+        self.queries = 0
+        self.query_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RagIndex":
+        rag_cfg = config.get("rag", {})
+        return cls(
+            config.get("rag_docs", []),
+            top_k=int(rag_cfg.get("top_k", 3)),
+            token_budget=int(rag_cfg.get("token_budget", 400)),
+            max_passage_words=int(rag_cfg.get("max_passage_words", 120)),
+        )
+
+    # Mapping interface: raw documents per name, like the old dict index.
+
+    def __getitem__(self, name: str) -> List[str]:
+        return self._docs[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._docs)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # Retrieval
+
+    def search(
+        self,
+        name: str,
+        query: str,
+        top_k: Optional[int] = None,
+        token_budget: Optional[int] = None,
+    ) -> List[str]:
+        """Best passages about `name` for `query`, most relevant first, within the token budget."""
+        t0 = time.perf_counter()
+        top_k = self.top_k if top_k is None else top_k
+        token_budget = self.token_budget if token_budget is None else token_budget
+
+        pids = self._passages_by_name.get(name, [])
+        scores: Dict[int, float] = dict.fromkeys(pids, 0.0)
+        name_postings = self._postings.get(name, {})
+        for term in set(tokenize(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for pid, tf in name_postings.get(term, ()):
+                norm = self.k1 * (1.0 - self.b + self.b * self._lengths[pid] / self._avg_len)
+                scores[pid] += idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+        ranked = sorted(pids, key=lambda pid: -scores[pid])
+        selected: List[str] = []
+        used = 0
+        for pid in ranked:
+            if len(selected) >= top_k:
+                break
+            cost = estimate_tokens(self._passages[pid])
+            if used + cost > token_budget:
+                continue
+            selected.append(self._passages[pid])
+            used += cost
+
+        self.queries += 1
+        self.query_seconds += time.perf_counter() - t0
+        return selected
+
+    def context(self, name: str, query: str) -> str:
+        """search() joined into a prompt block; memoized per (name, query)."""
+        key = (name, query)
+        cached = self._context_cache.get(key)
+        if cached is None:
+            cached = "\n\n".join(self.search(name, query))
+            self._context_cache[key] = cached
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "names": len(self._docs),
+            "passages": len(self._passages),
+            "terms": len(self._idf),
+            "build_seconds": round(self.build_seconds, 6),
+            "queries": self.queries,
+            "avg_query_ms": round(1000.0 * self.query_seconds / self.queries, 4) if self.queries else 0.0,
+        }
@@ -0,0 +1,233 @@
+# round_engine.py
+#
+# Structure-of-arrays alternative to the Agent-based engine in
+# multi_round_auction.py. Same config, same seed, same MultiRoundAuctionResult;
+# state lives in parallel arrays, positions come from one argsort per round
+# and no per-agent history is kept, so 10k+ agent simulations stay cheap.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from auction_core import Profile, SocialScores, rank_columns
+from auction_rng import AuctionRng
+from auction_strategies import BatchStrategy, build_strategy, plan_raises
+from multi_round_auction import (
+    Agent,
+    STOP_NUM_ROUNDS,
+    AuctionRoundResult,
+    ConvergenceTracker,
+    MultiRoundAuctionResult,
+    StoppingRules,
+    _winner_summary,
+    compute_agent_social_scores,
+    load_config,
+    prepare_agents_from_config,
+)
+
+# ---------- Agent state ----------
+
+@dataclass
+class AgentArrays:
+    """
+    Every agent's mutable state as parallel arrays (row i = agent i, in
+    config order). Agents are grouped by strategy once up front, so each
+    round calls every strategy a single time for all of its agents.
+    """
+
+    names: List[str]
+    base_profiles: List[Profile]
+    current_bid: np.ndarray
+    true_max_bid: np.ndarray
+    strategy_names: List[str]
+    strategy_index: np.ndarray
+    strategies: List[BatchStrategy]
+
+    def __post_init__(self) -> None:
+        self.strategy_members = [
+            np.flatnonzero(self.strategy_index == s) for s in range(len(self.strategy_names))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_agents(cls, agents: Sequence[Agent]) -> "AgentArrays":
+        strategy_names: List[str] = []
+        strategies: List[BatchStrategy] = []
+        lookup: Dict[str, int] = {}
+        index = np.empty(len(agents), dtype=np.intp)
+        for i, agent in enumerate(agents):
+            s = lookup.get(agent.strategy)
+            if s is None:
+                s = lookup[agent.strategy] = len(strategy_names)
+                strategy_names.append(agent.strategy)
+                strategies.append(
+                    agent.raise_strategy
+                    or build_strategy(agent.strategy, agent.strategy_params)
+                )
+            index[i] = s
+
+        return cls(
+            names=[agent.name for agent in agents],
+            base_profiles=[agent.base_profile for agent in agents],
+            current_bid=np.fromiter(
+                (agent.current_bid for agent in agents), dtype=np.float64, count=len(agents)
+            ),
+            true_max_bid=np.fromiter(
+                (agent.true_max_bid for agent in agents), dtype=np.float64, count=len(agents)
+            ),
+            strategy_names=strategy_names,
+            strategy_index=index,
+            strategies=strategies,
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "AgentArrays":
+        return cls.from_agents(prepare_agents_from_config(config))
+
+
+class RoundProfiles(Sequence[Profile]):
+    """
+    Per-round profile dicts (base_profile with start_bid/max_bid = current
+    bid), built only when a ranking row is actually read.
+    """
+
+    def __init__(self, base_profiles: List[Profile], bids: np.ndarray) -> None:
+        self._base = base_profiles
+        self._bids = bids
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        bid = float(self._bids[i])
+        prof = dict(self._base[i])
+        prof["start_bid"] = bid
+        prof["max_bid"] = bid
+        return prof
+
+
+# ---------- Vectorized raises ----------
+
+def apply_raises(
+    state: AgentArrays,
+    positions: np.ndarray,
+    round_index: int,
+    total_rounds: int,
+    rng: AuctionRng,
+) -> np.ndarray:
+    """
+    auction_strategies.plan_raises() for every agent at once; updates
+    state.current_bid in place and returns a mask of agents that raised.
+    `positions[i]` is agent i's rank in the last ranking (0 = best).
+    """
+    plan = plan_raises(
+        state.strategies,
+        state.strategy_members,
+        positions,
+        state.current_bid,
+        state.true_max_bid,
+        round_index,
+        total_rounds,
+        rng,
+    )
+    state.current_bid[plan.raising] = plan.new_bid[plan.raising]
+    return plan.raising
+
+
+# ---------- Runner ----------
+
+def run_multi_round_auction_vectorized(
+    config: Dict[str, Any],
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+    rng: Optional[AuctionRng] = None,
+) -> MultiRoundAuctionResult:
+    """
+    Drop-in for multi_round_auction.run_multi_round_auction(): same inputs,
+    same MultiRoundAuctionResult (including StoppingRules early stops) for
+    the same random_seed. Agent names are assumed unique, as in every config
+    we ship. Per-agent history is not recorded.
+    """
+    auction_params = config["auction_params"]
+    num_rounds = int(auction_params["num_rounds"])
+    weight_money = float(auction_params["money_weight"])
+    weight_social = float(auction_params["social_weight"])
+
+    gemini_cfg = config.get("gemini", {})
+    use_gemini_flag = bool(gemini_cfg.get("enabled", True))
+
+    if rng is None:
+        rng = AuctionRng.from_config(auction_params)
+
+    agents = prepare_agents_from_config(config)
+    if social_scores is None:
+        social_scores, social_mode = compute_agent_social_scores(config, agents)
+
+    state = AgentArrays.from_agents(agents)
+    del agents
+
+    names = state.names
+    social_column = np.fromiter(
+        (social_scores[name][0] for name in names), dtype=np.float64, count=len(names)
+    )
+    reason_column = [social_scores[name][1] for name in names]
+    mode = social_mode or ("gemini" if use_gemini_flag else "rule-based")
+
+    tracker = ConvergenceTracker(
+        StoppingRules.from_config(auction_params.get("stopping")),
+        state.true_max_bid,
+        weight_social,
+        weight_money,
+    )
+
+    rounds: List[AuctionRoundResult] = []
+    final_winner: Optional[Dict[str, Any]] = None
+    stop_reason = STOP_NUM_ROUNDS
+
+    for r in range(1, num_rounds + 1):
+        bids = state.current_bid.copy()
+        result = rank_columns(
+            names,
+            bids,
+            social_column,
+            reason_column,
+            mode,
+            profiles=RoundProfiles(state.base_profiles, bids),
+            weight_social=weight_social,
+            weight_money=weight_money,
+        )
+
+        ranking = result["ranking"]
+        final_winner = result["winner"]
+        reason = STOP_NUM_ROUNDS if r == num_rounds else tracker.check(ranking)
+        rounds.append(
+            AuctionRoundResult(
+                round_index=r, ranking=ranking, winner=final_winner, stop_reason=reason
+            )
+        )
+        if reason is not None:
+            stop_reason = reason
+            break
+
+        if r < num_rounds:
+            apply_raises(state, result["ranking"].positions(), r, num_rounds, rng)
+
+    return MultiRoundAuctionResult(
+        rounds=rounds,
+        final_winner=_winner_summary(final_winner),
+        social_mode=mode,
+        stop_reason=stop_reason,
+        rounds_played=len(rounds),
+    )
+
+if __name__ == "__main__":
+    import json
+
+    print(json.dumps(run_multi_round_auction_vectorized(load_config()).to_dict()["final_winner"], indent=2))
@@ -0,0 +1,176 @@
+# social_score_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Profile fields that feed the Gemini prompt. Bids are deliberately excluded:
+# they change every round but never change the social score.
+CACHE_PROFILE_FIELDS = ("name", "country", "profession", "social_contribution")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS social_scores (
+    key         TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    score       REAL NOT NULL,
+    reason      TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_social_scores_name ON social_scores (name);
+CREATE INDEX IF NOT EXISTS idx_social_scores_last_access ON social_scores (last_access);
+"""
+
+
+def social_score_cache_key(profile: Dict[str, Any], rag_context: str, model_name: str) -> str:
+    """Content hash of everything that determines a Gemini social score."""
+    payload = {field: str(profile.get(field) or "") for field in CACHE_PROFILE_FIELDS}
+    payload["rag_context"] = rag_context
+    payload["model"] = model_name
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SocialScoreCache:
+    """
+    Disk-backed (SQLite) cache of LLM social scores, keyed by
+    social_score_cache_key().
+
+    - LRU: once more than `max_entries` rows exist, the least recently read
+      rows are evicted.
+    - TTL: rows older than `ttl_seconds` are treated as misses and deleted.
+    - invalidate_profile(name) drops every cached score for a bidder, e.g.
+      after they edit their profile.
+
+    Safe to share between the threads used for concurrent Gemini scoring.
+    """
+
+    def __init__(
+        self,
+        path: str = "social_score_cache.sqlite3",
+        max_entries: int = 50_000,
+        ttl_seconds: Optional[float] = 30 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # Opened on first use (always under self._lock), so constructing a
+        # cache at import / config time costs nothing.
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    @classmethod
+    def from_config(cls, gemini_cfg: Dict[str, Any]) -> Optional["SocialScoreCache"]:
+        path = gemini_cfg.get("cache_path")
+        if not path:
+            return None
+        return cls(
+            path=path,
+            max_entries=int(gemini_cfg.get("cache_max_entries", 50_000)),
+            ttl_seconds=gemini_cfg.get("cache_ttl_seconds", 30 * 24 * 3600),
+        )
+
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT score, reason, created_at FROM social_scores WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            score, reason, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM social_scores WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE social_scores SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return float(score), reason
+
+    def put(self, key: str, name: str, model_name: str, score: float, reason: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO social_scores "
+                "(key, name, model, score, reason, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, name, model_name, float(score), reason, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM social_scores").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM social_scores WHERE key IN "
+                "(SELECT key FROM social_scores ORDER BY last_access ASC LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+
+    def invalidate(self, key: str) -> bool:
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM social_scores WHERE key = ?", (key,))
+            self._conn.commit()
+            return cur.rowcount > 0
+
+    def invalidate_profile(self, name: str) -> int:
+        """Drop all cached scores for `name` (any model / RAG context). Returns rows removed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM social_scores WHERE name = ?", (name,))
+            self._conn.commit()
+            return cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM social_scores")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM social_scores").fetchone()
+            return int(count)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,259 @@
+# strategy_sweep.py
+#
+# Parameter sweeps over config["strategy_params"]: grid, random or Latin
+# hypercube samples, each point run on the vectorized round engine in a
+# process pool, one CSV row per point.
+#
+#   python strategy_sweep.py --mode lhs --samples 2000 --runs 5 \
+#       --space '{"greedy.base_fraction": [0.3, 0.8], "cautious.rand_max": [0.9, 1.4]}'
+#
+# Keys are "<strategy>.<param>"; grid mode takes a list of values per key,
+# random / lhs take [low, high].
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from auction_core import SocialScores
+from auction_simulation import run_seeds
+from edge_fairness_qai import compute_edge_fairness_scores
+from multi_round_auction import compute_agent_social_scores, load_config, prepare_agents_from_config
+from round_engine import run_multi_round_auction_vectorized
+from worker_pool import chunks, map_chunks, worker_state
+
+Point = Dict[str, float]
+
+SWEEP_MODES = ("grid", "random", "lhs")
+
+
+# ---------- Sampling ----------
+
+def _split_key(key: str) -> Tuple[str, str]:
+    strategy, sep, param = key.partition(".")
+    if not sep or not strategy or not param:
+        raise ValueError(f"Sweep key {key!r} must look like '<strategy>.<param>'")
+    return strategy, param
+
+
+def grid_points(space: Dict[str, Sequence[float]]) -> List[Point]:
+    keys = list(space)
+    return [dict(zip(keys, map(float, values))) for values in itertools.product(*space.values())]
+
+
+def _bounds(space: Dict[str, Sequence[float]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    keys = list(space)
+    for key in keys:
+        if len(space[key]) != 2:
+            raise ValueError(f"{key}: random/lhs sampling needs [low, high]")
+    low = np.array([float(space[k][0]) for k in keys])
+    high = np.array([float(space[k][1]) for k in keys])
+    return keys, low, high
+
+
+def _to_points(keys: List[str], values: np.ndarray) -> List[Point]:
+    # 6 decimals keeps the CSV compact; the rounded value is what gets run.
+    return [dict(zip(keys, row)) for row in np.round(values, 6).tolist()]
+
+
+def random_points(space: Dict[str, Sequence[float]], samples: int, seed: int = 0) -> List[Point]:
+    keys, low, high = _bounds(space)
+    u = np.random.default_rng(seed).random((samples, len(keys)))
+    return _to_points(keys, low + (high - low) * u)
+
+
+def lhs_points(space: Dict[str, Sequence[float]], samples: int, seed: int = 0) -> List[Point]:
+    """Latin hypercube: every parameter's range is cut into `samples` strata, each hit once."""
+    keys, low, high = _bounds(space)
+    rng = np.random.default_rng(seed)
+    u = np.empty((samples, len(keys)))
+    for j in range(len(keys)):
+        u[:, j] = (rng.permutation(samples) + rng.random(samples)) / samples
+    return _to_points(keys, low + (high - low) * u)
+
+
+def sweep_points(
+    space: Dict[str, Sequence[float]], mode: str = "grid", samples: int = 100, seed: int = 0
+) -> List[Point]:
+    for key in space:
+        _split_key(key)
+    if mode == "grid":
+        return grid_points(space)
+    if mode == "random":
+        return random_points(space, samples, seed)
+    if mode == "lhs":
+        return lhs_points(space, samples, seed)
+    raise ValueError(f"Unknown sweep mode {mode!r}; expected one of {SWEEP_MODES}")
+
+
+def apply_point(config: Dict[str, Any], point: Point) -> Dict[str, Any]:
+    """Shallow copy of `config` with the point's strategy_params overridden."""
+    strategy_params = {name: dict(params) for name, params in config["strategy_params"].items()}
+    for key, value in point.items():
+        strategy, param = _split_key(key)
+        if strategy not in strategy_params:
+            raise KeyError(f"Unknown strategy {strategy!r} in sweep key {key!r}")
+        strategy_params[strategy][param] = value
+    out = dict(config)
+    out["strategy_params"] = strategy_params
+    out["auction_params"] = dict(config["auction_params"])
+    return out
+
+
+# ---------- Evaluation ----------
+
+def evaluate_point(
+    config: Dict[str, Any],
+    point: Point,
+    seeds: Sequence[int],
+    social_scores: SocialScores,
+    social_mode: str,
+) -> Dict[str, Any]:
+    """Run the auction once per seed at `point`; return one summary row."""
+    point_config = apply_point(config, point)
+    wins: Dict[str, int] = {}
+    clearing_bids: List[float] = []
+    rounds_used: List[int] = []
+    fairness: List[float] = []
+
+    for seed in seeds:
+        point_config["auction_params"]["random_seed"] = seed
+        result = run_multi_round_auction_vectorized(point_config, social_scores, social_mode)
+        winner = result.final_winner
+        wins[winner["name"]] = wins.get(winner["name"], 0) + 1
+        clearing_bids.append(float(winner["bid"]))
+        rounds_used.append(result.rounds_played)
+        # Winner's edge fairness in the final round (edge_fairness_qai heuristic).
+        fairness.append(float(compute_edge_fairness_scores(result.rounds[-1].ranking[:1])[0][1]))
+
+    winner, count = max(wins.items(), key=lambda kv: (kv[1], kv[0]))
+    return {
+        **point,
+        "winner": winner,
+        "winner_share": round(count / len(seeds), 4),
+        "clearing_bid": round(float(np.mean(clearing_bids)), 2),
+        "clearing_bid_std": round(float(np.std(clearing_bids)), 2),
+        "rounds_used": round(float(np.mean(rounds_used)), 3),
+        "winner_fairness": round(float(np.mean(fairness)), 4),
+    }
+
+
+def _worker_setup(
+    config: Dict[str, Any], social_scores: SocialScores, social_mode: str, seeds: List[int]
+) -> Dict[str, Any]:
+    return dict(config=config, social_scores=social_scores, social_mode=social_mode, seeds=seeds)
+
+
+def _evaluate_chunk(points: List[Point]) -> List[Dict[str, Any]]:
+    return [
+        evaluate_point(
+            worker_state["config"],
+            point,
+            worker_state["seeds"],
+            worker_state["social_scores"],
+            worker_state["social_mode"],
+        )
+        for point in points
+    ]
+
+
+def run_sweep(
+    config: Dict[str, Any],
+    points: List[Point],
+    runs_per_point: int = 1,
+    base_seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    social_scores: Optional[SocialScores] = None,
+    social_mode: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one result row per point, in point order, as chunks finish.
+
+    Strategy params never affect social scores, so they are computed once
+    (or taken from `social_scores`) and shared by every point and worker.
+    Every point uses the same `runs_per_point` seeds, so rows are directly
+    comparable.
+    """
+    if social_scores is None:
+        social_scores, social_mode = compute_agent_social_scores(
+            config, prepare_agents_from_config(config)
+        )
+    social_mode = social_mode or "rule-based"
+    seeds = run_seeds(base_seed, max(1, runs_per_point))
+    workers = workers or os.cpu_count() or 1
+    for rows in map_chunks(
+        _evaluate_chunk,
+        chunks(points, max(1, chunk_size)),
+        workers,
+        _worker_setup,
+        config,
+        social_scores,
+        social_mode,
+        seeds,
+    ):
+        yield from rows
+
+
+def write_csv(rows: Iterator[Dict[str, Any]], out: TextIO) -> int:
+    writer: Optional[csv.DictWriter] = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(out, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+# ---------- CLI ----------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep strategy_params over the multi-round engine.")
+    parser.add_argument("--config", default="auction_config.json")
+    parser.add_argument("--space", default=None, help="JSON sweep space (inline)")
+    parser.add_argument("--space-file", default=None, help="JSON sweep space (file)")
+    parser.add_argument("--mode", choices=SWEEP_MODES, default="grid")
+    parser.add_argument("--samples", type=int, default=100, help="points for random / lhs")
+    parser.add_argument("--runs", type=int, default=1, help="seeded runs per point")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="default: all CPUs")
+    parser.add_argument("--chunk-size", type=int, default=8)
+    parser.add_argument("--out", default=None, help="CSV path (default: stdout)")
+    args = parser.parse_args()
+
+    if args.space_file:
+        with open(args.space_file, "r", encoding="utf-8") as f:
+            space = json.load(f)
+    elif args.space:
+        space = json.loads(args.space)
+    else:
+        parser.error("one of --space / --space-file is required")
+
+    config = load_config(args.config)
+    points = sweep_points(space, args.mode, args.samples, args.seed)
+
+    t0 = time.perf_counter()
+    rows = run_sweep(
+        config,
+        points,
+        runs_per_point=args.runs,
+        base_seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8", newline="") as f:
+            count = write_csv(rows, f)
+    else:
+        count = write_csv(rows, sys.stdout)
+    print(f"[SWEEP] {count} points in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
@@ -0,0 +1,47 @@
+# tests/conftest.py
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import shutil
+
+import pytest
+
+from auction_core import set_gemini_client
+from auction_result_cache import AuctionResultCache
+from tests.helpers import CONFIG_PATH
+
+
+@pytest.fixture(autouse=True)
+def _reset_gemini_client():
+    # Tests install FakeGeminiClient process-wide; never leak it into the next one.
+    yield
+    set_gemini_client(None)
+
+
+@pytest.fixture(scope="session")
+def api_module(tmp_path_factory):
+    # api reads auction_config.json relative to the working directory; import
+    # it from a scratch copy so nothing it opens lands in the source tree.
+    workdir = tmp_path_factory.mktemp("api")
+    shutil.copy(CONFIG_PATH, workdir)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import api
+    finally:
+        os.chdir(cwd)
+    return api
+
+
+@pytest.fixture
+def api(api_module, monkeypatch):
+    """api with no shared rate limit, disk cache or breaker, and a fresh result cache."""
+    monkeypatch.setattr(
+        api_module,
+        "GEMINI_OPTIONS",
+        dataclasses.replace(api_module.GEMINI_OPTIONS, rate_limiter=None, cache=None, breaker=None),
+    )
+    monkeypatch.setattr(api_module, "RESULT_CACHE", AuctionResultCache(max_entries=16, ttl_seconds=300))
+    return api_module
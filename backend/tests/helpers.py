@@ -0,0 +1,84 @@
+# tests/helpers.py
+#
+# Synthetic profiles and auction configs shared by the tests.
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from multi_round_auction import load_config
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(BACKEND_DIR, "auction_config.json")
+
+PROFESSIONS = ["Human rights lawyer", "Tobacco factory owner", "Teacher", "Crypto fund manager"]
+CONTRIBUTIONS = [
+    "Donated 5000 for hungry children and funded a school.",
+    "Donated $1000 for planting trees.",
+    "Volunteers at a hospital for refugees.",
+    "No recorded contributions.",
+]
+
+
+def make_profiles(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"Bidder {i}",
+            "country": "United States",
+            "profession": PROFESSIONS[i % len(PROFESSIONS)],
+            "social_contribution": CONTRIBUTIONS[(i // 2) % len(CONTRIBUTIONS)],
+            "start_bid": 0.0,
+            "max_bid": 1000.0 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def base_config() -> Dict[str, Any]:
+    return load_config(CONFIG_PATH)
+
+
+def make_config(
+    num_agents: int,
+    num_rounds: int,
+    seed: int,
+    strategies: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Rule-based auction over `num_agents` synthetic agents, no early stopping."""
+    rng = random.Random(seed)
+    config = copy.deepcopy(base_config())
+    config["auction_params"]["num_rounds"] = num_rounds
+    config["auction_params"]["random_seed"] = seed
+    config["auction_params"]["stopping"] = {}
+    config["gemini"]["enabled"] = False
+    config["rag_docs"] = []
+    strategies = list(strategies or sorted(config["strategy_params"]))
+    agents = []
+    for p in make_profiles(num_agents):
+        start = round(rng.uniform(100, 5000), 2)
+        p["start_bid"] = start
+        p["max_bid"] = round(start + rng.uniform(0, 20000), 2)
+        p["strategy"] = rng.choice(strategies)
+        agents.append(p)
+    config["agents"] = agents
+    return config
+
+
+def reasons(scores: Dict[str, Any]) -> List[str]:
+    return [reason for _, reason in scores.values()]
+
+
+def api_request(app: Any, method: str, path: str, **kwargs: Any) -> httpx.Response:
+    """One request against the ASGI `app`, no server needed."""
+    async def send() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(send())
@@ -0,0 +1,58 @@
+# tests/test_agent_history.py
+
+from __future__ import annotations
+
+from agent_history import AgentHistoryStore, new_history_store
+from multi_round_auction import prepare_agents_from_config, run_multi_round_auction
+from tests.helpers import make_config
+
+
+def test_entries_read_back_equal_to_what_was_appended():
+    store = AgentHistoryStore(num_agents=2, capacity=1)
+    entries = [
+        {"round": 1, "position": 3, "loser_factor": 0.512, "remaining_before": 1200.5,
+         "planned_raise": 300.25, "new_bid": 1500.75, "strategy": "greedy"},
+        {"round": 2, "action": "no_raise", "reason": "reached true_max_bid", "current_bid": 1500.75},
+        {"round": 3, "note": "anything else is kept verbatim"},
+    ]
+    view = store.view(0)
+    for entry in entries:
+        view.append(entry)
+
+    assert store.capacity >= 3  # grew past the preallocated slot
+    assert view == entries
+    assert view[-1] == entries[-1]
+    assert view[:2] == entries[:2]
+    assert len(store.view(1)) == 0
+
+
+def test_full_history_round_trips_through_the_auction():
+    config = make_config(12, 8, 3)
+    agents = prepare_agents_from_config(config)
+    store = new_history_store(len(agents), 8)
+
+    result = run_multi_round_auction(config, history=store)
+
+    rounds = result.rounds
+    assert result.rounds_played == 8
+    for i, agent in enumerate(agents):
+        history = list(store.view(i))
+        assert [entry["round"] for entry in history] == list(range(1, 8))
+        for entry, this_round, next_round in zip(history, rounds, rounds[1:]):
+            names = [row["name"] for row in this_round.ranking]
+            next_bid = {row["name"]: row["profile"]["max_bid"] for row in next_round.ranking}
+            if "action" in entry:
+                assert entry["current_bid"] == next_bid[agent.name]
+            else:
+                assert entry["position"] == names.index(agent.name)
+                assert entry["new_bid"] == next_bid[agent.name]
+                assert entry["strategy"] == agent.strategy
+
+
+def test_history_store_does_not_change_the_result():
+    config = make_config(12, 8, 4)
+    store = new_history_store(12, 8)
+    assert (
+        run_multi_round_auction(config, history=store).to_dict()
+        == run_multi_round_auction(config).to_dict()
+    )
@@ -0,0 +1,56 @@
+# tests/test_api_bulk.py
+
+from __future__ import annotations
+
+from auction_core import set_gemini_client
+from fake_gemini_client import FakeGeminiClient
+from tests.helpers import api_request, make_profiles
+
+
+class ModelRecordingClient(FakeGeminiClient):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.models_used = []
+
+    async def _generate_async(self, model, contents):
+        self.models_used.append(model)
+        return await super()._generate_async(model, contents)
+
+
+def bulk_body():
+    profiles = make_profiles(6)
+    shared = dict(profiles[0], max_bid=4321.0)  # same donor, different bid
+    return {
+        "auctions": [
+            {"auction_id": "a", "profiles": profiles[:3]},
+            {"auction_id": "b", "profiles": [shared] + profiles[3:]},
+        ]
+    }
+
+
+def test_bulk_endpoint_scores_with_the_configured_model(api, monkeypatch):
+    fake = ModelRecordingClient(latency_seconds=0.0)
+    set_gemini_client(fake)
+    monkeypatch.setattr(api, "GEMINI_MODEL", "custom-model")
+
+    response = api_request(api.app, "POST", "/run-auctions", json=bulk_body())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["social_mode"] for r in data["results"]] == ["gemini", "gemini"]
+    assert (data["profiles_total"], data["profiles_distinct"]) == (7, 6)
+    assert fake.models_used and set(fake.models_used) == {"custom-model"}
+
+
+def test_bulk_results_match_single_auctions(api):
+    set_gemini_client(FakeGeminiClient(latency_seconds=0.0))
+    body = bulk_body()
+
+    bulk = api_request(api.app, "POST", "/run-auctions", json=body).json()
+
+    for auction, result in zip(body["auctions"], bulk["results"]):
+        single = api_request(api.app, "POST", "/run-auction", json={"profiles": auction["profiles"]})
+        assert single.status_code == 200
+        assert result["auction_id"] == auction["auction_id"]
+        assert result["ranking"] == single.json()["ranking"]
+        assert result["winner"] == single.json()["winner"]
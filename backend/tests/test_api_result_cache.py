@@ -0,0 +1,82 @@
+# tests/test_api_result_cache.py
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from auction_core import set_gemini_client
+from fake_gemini_client import FakeGeminiClient
+from tests.helpers import api_request, make_profiles
+
+
+def auction_payload(num_profiles: int = 5) -> Dict[str, Any]:
+    profiles = make_profiles(num_profiles)
+    for i, p in enumerate(profiles):
+        p["start_bid"] = 100.0 + i
+        p["max_bid"] = 1000.0 + 10 * i
+    return {"profiles": profiles, "use_gemini": True}
+
+
+async def post_many(
+    app: Any, payload: Dict[str, Any], count: int, headers: Optional[Dict[str, str]] = None
+) -> List[httpx.Response]:
+    """`count` concurrent identical POST /run-auction requests."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.post("/run-auction", json=payload, headers=headers) for _ in range(count))
+        )
+
+
+def test_identical_concurrent_requests_compute_once(api, monkeypatch):
+    fake = FakeGeminiClient(latency_seconds=0.05)
+    set_gemini_client(fake)
+    computed = []
+    rank_profiles_async = api.rank_profiles_async
+
+    async def counting_rank(*args, **kwargs):
+        computed.append(1)
+        return await rank_profiles_async(*args, **kwargs)
+
+    monkeypatch.setattr(api, "rank_profiles_async", counting_rank)
+
+    responses = asyncio.run(post_many(api.app, auction_payload(5), 20))
+
+    assert len(computed) == 1
+    assert fake.call_count == 5
+    assert all(r.status_code == 200 for r in responses)
+    assert sorted(r.headers["X-Cache"] for r in responses) == ["COALESCED"] * 19 + ["MISS"]
+    assert len({r.headers["ETag"] for r in responses}) == 1
+    assert all(r.json() == responses[0].json() for r in responses)
+
+
+def test_if_none_match_returns_304(api):
+    set_gemini_client(FakeGeminiClient(latency_seconds=0.0))
+    payload = auction_payload(4)
+
+    first = api_request(api.app, "POST", "/run-auction", json=payload)
+    etag = first.headers["ETag"]
+    cached = api_request(api.app, "POST", "/run-auction", json=payload, headers={"If-None-Match": etag})
+    stale = api_request(api.app, "POST", "/run-auction", json=payload, headers={"If-None-Match": '"other"'})
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.headers["X-Cache"] == "HIT"
+    assert cached.content == b""
+    assert stale.status_code == 200
+    assert stale.headers["X-Cache"] == "HIT"
+    assert stale.json() == first.json()
+
+
+def test_results_with_fallback_scores_are_not_cached(api):
+    set_gemini_client(FakeGeminiClient(latency_seconds=0.0, failure_rate=1.0))
+    payload = auction_payload(3)
+
+    first, second = (api_request(api.app, "POST", "/run-auction", json=payload) for _ in range(2))
+
+    assert first.headers["X-Cache"] == second.headers["X-Cache"] == "MISS"
+    assert api.RESULT_CACHE.stats()["degraded"] == 2
+    assert len(api.RESULT_CACHE) == 0
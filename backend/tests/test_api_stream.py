@@ -0,0 +1,74 @@
+# tests/test_api_stream.py
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from multi_round_auction import run_multi_round_auction
+from tests.helpers import api_request, make_config
+
+NUM_AGENTS = 12
+NUM_ROUNDS = 6
+
+
+def stream_body(**overrides: Any) -> Dict[str, Any]:
+    agents = make_config(NUM_AGENTS, NUM_ROUNDS, 4)["agents"]
+    body = {"agents": agents, "num_rounds": NUM_ROUNDS, "random_seed": 4, "use_gemini": False}
+    body.update(overrides)
+    return body
+
+
+def parse_events(text: str) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_sends_start_rounds_then_done(api):
+    body = stream_body()
+    response = api_request(api.app, "POST", "/run-multi-round-auction/stream", json=body)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    kinds = [kind for kind, _ in events]
+    assert kinds[0] == "start" and kinds[-1] == "done"
+    assert set(kinds[1:-1]) == {"round"}
+
+    start, done = events[0][1], events[-1][1]
+    rounds = [data for kind, data in events if kind == "round"]
+    assert start == {"social_mode": "rule-based", "agents": NUM_AGENTS, "num_rounds": NUM_ROUNDS}
+    assert [r["round_index"] for r in rounds] == list(range(1, len(rounds) + 1))
+    assert done["rounds_played"] == len(rounds)
+    assert done["stop_reason"] == rounds[-1]["stop_reason"]
+
+    expected = run_multi_round_auction(api._multi_round_config(api.MultiRoundAuctionRequest(**body)))
+    assert [r["ranking"] for r in rounds] == [
+        json.loads(json.dumps(list(r.ranking))) for r in expected.rounds
+    ]
+    assert done["final_winner"]["name"] == expected.final_winner["name"]
+
+
+def test_stream_top_k_trims_round_rankings(api):
+    response = api_request(
+        api.app, "POST", "/run-multi-round-auction/stream", json=stream_body(top_k=3)
+    )
+
+    rounds = [data for kind, data in parse_events(response.text) if kind == "round"]
+    assert rounds
+    assert all(len(r["ranking"]) == 3 for r in rounds)
+    assert all(r["ranking"][0]["name"] == r["winner"]["name"] for r in rounds)
+
+
+def test_stream_rejects_bad_requests_before_streaming(api):
+    body = stream_body()
+    body["agents"][0]["strategy"] = "no_such_strategy"
+    response = api_request(api.app, "POST", "/run-multi-round-auction/stream", json=body)
+    assert response.status_code == 422
+    assert "no_such_strategy" in response.json()["detail"]
+
+    response = api_request(api.app, "POST", "/run-multi-round-auction/stream", json=stream_body(agents=[]))
+    assert response.status_code == 422
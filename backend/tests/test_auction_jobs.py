@@ -0,0 +1,130 @@
+# tests/test_auction_jobs.py
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from auction_jobs import (
+    JOB_CANCELLED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    KIND_MULTI_ROUND,
+    KIND_RANK,
+    AuctionJob,
+    InMemoryJobQueue,
+    JobQueueFull,
+    JobRunner,
+    SQLiteJobQueue,
+)
+from multi_round_auction import run_multi_round_auction
+from tests.helpers import api_request, make_config
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_queue(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "memory":
+            return InMemoryJobQueue(**kwargs)
+        return SQLiteJobQueue(str(tmp_path / "jobs.sqlite3"), **kwargs)
+
+    return make
+
+
+def submit(queue, job_id, priority=0):
+    queue.submit(AuctionJob(job_id=job_id, kind=KIND_RANK, payload={}, priority=priority))
+
+
+def finish(queue, job_id, finished_at):
+    queue.update(job_id, status=JOB_SUCCEEDED, finished_at=finished_at)
+
+
+def test_claims_follow_priority_then_submission_order(make_queue):
+    queue = make_queue()
+    for job_id, priority in [("a", 0), ("b", 5), ("c", 0), ("d", 5), ("e", -1)]:
+        submit(queue, job_id, priority)
+
+    claimed = [queue.claim().job_id for _ in range(5)]
+
+    assert claimed == ["b", "d", "a", "c", "e"]
+    assert queue.claim() is None
+    assert queue.get("a").status == JOB_RUNNING
+
+
+def test_cancelled_queued_jobs_are_never_claimed(make_queue):
+    queue = make_queue(max_pending=2)
+    submit(queue, "a")
+    submit(queue, "b")
+    with pytest.raises(JobQueueFull):
+        submit(queue, "c")
+
+    assert queue.request_cancel("a") == JOB_CANCELLED
+    submit(queue, "c")  # the cancelled job no longer counts as pending
+    assert [queue.claim().job_id, queue.claim().job_id] == ["b", "c"]
+    assert queue.request_cancel("b") == JOB_RUNNING
+    assert queue.get("b").cancel_requested
+    assert queue.request_cancel("missing") is None
+
+
+def test_finished_jobs_are_evicted_oldest_first(make_queue):
+    queue = make_queue(max_finished=2)
+    for i, job_id in enumerate(["a", "b", "c"]):
+        submit(queue, job_id)
+        queue.claim()
+        finish(queue, job_id, finished_at=1000.0 + i)
+
+    assert queue.prune() == 1
+    assert queue.get("a") is None
+    assert [queue.get(j).status for j in ("b", "c")] == [JOB_SUCCEEDED, JOB_SUCCEEDED]
+    submit(queue, "d")
+    assert queue.get("d").status == JOB_QUEUED
+
+
+def test_runner_runs_a_multi_round_job_in_a_worker_process():
+    config = make_config(10, 4, 2)
+    runner = JobRunner(InMemoryJobQueue(), workers=1, poll_interval=0.05).start()
+    try:
+        job = runner.submit(KIND_MULTI_ROUND, {"config": config})
+        done = runner.wait(job.job_id, timeout=120)
+    finally:
+        runner.shutdown()
+
+    assert done.status == JOB_SUCCEEDED
+    assert done.progress["rounds_played"] == 4
+    expected = json.loads(json.dumps(run_multi_round_auction(config).to_dict()))
+    assert json.loads(json.dumps(done.result)) == expected
+
+
+class EvictingRunner:
+    """Knows the job for the endpoint's up-front lookup, then loses it."""
+
+    poll_interval = 0.01
+
+    def __init__(self, job):
+        self.job = job
+        self.lookups = 0
+
+    def get(self, job_id):
+        self.lookups += 1
+        return self.job if self.lookups == 1 else None
+
+
+def test_job_events_report_a_job_evicted_mid_stream(api, monkeypatch):
+    runner = EvictingRunner(AuctionJob(job_id="j1", kind=KIND_RANK, payload={}))
+    monkeypatch.setattr(api, "get_job_runner", lambda config=None: runner)
+
+    response = api_request(api.app, "GET", "/jobs/j1/events")
+
+    assert response.status_code == 200
+    assert response.text.startswith("event: error\n")
+    assert '"error":"JobNotFound"' in response.text
+
+
+def test_job_endpoints_404_for_unknown_jobs(api, monkeypatch):
+    runner = EvictingRunner(None)
+    monkeypatch.setattr(api, "get_job_runner", lambda config=None: runner)
+
+    assert api_request(api.app, "GET", "/jobs/nope/events").status_code == 404
+    assert api_request(api.app, "GET", "/jobs/nope").status_code == 404
@@ -0,0 +1,73 @@
+# tests/test_auction_rng.py
+
+from __future__ import annotations
+
+import copy
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from auction_core import compute_social_scores
+from auction_rng import AuctionRng
+from multi_round_auction import run_multi_round_auction
+from round_engine import run_multi_round_auction_vectorized
+from tests.helpers import make_config
+
+
+@pytest.mark.parametrize("kind", ["random", "numpy"])
+def test_batched_draws_match_single_draws(kind):
+    batched = AuctionRng.from_seed(5, kind).uniform(7)
+    single = AuctionRng.from_seed(5, kind)
+    assert batched.tolist() == [float(single.uniform(1)[0]) for _ in range(7)]
+
+
+def test_random_kind_matches_a_seeded_random_random():
+    expected = random.Random(42)
+    assert AuctionRng.from_seed(42).uniform(5).tolist() == [expected.random() for _ in range(5)]
+
+
+@pytest.mark.parametrize("kind", ["random", "numpy"])
+def test_state_round_trips(kind):
+    rng = AuctionRng.from_config({"random_seed": 3, "rng": kind})
+    rng.uniform(10)
+    state = rng.getstate()
+    ahead = rng.uniform(4)
+
+    restored = AuctionRng.from_seed(None, kind)
+    restored.setstate(state)
+    assert np.array_equal(restored.uniform(4), ahead)
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        AuctionRng.from_config({"random_seed": 1, "rng": "mersenne"})
+
+
+def test_auctions_leave_the_global_random_stream_alone():
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    run_multi_round_auction(make_config(30, 5, 1))
+    run_multi_round_auction_vectorized(make_config(30, 5, 1))
+    assert random.random() == expected
+
+
+@pytest.mark.parametrize("rng_kind", ["random", "numpy"])
+def test_concurrent_auctions_with_same_seed_agree(rng_kind):
+    config = make_config(200, 30, 11)
+    config["auction_params"]["rng"] = rng_kind
+    social, mode = compute_social_scores(config["agents"], use_gemini=False)
+
+    def run() -> Dict[str, Any]:
+        return run_multi_round_auction(
+            copy.deepcopy(config), social_scores=social, social_mode=mode
+        ).to_dict()
+
+    alone = run()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, second = pool.map(lambda _: run(), range(2))
+
+    assert first == second == alone
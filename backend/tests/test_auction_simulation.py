@@ -0,0 +1,45 @@
+# tests/test_auction_simulation.py
+
+from __future__ import annotations
+
+import copy
+from collections import Counter
+
+from auction_simulation import run_seeds, simulate_auctions
+from multi_round_auction import run_multi_round_auction
+from tests.helpers import make_config
+
+
+def test_summary_is_identical_for_any_worker_count_and_chunk_size():
+    config = make_config(12, 6, 1)
+
+    inline = simulate_auctions(config, num_runs=40, base_seed=3, workers=1, chunk_size=7)
+    pooled = simulate_auctions(config, num_runs=40, base_seed=3, workers=2, chunk_size=7)
+    rechunked = simulate_auctions(config, num_runs=40, base_seed=3, workers=1, chunk_size=40)
+
+    assert pooled == inline
+    # Float sums fold in a different order, so compare what is exact.
+    assert rechunked["winner_probabilities"] == inline["winner_probabilities"]
+    assert rechunked["clearing_bid"]["histogram"] == inline["clearing_bid"]["histogram"]
+    assert simulate_auctions(config, num_runs=40, base_seed=4, workers=1) != inline
+
+
+def test_every_run_matches_a_standalone_auction_with_its_seed():
+    config = make_config(8, 5, 2)
+    summary = simulate_auctions(config, num_runs=12, base_seed=9, workers=1)
+
+    winners = Counter()
+    for seed in run_seeds(9, 12):
+        run_config = copy.deepcopy(config)
+        run_config["auction_params"]["random_seed"] = seed
+        winners[run_multi_round_auction(run_config).final_winner["name"]] += 1
+
+    assert summary["runs"] == 12
+    assert summary["winner_probabilities"] == {
+        name: round(count / 12, 4) for name, count in winners.items()
+    }
+
+
+def test_run_seeds_are_stable_prefixes():
+    assert run_seeds(5, 10)[:4] == run_seeds(5, 4)
+    assert len(set(run_seeds(5, 100))) == 100
@@ -0,0 +1,47 @@
+# tests/test_checkpoint.py
+
+from __future__ import annotations
+
+import copy
+import os
+
+import pytest
+
+import multi_round_auction
+from auction_checkpoint import resume_multi_round_auction, run_multi_round_auction_checkpointed
+from multi_round_auction import run_multi_round_auction
+from tests.helpers import make_config
+
+
+@pytest.mark.parametrize("every", [1, 3])
+def test_resume_after_crash_equals_full_run(tmp_path, monkeypatch, every):
+    config = make_config(20, 10, 3)
+    full = run_multi_round_auction(copy.deepcopy(config)).to_dict()
+
+    rank_columns = multi_round_auction.rank_columns
+    calls = {"n": 0}
+
+    def crash_on_round_7(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == 7:
+            raise RuntimeError("simulated crash")
+        return rank_columns(*args, **kwargs)
+
+    path = str(tmp_path / "auction.ckpt.json")
+    monkeypatch.setattr(multi_round_auction, "rank_columns", crash_on_round_7)
+    with pytest.raises(RuntimeError):
+        run_multi_round_auction_checkpointed(copy.deepcopy(config), path, every=every, resume=False)
+    monkeypatch.setattr(multi_round_auction, "rank_columns", rank_columns)
+
+    resumed = resume_multi_round_auction(path, copy.deepcopy(config), every=every).to_dict()
+    assert resumed == full
+
+
+def test_uninterrupted_checkpointed_run_equals_plain_run(tmp_path):
+    config = make_config(10, 6, 8)
+    path = str(tmp_path / "auction.ckpt.json")
+
+    checkpointed = run_multi_round_auction_checkpointed(copy.deepcopy(config), path, every=2)
+
+    assert checkpointed.to_dict() == run_multi_round_auction(copy.deepcopy(config)).to_dict()
+    assert os.path.exists(path)
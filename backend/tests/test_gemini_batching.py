@@ -0,0 +1,72 @@
+# tests/test_gemini_batching.py
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from fake_gemini_client import FakeGeminiClient
+from social_score_cache import SocialScoreCache
+from tests.helpers import make_profiles
+
+
+@pytest.mark.parametrize("num_profiles,batch_size", [(10, 3), (12, 4), (5, 8)])
+def test_one_request_per_batch(num_profiles, batch_size):
+    profiles = make_profiles(num_profiles)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+    options = GeminiScoringOptions(max_concurrency=2, batch_size=batch_size)
+
+    batched = compute_social_scores_gemini(profiles, fake, "m", options=options)
+    single = compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.0), "m")
+
+    assert fake.call_count == math.ceil(num_profiles / batch_size)
+    assert list(batched) == [p["name"] for p in profiles]
+    assert {name: score for name, (score, _) in batched.items()} == {
+        name: score for name, (score, _) in single.items()
+    }
+
+
+def test_profiles_dropped_from_a_batch_are_reissued_individually():
+    profiles = make_profiles(12)
+    fake = FakeGeminiClient(latency_seconds=0.0, batch_drop_rate=0.3, seed=4)
+    options = GeminiScoringOptions(max_concurrency=2, batch_size=4)
+
+    scores = compute_social_scores_gemini(profiles, fake, "m", options=options)
+
+    assert len(scores) == 12
+    assert not any(reason.startswith("Fallback:") for _, reason in scores.values())
+    assert fake.call_count > 3
+
+
+@pytest.mark.parametrize("batch_size,drop_rate", [(1, 0.0), (4, 0.0), (4, 0.5)])
+def test_each_profile_is_looked_up_in_the_cache_once(tmp_path, batch_size, drop_rate):
+    profiles = make_profiles(9)
+    cache = SocialScoreCache(path=str(tmp_path / "scores.sqlite3"))
+    fake = FakeGeminiClient(latency_seconds=0.0, batch_drop_rate=drop_rate, seed=2)
+    options = GeminiScoringOptions(max_concurrency=3, batch_size=batch_size, cache=cache)
+
+    compute_social_scores_gemini(profiles, fake, "m", options=options)
+    assert (cache.hits, cache.misses) == (0, 9)
+    assert len(cache) == 9
+
+    calls = fake.call_count
+    compute_social_scores_gemini(profiles, fake, "m", options=options)
+    assert (cache.hits, cache.misses) == (9, 9)
+    assert fake.call_count == calls
+    cache.close()
+
+
+def test_hedged_requests_do_not_look_up_the_cache_again(tmp_path):
+    profiles = make_profiles(4)
+    cache = SocialScoreCache(path=str(tmp_path / "scores.sqlite3"))
+    fake = FakeGeminiClient(latency_seconds=0.1)
+    options = GeminiScoringOptions(max_concurrency=4, hedge_after_seconds=0.02, cache=cache)
+
+    compute_social_scores_gemini(profiles, fake, "m", options=options)
+
+    assert fake.call_count > 4  # every request was hedged
+    assert cache.misses == 4
+    assert cache.hits == 0
+    cache.close()
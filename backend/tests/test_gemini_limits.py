@@ -0,0 +1,97 @@
+# tests/test_gemini_limits.py
+
+from __future__ import annotations
+
+import time
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from fake_gemini_client import FakeGeminiClient
+from llm_limits import CircuitBreaker
+from tests.helpers import make_profiles, reasons
+
+
+def test_deadline_sends_one_wave_of_batches_and_no_retries():
+    profiles = make_profiles(40)
+    fake = FakeGeminiClient(latency_seconds=0.5)
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    options = GeminiScoringOptions(
+        max_concurrency=4, batch_size=10, deadline_seconds=0.05, breaker=breaker
+    )
+
+    t0 = time.monotonic()
+    scores = compute_social_scores_gemini(profiles, fake, "m", options=options)
+    elapsed = time.monotonic() - t0
+
+    assert fake.call_count == 4  # one request per batch, nothing re-sent individually
+    assert elapsed < 0.4  # returned at the deadline, not when Gemini answered
+    assert len(scores) == 40
+    assert all("latency budget" in r for r in reasons(scores))
+    # One timed-out pass is one failure, not one per profile or batch.
+    assert breaker.state == "closed"
+    assert breaker._failures == 1
+
+
+def test_deadline_stops_new_submissions():
+    profiles = make_profiles(10)
+    fake = FakeGeminiClient(latency_seconds=0.3)
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    options = GeminiScoringOptions(max_concurrency=1, deadline_seconds=0.05, breaker=breaker)
+
+    scores = compute_social_scores_gemini(profiles, fake, "m", options=options)
+
+    assert fake.call_count == 1  # the other nine were never sent
+    assert all(r.startswith("Fallback:") for r in reasons(scores))
+    assert breaker._failures == 1
+    assert breaker.state == "closed"
+
+
+def test_breaker_opens_after_repeated_slow_passes_and_short_circuits():
+    profiles = make_profiles(8)
+    slow = FakeGeminiClient(latency_seconds=0.3)
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    options = GeminiScoringOptions(max_concurrency=4, deadline_seconds=0.05, breaker=breaker)
+
+    for expected_state in ("closed", "closed", "open"):
+        compute_social_scores_gemini(profiles, slow, "m", options=options)
+        assert breaker.state == expected_state
+
+    calls = slow.call_count
+    scores = compute_social_scores_gemini(profiles, slow, "m", options=options)
+    assert slow.call_count == calls
+    assert all("circuit breaker open" in r for r in reasons(scores))
+
+
+def test_breaker_stays_closed_when_gemini_answers_in_time():
+    profiles = make_profiles(12)
+    fake = FakeGeminiClient(latency_seconds=0.01)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    options = GeminiScoringOptions(max_concurrency=4, deadline_seconds=5.0, breaker=breaker)
+
+    scores = compute_social_scores_gemini(profiles, fake, "m", options=options)
+
+    assert fake.call_count == 12
+    assert not any(r.startswith("Fallback:") for r in reasons(scores))
+    assert breaker.state == "closed"
+    assert breaker._failures == 0
+
+
+def test_half_open_trial_cut_off_by_the_deadline_reopens_the_breaker():
+    clock = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: clock[0])
+    options = GeminiScoringOptions(max_concurrency=2, deadline_seconds=0.05, breaker=breaker)
+    profiles = make_profiles(4)
+
+    compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.3), "m", options=options)
+    assert breaker.state == "open"
+
+    clock[0] = 11.0
+    assert breaker.state == "half-open"
+    compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.3), "m", options=options)
+    assert breaker.state == "open"
+
+    clock[0] = 22.0
+    fast = FakeGeminiClient(latency_seconds=0.0)
+    compute_social_scores_gemini(profiles, fast, "m", options=options)
+    assert breaker.state == "closed"
+    assert fast.call_count >= 1
+
@@ -0,0 +1,55 @@
+# tests/test_lazy_imports.py
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.helpers import BACKEND_DIR
+
+HEAVY_MODULES = ("dotenv", "google.genai")
+
+
+def run_python(code: str, **env: str) -> str:
+    environ = {k: v for k, v in os.environ.items() if k != "GEMINI_API_KEY"}
+    environ.update(env)
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=environ,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.mark.parametrize("module", ["auction_core", "multi_round_auction", "round_engine"])
+def test_import_does_not_load_the_gemini_sdk_or_dotenv(module):
+    loaded = run_python(
+        f"import sys, {module}; print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_rule_based_ranking_never_creates_a_client():
+    loaded = run_python(
+        "import sys, auction_core\n"
+        "auction_core.rank_profiles([{'name': 'a', 'max_bid': 1.0}], use_gemini=False)\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_client_is_created_on_first_use():
+    # No key in the environment (and none in a .env next to the backend):
+    # the first access loads dotenv and resolves to no client.
+    if os.path.exists(os.path.join(BACKEND_DIR, ".env")):
+        pytest.skip("a local .env may provide GEMINI_API_KEY")
+    out = run_python(
+        "import sys, auction_core\n"
+        "print(auction_core.gemini_client, 'dotenv' in sys.modules)"
+    )
+    assert out == "None True"
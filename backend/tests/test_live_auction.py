@@ -0,0 +1,117 @@
+# tests/test_live_auction.py
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from auction_core import compute_social_scores, rank_columns
+from live_auction import LiveAuction, OrderStatisticTreap
+from tests.helpers import make_profiles
+
+
+def scored_profiles(n: int, seed: int):
+    rng = random.Random(seed)
+    profiles = make_profiles(n)
+    for p in profiles:
+        p["max_bid"] = round(rng.uniform(100, 10000), 2)
+    social, _ = compute_social_scores(profiles, use_gemini=False)
+    return profiles, social
+
+
+def reference(names, bids, social):
+    return rank_columns(
+        names, bids, [social[n][0] for n in names], [social[n][1] for n in names], "rule-based"
+    )["ranking"]
+
+
+def rows(ranking):
+    return [(row["name"], row["money_score"], row["final_score"]) for row in ranking]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_live_ranking_matches_a_full_rerank_after_every_kind_of_bid(seed):
+    profiles, social = scored_profiles(60, seed)
+    names = [p["name"] for p in profiles]
+    bids = np.array([p["max_bid"] for p in profiles])
+    live = LiveAuction(profiles, social)
+    rng = random.Random(seed)
+
+    for step in range(600):
+        i = 0 if rng.random() < 0.3 else rng.randrange(len(names))
+        kind = rng.random()
+        if kind < 0.3:
+            amount = round(bids[i] * 1.01, 2)  # steady raiser, often the max
+        elif kind < 0.95:
+            amount = round(bids[i] * rng.uniform(0.9, 1.1), 2)
+        else:
+            amount = round(rng.uniform(50, 20000), 2)  # new min or max
+        bids[i] = amount
+        live.place_bid(names[i], amount)
+
+        ref = reference(names, bids, social)
+        probe = step % 3
+        if probe == 0:
+            assert rows(live.ranking()) == rows(ref)
+        elif probe == 1:
+            assert rows([live.leader()]) == rows(ref[:1])
+            assert rows(live.top_k(5)) == rows(ref[:5])
+        else:
+            j = rng.randrange(len(names))
+            assert live.rank_of(names[j]) == int(ref.positions()[j])
+
+    # Stale heap entries never pile up past twice the bidder count.
+    assert live.stats()["heap_entries"] <= 4 * len(names)
+
+
+def test_rows_match_rank_columns_exactly_with_profiles():
+    profiles, social = scored_profiles(20, 3)
+    live = LiveAuction(profiles, social)
+    live.place_bid(profiles[4]["name"], 12000.0)
+    profiles[4]["max_bid"] = 12000.0
+
+    ref = rank_columns(
+        [p["name"] for p in profiles],
+        [p["max_bid"] for p in profiles],
+        [social[p["name"]][0] for p in profiles],
+        [social[p["name"]][1] for p in profiles],
+        "rule-based",
+        profiles=profiles,
+    )["ranking"]
+    got = live.ranking()
+    assert [r["name"] for r in got] == [r["name"] for r in ref]
+    assert [r["final_score"] for r in got] == [r["final_score"] for r in ref]
+    bumped = got[live.rank_of(profiles[4]["name"])]
+    assert bumped["profile"]["max_bid"] == bumped["profile"]["start_bid"] == 12000.0
+
+
+def test_invalid_bids_and_names_are_rejected():
+    profiles, social = scored_profiles(3, 4)
+    live = LiveAuction(profiles, social)
+    with pytest.raises(ValueError):
+        live.place_bid(profiles[0]["name"], -1.0)
+    with pytest.raises(ValueError):
+        live.place_bid(profiles[0]["name"], float("nan"))
+    with pytest.raises(KeyError):
+        live.place_bid("nobody", 10.0)
+    with pytest.raises(ValueError):
+        LiveAuction(profiles + profiles[:1], social)
+
+
+def test_order_statistic_treap():
+    treap = OrderStatisticTreap(seed=1)
+    keys = [(random.Random(k).random(), k) for k in range(200)]
+    for key in keys:
+        treap.insert(key)
+    for key in keys[::3]:
+        treap.remove(key)
+
+    remaining = sorted(k for i, k in enumerate(keys) if i % 3)
+    assert len(treap) == len(remaining)
+    assert list(treap.iter_keys()) == remaining
+    assert [treap.kth(i) for i in (0, 10, len(remaining) - 1)] == [
+        remaining[0], remaining[10], remaining[-1]
+    ]
+    assert treap.rank(remaining[25]) == 25
@@ -0,0 +1,131 @@
+# tests/test_llm_limits.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from fake_gemini_client import FakeGeminiClient
+from llm_limits import TokenBucket
+from tests.helpers import make_profiles
+
+
+class InFlightClient(FakeGeminiClient):
+    """FakeGeminiClient that records the most requests it had in flight at once."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._count_lock = threading.Lock()
+
+    def _enter(self):
+        with self._count_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self):
+        with self._count_lock:
+            self.in_flight -= 1
+
+    def _generate(self, model, contents):
+        self._enter()
+        try:
+            return super()._generate(model, contents)
+        finally:
+            self._exit()
+
+    async def _generate_async(self, model, contents):
+        self._enter()
+        try:
+            return await super()._generate_async(model, contents)
+        finally:
+            self._exit()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_gemini_calls_never_exceed_max_concurrency(max_concurrency):
+    fake = InFlightClient(latency_seconds=0.02)
+    options = GeminiScoringOptions(max_concurrency=max_concurrency)
+
+    scores = compute_social_scores_gemini(make_profiles(12), fake, "m", options=options)
+
+    assert len(scores) == 12
+    assert fake.call_count == 12
+    assert fake.max_in_flight == max_concurrency
+
+
+def test_concurrent_scores_match_sequential_scores():
+    profiles = make_profiles(10)
+    sequential = compute_social_scores_gemini(
+        profiles, FakeGeminiClient(latency_seconds=0.0), "m",
+        options=GeminiScoringOptions(max_concurrency=1),
+    )
+    concurrent = compute_social_scores_gemini(
+        profiles, FakeGeminiClient(latency_seconds=0.0, jitter_seconds=0.01), "m",
+        options=GeminiScoringOptions(max_concurrency=8),
+    )
+    assert concurrent == sequential
+
+
+def test_token_bucket_allows_a_burst_then_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    clock.now += 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    clock.now += 100
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_token_bucket_acquire_waits_for_the_next_token():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.25)
+    assert clock.now == pytest.approx(0.25)
+    with pytest.raises(ValueError):
+        bucket.acquire(2)
+
+
+def test_token_bucket_per_minute_and_async_acquire():
+    bucket = TokenBucket.per_minute(600)  # 10 per second, burst of 10
+    assert bucket.rate == 10.0
+    assert bucket.capacity == 10.0
+
+    async def drain() -> float:
+        waited = 0.0
+        for _ in range(11):
+            waited += await bucket.acquire_async()
+        return waited
+
+    assert asyncio.run(drain()) == pytest.approx(0.1, abs=0.05)
+
+
+def test_shared_rate_limiter_paces_gemini_calls():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1000.0, capacity=2, clock=clock)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+    options = GeminiScoringOptions(max_concurrency=4, rate_limiter=bucket)
+
+    compute_social_scores_gemini(make_profiles(2), fake, "m", options=options)
+
+    assert fake.call_count == 2
+    assert not bucket.try_acquire()  # both burst tokens were spent on the calls
@@ -0,0 +1,85 @@
+# tests/test_multi_round_auction.py
+
+from __future__ import annotations
+
+from auction_core import compute_social_scores, set_gemini_client
+from fake_gemini_client import FakeGeminiClient
+from multi_round_auction import (
+    iter_multi_round_auction,
+    run_multi_round_auction,
+    stream_multi_round_auction,
+)
+from tests.helpers import make_config
+
+
+def gemini_config(num_agents: int, num_rounds: int, seed: int):
+    config = make_config(num_agents, num_rounds, seed)
+    config["gemini"] = {"enabled": True, "model": "m", "max_concurrency": 4}
+    return config
+
+
+def test_social_scores_are_computed_once_per_auction():
+    config = gemini_config(6, 5, 1)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+    set_gemini_client(fake)
+
+    result = run_multi_round_auction(config).to_dict()
+
+    assert fake.call_count == 6  # one call per agent, not per agent per round
+    assert result["social_mode"] == "gemini"
+    assert len(result["rounds"]) == 5
+    per_round = [
+        sorted((e["name"], e["social_score"], e["social_reason"]) for e in r["ranking"])
+        for r in result["rounds"]
+    ]
+    assert all(scores == per_round[0] for scores in per_round)
+
+
+def test_precomputed_social_scores_skip_scoring():
+    config = gemini_config(6, 4, 2)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+    set_gemini_client(fake)
+    social, mode = compute_social_scores(config["agents"], use_gemini=False)
+
+    first = run_multi_round_auction(config, social_scores=social, social_mode=mode).to_dict()
+    second = run_multi_round_auction(config, social_scores=social, social_mode=mode).to_dict()
+
+    assert fake.call_count == 0
+    assert first == second
+    assert first["social_mode"] == "rule-based"
+
+
+def test_iter_yields_the_rounds_run_returns():
+    config = make_config(15, 6, 3)
+    full = run_multi_round_auction(config).to_dict()
+
+    streamed = [r.to_dict() for r in iter_multi_round_auction(config)]
+
+    assert streamed == full["rounds"]
+    assert [r["round_index"] for r in streamed] == list(range(1, 7))
+
+
+def test_iter_scores_on_first_next_and_can_stop_early():
+    config = gemini_config(5, 10, 4)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+    set_gemini_client(fake)
+
+    rounds = iter_multi_round_auction(config)
+    assert fake.call_count == 0
+    first = next(rounds)
+    assert fake.call_count == 5
+    assert first.round_index == 1
+    rounds.close()
+
+
+def test_stream_hands_every_round_to_the_sink():
+    config = make_config(15, 6, 5)
+    full = run_multi_round_auction(config).to_dict()
+    seen = []
+
+    result = stream_multi_round_auction(config, lambda r: seen.append(r.to_dict()))
+
+    assert seen == full["rounds"]
+    assert result.rounds == []
+    assert result.final_winner == full["final_winner"]
+    assert result.rounds_played == 6
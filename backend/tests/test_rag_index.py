@@ -0,0 +1,68 @@
+# tests/test_rag_index.py
+
+from __future__ import annotations
+
+from rag_index import RagIndex, estimate_tokens, split_passages
+
+FILLER = "The weather was mild and the meeting ran long without any decisions."
+
+DOCS = [
+    {"name": "Ana", "text": f"{FILLER}\n\nAna funded a school for hungry children in Lagos.\n\n{FILLER}"},
+    {"name": "Ana", "text": "Ana volunteers at a refugee hospital every weekend."},
+    {"name": "Ben", "text": "Ben donated to hungry children and a children's hospital."},
+    {"name": "Ben", "text": ""},
+]
+
+
+def test_passages_are_ranked_by_relevance_to_the_query():
+    index = RagIndex(DOCS, top_k=2, token_budget=1000)
+
+    best = index.search("Ana", "school hungry children")
+    assert len(best) == 2
+    assert best[0] == "Ana funded a school for hungry children in Lagos."
+    assert index.search("Ana", "refugee hospital")[0] == (
+        "Ana volunteers at a refugee hospital every weekend."
+    )
+    # Only that person's passages are ever considered.
+    assert all("Ben" not in passage for passage in index.search("Ana", "children hospital"))
+    assert index.search("Nobody", "children") == []
+
+
+def test_top_k_and_token_budget_bound_the_context():
+    index = RagIndex(DOCS, top_k=10, token_budget=25)
+    selected = index.search("Ana", "school children hospital")
+
+    assert sum(estimate_tokens(p) for p in selected) <= 25
+    assert selected[0] == "Ana funded a school for hungry children in Lagos."
+    assert len(index.search("Ana", "school", top_k=1, token_budget=1000)) == 1
+    # A passage over budget is skipped, but a smaller one after it still fits.
+    tight = index.search("Ana", "weather meeting", top_k=10, token_budget=estimate_tokens(FILLER) - 1)
+    assert FILLER not in tight
+    assert tight[0] == "Ana funded a school for hungry children in Lagos."
+
+
+def test_still_maps_names_to_their_documents():
+    index = RagIndex(DOCS)
+
+    assert sorted(index) == ["Ana", "Ben"]
+    assert len(index) == 2
+    assert index["Ben"] == ["Ben donated to hungry children and a children's hospital."]
+    assert index.get("Nobody", []) == []
+
+
+def test_context_is_memoized_per_name_and_query():
+    index = RagIndex(DOCS, top_k=1)
+
+    first = index.context("Ana", "school")
+    assert first == "Ana funded a school for hungry children in Lagos."
+    assert index.context("Ana", "school") is first
+    assert index.stats()["queries"] == 1
+
+
+def test_from_config_and_passage_splitting():
+    index = RagIndex.from_config(
+        {"rag_docs": DOCS, "rag": {"top_k": 1, "token_budget": 50, "max_passage_words": 4}}
+    )
+    assert (index.top_k, index.token_budget) == (1, 50)
+    assert split_passages("a b c d e f\n\n g h", 4) == ["a b c d", "e f", "g h"]
+    assert all(len(p.split()) <= 4 for p in index.search("Ana", "school", top_k=100, token_budget=1000))
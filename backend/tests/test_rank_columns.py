@@ -0,0 +1,74 @@
+# tests/test_rank_columns.py
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from auction_core import compute_social_scores_rule_based, rank_columns, rank_profiles
+from tests.helpers import make_profiles
+
+
+def plain_ranking(profiles: List[Dict[str, Any]], weight_social: float = 0.7, weight_money: float = 0.3):
+    """The per-dict loop rank_profiles() used before the columnar path."""
+    social = compute_social_scores_rule_based(profiles)
+    max_bids = [p["max_bid"] for p in profiles]
+    lo, hi = min(max_bids), max(max_bids)
+    rows = []
+    for p in profiles:
+        money = 1.0 if hi == lo else min(max((p["max_bid"] - lo) / (hi - lo), 0.0), 1.0)
+        score, reason = social[p["name"]]
+        rows.append({
+            "name": p["name"],
+            "money_score": round(money, 3),
+            "social_score": round(score, 3),
+            "final_score": round(weight_social * score + weight_money * money, 3),
+            "social_reason": reason,
+            "profile": p,
+        })
+    return sorted(rows, key=lambda row: -row["final_score"])
+
+
+@pytest.mark.parametrize("num_profiles,seed", [(1, 0), (7, 1), (250, 2)])
+def test_rank_profiles_matches_plain_sort(num_profiles, seed):
+    rng = random.Random(seed)
+    profiles = make_profiles(num_profiles)
+    for p in profiles:
+        # Few distinct bids, so ties in final_score are common.
+        p["max_bid"] = float(rng.choice([1000, 2500, 2500, 4000, 9000]))
+
+    result = rank_profiles(profiles, use_gemini=False)
+
+    expected = plain_ranking(profiles)
+    assert list(result["ranking"]) == expected
+    assert result["winner"] == expected[0]
+    assert result["social_mode"] == "rule-based"
+
+
+def test_equal_bids_all_get_full_money_score():
+    profiles = make_profiles(4)
+    for p in profiles:
+        p["max_bid"] = 500.0
+    ranking = rank_profiles(profiles, use_gemini=False)["ranking"]
+    assert [row["money_score"] for row in ranking] == [1.0] * 4
+
+
+def test_ranking_view_builds_rows_lazily_and_reports_positions():
+    names = ["a", "b", "c", "d"]
+    result = rank_columns(names, [10.0, 40.0, 20.0, 30.0], [0.5] * 4, [""] * 4, "rule-based")
+    view = result["ranking"]
+    assert list(view._rows) == [0]  # only the winner row so far
+
+    assert [row["name"] for row in view] == ["b", "d", "c", "a"]
+    assert view[-1]["name"] == "a"
+    assert [row["name"] for row in view[1:3]] == ["d", "c"]
+    assert list(view.positions()) == [3, 0, 2, 1]
+    with pytest.raises(IndexError):
+        view[4]
+
+
+def test_rank_columns_rejects_empty_input():
+    with pytest.raises(ValueError):
+        rank_columns([], [], [], [], "rule-based")
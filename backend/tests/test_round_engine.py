@@ -0,0 +1,40 @@
+# tests/test_round_engine.py
+
+from __future__ import annotations
+
+import pytest
+
+from auction_core import compute_social_scores
+from multi_round_auction import run_multi_round_auction
+from round_engine import AgentArrays, run_multi_round_auction_vectorized
+from tests.helpers import make_config
+
+
+@pytest.mark.parametrize("num_agents,seed", [(25, 1), (300, 7)])
+def test_vectorized_engine_matches_agent_engine(num_agents, seed):
+    config = make_config(num_agents, 12, seed)
+    social, mode = compute_social_scores(config["agents"], use_gemini=False)
+
+    agents = run_multi_round_auction(config, social_scores=social, social_mode=mode).to_dict()
+    vectorized = run_multi_round_auction_vectorized(
+        config, social_scores=social, social_mode=mode
+    ).to_dict()
+
+    assert vectorized == agents
+
+
+def test_vectorized_engine_scores_socially_on_its_own():
+    config = make_config(10, 4, 3)
+    assert (
+        run_multi_round_auction_vectorized(config).to_dict()
+        == run_multi_round_auction(config).to_dict()
+    )
+
+
+def test_agent_arrays_keep_bids_within_caps():
+    config = make_config(50, 1, 5)
+    arrays = AgentArrays.from_config(config)
+
+    assert len(arrays) == 50
+    assert (arrays.current_bid <= arrays.true_max_bid).all()
+    assert sorted(i for members in arrays.strategy_members for i in members) == list(range(50))
@@ -0,0 +1,117 @@
+# tests/test_rule_keywords.py
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from auction_core import (
+    NEGATIVE_PROFESSIONS,
+    POSITIVE_KEYWORDS,
+    RuleKeywords,
+    clamp,
+    compute_social_score_rule_based,
+    extract_donation_amount,
+    rule_keywords_from_config,
+)
+from auction_jobs import _run_rank_job
+from keyword_matcher import KeywordMatcher, flatten_keyword_weights
+from tests.helpers import api_request, make_profiles
+
+# Boosts teachers far above everyone else.
+TEACHER_BOOST = {"profession_bonus": {"teacher": 0.45}}
+
+
+def plain_rule_score(profile):
+    """The keyword-by-keyword scan the matcher replaced."""
+    profession = profile.get("profession", "").lower()
+    contrib = profile.get("social_contribution", "").lower()
+    score = 0.5
+    for bad in NEGATIVE_PROFESSIONS:
+        if bad in profession:
+            score -= 0.3
+    if "lawyer" in profession or "doctor" in profession or "teacher" in profession:
+        score += 0.1
+    for kw in POSITIVE_KEYWORDS:
+        if kw in contrib:
+            score += 0.05
+    score += clamp(extract_donation_amount(profile.get("social_contribution", "")) / 10000.0, 0.0, 0.2)
+    return clamp(score)
+
+
+@pytest.mark.parametrize("scan_threshold", [0, 1000])
+def test_matcher_agrees_with_a_plain_scan(scan_threshold):
+    rng = random.Random(5)
+    alphabet = "abc "
+    keywords = {
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() or "a": 1.0
+        for _ in range(60)
+    }
+    matcher = KeywordMatcher(keywords, scan_threshold=scan_threshold)
+
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert matcher.matches(text) == [kw for kw in matcher.keywords if kw in text]
+
+
+def test_rule_based_scores_match_the_plain_scan():
+    profiles = make_profiles(8) + [
+        {"name": "x", "profession": "Oil company executive and arms dealer", "social_contribution": ""},
+        {"name": "y", "profession": "Doctor", "social_contribution":
+            "Funded clean water and scholarships for hungry children; donated $12,000."},
+        {"name": "z"},
+    ]
+    for p in profiles:
+        assert compute_social_score_rule_based(p) == pytest.approx(plain_rule_score(p), abs=1e-12)
+
+
+def test_keywords_can_be_weighted_and_grouped_by_area():
+    flat = flatten_keyword_weights(
+        {"education": {"School": 0.1, "tutor": None}, "health": ["clinic", "school"]}, 0.05
+    )
+    assert flat == {"school": 0.1, "tutor": 0.05, "clinic": 0.05}
+
+    keywords = RuleKeywords.from_config({"positive_keywords": flat})
+    profile = {"profession": "", "social_contribution": "Built a school and a clinic."}
+    assert compute_social_score_rule_based(profile, keywords) == pytest.approx(0.65)
+    assert rule_keywords_from_config({"positive_keywords": flat}) is rule_keywords_from_config(
+        {"positive_keywords": dict(flat)}
+    )
+
+
+def _teacher_scores(rows):
+    return {row["name"]: row["social_score"] for row in rows if row["profile"]["profession"] == "Teacher"}
+
+
+def test_api_paths_use_the_configured_keywords(api, monkeypatch):
+    monkeypatch.setattr(api, "RULE_KEYWORDS", rule_keywords_from_config(TEACHER_BOOST))
+    profiles = make_profiles(4)
+    default = {p["name"]: compute_social_score_rule_based(p) for p in profiles}
+    boosted = {
+        p["name"]: compute_social_score_rule_based(p, api.RULE_KEYWORDS)
+        for p in profiles if p["profession"] == "Teacher"
+    }
+    assert all(boosted[name] > default[name] for name in boosted)
+
+    single = api_request(api.app, "POST", "/run-auction", json={"profiles": profiles, "use_gemini": False})
+    bulk = api_request(
+        api.app, "POST", "/run-auctions",
+        json={"auctions": [{"auction_id": "a", "profiles": profiles}], "use_gemini": False},
+    )
+
+    expected = {name: round(score, 3) for name, score in boosted.items()}
+    assert _teacher_scores(single.json()["ranking"]) == expected
+    assert _teacher_scores(bulk.json()["results"][0]["ranking"]) == expected
+
+
+def test_rank_jobs_use_the_configured_keywords():
+    profiles = make_profiles(4)
+    keywords = rule_keywords_from_config(TEACHER_BOOST)
+    result = _run_rank_job(
+        {"profiles": profiles, "use_gemini": False, "gemini": {}, "rule_based": TEACHER_BOOST}
+    )
+    assert _teacher_scores(result["ranking"]) == {
+        p["name"]: round(compute_social_score_rule_based(p, keywords), 3)
+        for p in profiles if p["profession"] == "Teacher"
+    }
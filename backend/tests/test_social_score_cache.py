@@ -0,0 +1,138 @@
+# tests/test_social_score_cache.py
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+from auction_core import GeminiScoringOptions, compute_social_scores_gemini
+from fake_gemini_client import FakeGeminiClient
+from multi_round_auction import load_config
+from social_score_cache import SocialScoreCache, social_score_cache_key
+from tests.helpers import CONFIG_PATH, make_profiles
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_ignores_bids_but_not_profile_text():
+    profile = make_profiles(1)[0]
+    key = social_score_cache_key(profile, "", "m")
+
+    assert social_score_cache_key(dict(profile, max_bid=99999.0, start_bid=5.0), "", "m") == key
+    assert social_score_cache_key(dict(profile, profession="Banker"), "", "m") != key
+    assert social_score_cache_key(profile, "some rag context", "m") != key
+    assert social_score_cache_key(profile, "", "other-model") != key
+
+
+def test_scores_persist_across_instances(tmp_path):
+    path = str(tmp_path / "scores.sqlite3")
+    cache = SocialScoreCache(path=path)
+    cache.put("k", "Bidder 0", "m", 0.75, "because")
+    cache.close()
+
+    reopened = SocialScoreCache(path=path)
+    assert reopened.get("k") == (0.75, "because")
+    assert reopened.get("missing") is None
+    assert reopened.stats()["hits"] == 1
+    assert reopened.stats()["misses"] == 1
+    reopened.close()
+
+
+def test_least_recently_read_entries_are_evicted(tmp_path):
+    clock = FakeClock()
+    cache = SocialScoreCache(path=str(tmp_path / "lru.sqlite3"), max_entries=2, clock=clock)
+    cache.put("a", "A", "m", 0.1, "")
+    clock.now += 1
+    cache.put("b", "B", "m", 0.2, "")
+    clock.now += 1
+    assert cache.get("a") is not None  # "b" is now least recently read
+    clock.now += 1
+    cache.put("c", "C", "m", 0.3, "")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+    cache.close()
+
+
+def test_expired_entries_are_misses(tmp_path):
+    clock = FakeClock()
+    cache = SocialScoreCache(path=str(tmp_path / "ttl.sqlite3"), ttl_seconds=60, clock=clock)
+    cache.put("k", "A", "m", 0.5, "")
+
+    clock.now += 59
+    assert cache.get("k") == (0.5, "")
+    clock.now += 2
+    assert cache.get("k") is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_invalidate_profile_drops_every_score_for_a_bidder(tmp_path):
+    cache = SocialScoreCache(path=str(tmp_path / "inv.sqlite3"))
+    cache.put("k1", "A", "m1", 0.5, "")
+    cache.put("k2", "A", "m2", 0.6, "")
+    cache.put("k3", "B", "m1", 0.7, "")
+
+    assert cache.invalidate_profile("A") == 2
+    assert cache.invalidate("k3")
+    assert not cache.invalidate("k3")
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_second_scoring_pass_is_served_from_the_cache(tmp_path):
+    profiles = make_profiles(6)
+    cache = SocialScoreCache(path=str(tmp_path / "scores.sqlite3"))
+    options = GeminiScoringOptions(max_concurrency=2, cache=cache)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+
+    first = compute_social_scores_gemini(profiles, fake, "m", options=options)
+    rebid = [dict(p, max_bid=p["max_bid"] * 2) for p in profiles]
+    second = compute_social_scores_gemini(rebid, fake, "m", options=options)
+
+    assert second == first
+    assert fake.call_count == 6
+    assert len(cache) == 6
+    cache.close()
+
+
+def test_shipped_config_leaves_the_cache_and_limits_off():
+    gemini_cfg = load_config(CONFIG_PATH)["gemini"]
+    options = GeminiScoringOptions.from_config(gemini_cfg)
+
+    assert options.cache is None
+    assert options.rate_limiter is None
+    assert options.deadline_seconds is None
+    assert options.hedge_after_seconds is None
+    assert options.breaker is None
+
+
+def test_relative_cache_path_resolves_against_the_config_file(tmp_path, monkeypatch):
+    config_dir = tmp_path / "conf"
+    config_dir.mkdir()
+    path = config_dir / "auction_config.json"
+    shutil.copy(CONFIG_PATH, path)
+    config = json.loads(path.read_text())
+    config["gemini"]["cache_path"] = "scores.sqlite3"
+    path.write_text(json.dumps(config))
+
+    monkeypatch.chdir(tmp_path)
+    loaded = load_config(os.path.join("conf", "auction_config.json"))
+
+    assert loaded["gemini"]["cache_path"] == str(config_dir / "scores.sqlite3")
+    cache = SocialScoreCache.from_config(loaded["gemini"])
+    cache.put("k", "A", "m", 0.5, "")
+    cache.close()
+    assert (config_dir / "scores.sqlite3").exists()
+    assert not (tmp_path / "scores.sqlite3").exists()
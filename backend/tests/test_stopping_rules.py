@@ -0,0 +1,87 @@
+# tests/test_stopping_rules.py
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from multi_round_auction import (
+    STOP_ALL_CAPPED,
+    STOP_LEADER_UNBEATABLE,
+    STOP_NUM_ROUNDS,
+    STOP_STABLE_RANKING,
+    StoppingRules,
+    load_config,
+    run_multi_round_auction,
+)
+from round_engine import run_multi_round_auction_vectorized
+from tests.helpers import CONFIG_PATH, make_config
+
+
+def with_stopping(config, **rules):
+    config = copy.deepcopy(config)
+    config["auction_params"]["stopping"] = rules
+    return config
+
+
+def order(round_dict):
+    return [row["name"] for row in round_dict["ranking"]]
+
+
+def test_rules_ship_disabled():
+    rules = StoppingRules.from_config(load_config(CONFIG_PATH)["auction_params"].get("stopping"))
+    assert not rules.enabled
+    assert StoppingRules.from_config(None) == StoppingRules()
+
+
+def test_without_rules_every_round_is_played():
+    result = run_multi_round_auction(make_config(10, 8, 1))
+    assert result.rounds_played == 8
+    assert result.stop_reason == STOP_NUM_ROUNDS
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_stable_ranking_stops_after_unchanged_rounds(seed):
+    config = make_config(6, 40, seed)
+    full = run_multi_round_auction(config).to_dict()
+    stopped = run_multi_round_auction(with_stopping(config, stable_rounds=2)).to_dict()
+
+    played = stopped["rounds_played"]
+    assert stopped["rounds"] == full["rounds"][:played]
+    if stopped["stop_reason"] == STOP_STABLE_RANKING:
+        last = stopped["rounds"][-3:]
+        assert order(last[0]) == order(last[1]) == order(last[2])
+    else:
+        assert played == 40
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_unbeatable_leader_is_the_final_winner(seed):
+    config = make_config(8, 30, seed)
+    full = run_multi_round_auction(config).to_dict()
+    stopped = run_multi_round_auction(with_stopping(config, leader_unbeatable=True)).to_dict()
+
+    assert stopped["rounds"] == full["rounds"][: stopped["rounds_played"]]
+    if stopped["stop_reason"] == STOP_LEADER_UNBEATABLE:
+        assert stopped["final_winner"]["name"] == full["final_winner"]["name"]
+
+
+def test_all_capped_stops_once_nobody_can_raise():
+    config = make_config(5, 10, 4)
+    for agent in config["agents"]:
+        agent["start_bid"] = agent["max_bid"]
+    config["auction_params"]["buyer_name"] = ""
+
+    stopped = run_multi_round_auction(with_stopping(config, all_capped=True))
+
+    assert stopped.rounds_played == 1
+    assert stopped.stop_reason == STOP_ALL_CAPPED
+
+
+def test_vectorized_engine_stops_on_the_same_round():
+    config = with_stopping(make_config(30, 25, 7), stable_rounds=1, leader_unbeatable=True)
+    assert (
+        run_multi_round_auction_vectorized(config).to_dict()
+        == run_multi_round_auction(config).to_dict()
+    )
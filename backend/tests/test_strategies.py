@@ -0,0 +1,113 @@
+# tests/test_strategies.py
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import auction_strategies
+from auction_rng import AuctionRng
+from auction_strategies import (
+    LinearRaiseStrategy,
+    SniperStrategy,
+    build_strategy,
+    plan_raises,
+    register_strategy,
+    registered_strategies,
+)
+from multi_round_auction import run_multi_round_auction
+from round_engine import run_multi_round_auction_vectorized
+from tests.helpers import make_config
+
+
+class FixedStep:
+    """Raises a fixed amount every round and counts how often it is asked."""
+
+    calls = []
+
+    def __init__(self, params):
+        self.step = float(params["step"])
+
+    def planned_raise(self, batch):
+        FixedStep.calls.append((batch.round_index, len(batch)))
+        return np.full(len(batch), self.step)
+
+
+@pytest.fixture
+def fixed_step(monkeypatch):
+    monkeypatch.setattr(auction_strategies, "_REGISTRY", dict(auction_strategies._REGISTRY))
+    FixedStep.calls = []
+    register_strategy("fixed_step")(FixedStep)
+    return FixedStep
+
+
+def fixed_step_config(num_agents, num_rounds, seed):
+    config = make_config(num_agents, num_rounds, seed)
+    config["strategy_params"]["fixed_step"] = {"step": 250.0}
+    for agent in config["agents"][::2]:
+        agent["strategy"] = "fixed_step"
+    return config
+
+
+def test_registered_strategy_drives_its_agents(fixed_step):
+    config = fixed_step_config(10, 6, 1)
+    start = {a["name"]: a for a in config["agents"] if a["strategy"] == "fixed_step"}
+
+    result = run_multi_round_auction(config)
+
+    last_bids = {row["name"]: row["profile"]["max_bid"] for row in result.rounds[-1].ranking}
+    for name, agent in start.items():
+        assert last_bids[name] == min(agent["start_bid"] + 5 * 250.0, agent["max_bid"])
+    assert "fixed_step" in registered_strategies()
+    assert run_multi_round_auction_vectorized(config).to_dict() == result.to_dict()
+
+
+def test_each_strategy_plans_once_per_round(fixed_step):
+    config = fixed_step_config(40, 8, 2)
+    for agent in config["agents"]:
+        agent["max_bid"] = agent["start_bid"] + 1e6  # nobody runs out of headroom
+
+    run_multi_round_auction(config)
+
+    assert [round_index for round_index, _ in fixed_step.calls] == list(range(1, 8))
+    assert all(size == 20 for _, size in fixed_step.calls)
+
+
+def test_unknown_names_fall_back_to_the_linear_rule():
+    params = {"base_fraction": 0.5, "rand_min": 1, "rand_max": 1,
+              "loser_factor_min": 1, "loser_factor_max": 1}
+    assert isinstance(build_strategy("some_old_name", params), LinearRaiseStrategy)
+    assert isinstance(build_strategy("sniper", {}), SniperStrategy)
+
+
+def test_plan_caps_at_true_max_bid_and_skips_capped_agents():
+    strategy = LinearRaiseStrategy({"base_fraction": 5.0, "rand_min": 1, "rand_max": 1,
+                                    "loser_factor_min": 1, "loser_factor_max": 1})
+    current = np.array([100.0, 500.0, 300.0])
+    caps = np.array([1000.0, 500.0, 301.234])
+
+    plan = plan_raises(
+        [strategy], [np.arange(3)], np.array([0, 1, 2]), current, caps,
+        round_index=1, total_rounds=2, rng=AuctionRng.from_seed(0),
+    )
+
+    assert plan.raising.tolist() == [True, False, True]
+    assert plan.new_bid.tolist() == [1000.0, 500.0, 301.23]
+    assert plan.planned_raise[1] == 0.0
+
+
+def test_sniper_waits_for_its_last_rounds():
+    config = make_config(6, 6, 3)
+    config["strategy_params"]["sniper"] = {"snipe_rounds": 1, "snipe_fraction": 1.0}
+    sniper = config["agents"][1]
+    sniper["strategy"] = "sniper"
+    config["auction_params"]["buyer_name"] = ""
+
+    rounds = run_multi_round_auction(config).rounds
+    bids = [
+        next(row["profile"]["max_bid"] for row in r.ranking if row["name"] == sniper["name"])
+        for r in rounds
+    ]
+
+    assert bids[:-1] == [sniper["start_bid"]] * 5
+    assert bids[-1] == sniper["max_bid"]
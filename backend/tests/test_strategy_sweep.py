@@ -0,0 +1,49 @@
+# tests/test_strategy_sweep.py
+
+from __future__ import annotations
+
+import pytest
+
+from strategy_sweep import apply_point, grid_points, lhs_points, random_points, run_sweep
+from tests.helpers import make_config
+
+SPACE = {"greedy.base_fraction": [0.3, 0.8], "cautious.rand_max": [1.0, 1.4]}
+
+
+def test_grid_covers_the_product_of_values():
+    points = grid_points({"greedy.base_fraction": [0.3, 0.5, 0.8], "cautious.rand_max": [1.0, 1.4]})
+    assert len(points) == 6
+    assert points[0] == {"greedy.base_fraction": 0.3, "cautious.rand_max": 1.0}
+    assert points[-1] == {"greedy.base_fraction": 0.8, "cautious.rand_max": 1.4}
+
+
+def test_lhs_hits_every_stratum_once():
+    points = lhs_points(SPACE, samples=10, seed=1)
+    for key, (low, high) in SPACE.items():
+        strata = sorted(int((p[key] - low) / (high - low) * 10) for p in points)
+        assert strata == list(range(10))
+    assert random_points(SPACE, samples=10, seed=1) == random_points(SPACE, samples=10, seed=1)
+
+
+def test_apply_point_overrides_only_the_named_params():
+    config = make_config(4, 3, 1)
+    point_config = apply_point(config, {"greedy.base_fraction": 0.9})
+
+    assert point_config["strategy_params"]["greedy"]["base_fraction"] == 0.9
+    assert config["strategy_params"]["greedy"]["base_fraction"] != 0.9
+    with pytest.raises(KeyError):
+        apply_point(config, {"nope.base_fraction": 0.9})
+    with pytest.raises(ValueError):
+        apply_point(config, {"greedy": 0.9})
+
+
+def test_sweep_rows_are_identical_for_any_worker_count():
+    config = make_config(10, 6, 2)
+    points = lhs_points(SPACE, samples=6, seed=0)
+
+    inline = list(run_sweep(config, points, runs_per_point=3, workers=1, chunk_size=4))
+    pooled = list(run_sweep(config, points, runs_per_point=3, workers=2, chunk_size=4))
+
+    assert pooled == inline
+    assert [{k: row[k] for k in SPACE} for row in inline] == points
+    assert list(run_sweep(config, points, runs_per_point=3, workers=1, chunk_size=1)) == inline
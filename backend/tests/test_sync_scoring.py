@@ -0,0 +1,87 @@
+# tests/test_sync_scoring.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from auction_core import (
+    GeminiScoringOptions,
+    compute_social_scores_gemini,
+    compute_social_scores_gemini_async,
+    rank_profiles,
+    rank_profiles_async,
+    set_gemini_client,
+)
+from fake_gemini_client import FakeGeminiClient
+from tests.helpers import make_profiles
+
+
+class CountingClient(FakeGeminiClient):
+    """FakeGeminiClient that counts sync (client.models) and async (client.aio) requests."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sync_calls = 0
+        self.aio_calls = 0
+        self._count_lock = threading.Lock()
+
+    def _generate(self, model, contents):
+        with self._count_lock:
+            self.sync_calls += 1
+        return super()._generate(model, contents)
+
+    async def _generate_async(self, model, contents):
+        self.aio_calls += 1
+        return await super()._generate_async(model, contents)
+
+
+OPTIONS = GeminiScoringOptions(max_concurrency=4)
+
+
+def test_blocking_callers_use_the_sync_client():
+    fake = CountingClient(latency_seconds=0.0)
+
+    compute_social_scores_gemini(make_profiles(6), fake, "m", options=OPTIONS)
+
+    assert (fake.sync_calls, fake.aio_calls) == (6, 0)
+
+
+def test_event_loop_callers_use_client_aio():
+    fake = CountingClient(latency_seconds=0.0)
+
+    asyncio.run(compute_social_scores_gemini_async(make_profiles(6), fake, "m", options=OPTIONS))
+
+    assert (fake.sync_calls, fake.aio_calls) == (0, 6)
+
+
+def test_blocking_calls_reuse_one_loop_and_pool():
+    profiles = make_profiles(8)
+    compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.01), "m", options=OPTIONS)
+    threads = threading.active_count()
+
+    for _ in range(5):
+        compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.01), "m", options=OPTIONS)
+
+    assert threading.active_count() == threads
+
+
+def test_blocking_call_from_inside_a_running_loop():
+    profiles = make_profiles(5)
+    expected = compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.0), "m")
+
+    async def caller():
+        return compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.0), "m")
+
+    assert asyncio.run(caller()) == expected
+
+
+def test_rank_profiles_matches_rank_profiles_async():
+    set_gemini_client(FakeGeminiClient(latency_seconds=0.0))
+    profiles = make_profiles(9)
+
+    blocking = rank_profiles(profiles, model_name="m", gemini_options=OPTIONS)
+    awaited = asyncio.run(rank_profiles_async(profiles, model_name="m", gemini_options=OPTIONS))
+
+    assert list(blocking["ranking"]) == list(awaited["ranking"])
+    assert blocking["social_mode"] == awaited["social_mode"] == "gemini"
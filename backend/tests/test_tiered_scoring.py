@@ -0,0 +1,98 @@
+# tests/test_tiered_scoring.py
+
+from __future__ import annotations
+
+from auction_core import (
+    TieringOptions,
+    compute_social_scores_gemini,
+    compute_social_scores_tiered,
+    rank_profiles,
+    rule_based_breakdown,
+    rule_based_confidence,
+    set_gemini_client,
+)
+from fake_gemini_client import FakeGeminiClient
+from tests.helpers import make_profiles
+
+
+def test_confident_profiles_stay_rule_based():
+    profiles = make_profiles(8)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+
+    scores, tiers = compute_social_scores_tiered(
+        profiles, fake, "m", tiering=TieringOptions(confidence_threshold=0.0, flip_top_k=0)
+    )
+
+    assert fake.call_count == 0
+    assert set(tiers.values()) == {"rule-based"}
+    assert set(scores) == {p["name"] for p in profiles}
+
+
+def test_everyone_escalated_matches_plain_gemini_scoring():
+    profiles = make_profiles(8)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+
+    scores, tiers = compute_social_scores_tiered(
+        profiles, fake, "m", tiering=TieringOptions(confidence_threshold=1.1)
+    )
+
+    assert fake.call_count == 8
+    assert set(tiers.values()) == {"gemini"}
+    assert scores == compute_social_scores_gemini(profiles, FakeGeminiClient(latency_seconds=0.0), "m")
+
+
+def test_only_uncertain_profiles_are_escalated_without_flip_checks():
+    profiles = make_profiles(12)
+    threshold = 0.6
+    uncertain = {
+        p["name"] for p in profiles
+        if rule_based_confidence(rule_based_breakdown(p)) < threshold
+    }
+    assert 0 < len(uncertain) < len(profiles)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+
+    _, tiers = compute_social_scores_tiered(
+        profiles, fake, "m", tiering=TieringOptions(confidence_threshold=threshold, flip_top_k=0)
+    )
+
+    assert {name for name, tier in tiers.items() if tier == "gemini"} == uncertain
+    assert fake.call_count == len(uncertain)
+
+
+def test_close_neighbours_at_the_top_are_escalated():
+    profiles = make_profiles(3)
+    for p in profiles:
+        # Identical, clear-cut harmful profiles, so only the bids differ.
+        p["profession"] = "Tobacco factory owner"
+        p["social_contribution"] = "None."
+    profiles[0]["max_bid"] = 5000.0
+    profiles[1]["max_bid"] = 4999.0
+    profiles[2]["max_bid"] = 100.0
+    fake = FakeGeminiClient(latency_seconds=0.0)
+
+    _, confident_only = compute_social_scores_tiered(
+        profiles, fake, "m", tiering=TieringOptions(confidence_threshold=0.6, flip_top_k=0)
+    )
+    _, with_flips = compute_social_scores_tiered(
+        profiles, fake, "m", tiering=TieringOptions(confidence_threshold=0.6, flip_top_k=None)
+    )
+
+    assert set(confident_only.values()) == {"rule-based"}
+    assert with_flips == {"Bidder 0": "gemini", "Bidder 1": "gemini", "Bidder 2": "rule-based"}
+    assert fake.call_count == 2
+
+
+def test_rank_profiles_reports_tier_counts():
+    profiles = make_profiles(10)
+    fake = FakeGeminiClient(latency_seconds=0.0)
+    set_gemini_client(fake)
+
+    result = rank_profiles(profiles, tiering=TieringOptions())
+
+    assert result["social_mode"] == "tiered"
+    counts = result["tier_counts"]
+    assert counts["rule-based"] + counts["gemini"] == 10
+    assert fake.call_count == counts["gemini"]
+    assert sorted(row["social_tier"] for row in result["ranking"]) == sorted(
+        ["gemini"] * counts["gemini"] + ["rule-based"] * counts["rule-based"]
+    )
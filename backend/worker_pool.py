@@ -0,0 +1,57 @@
+# worker_pool.py
+#
+# Process-pool plumbing shared by the Monte Carlo runners
+# (auction_simulation, strategy_sweep): per-process state built once by the
+# pool initializer, so the config and precomputed social scores are shipped
+# to each worker once instead of with every task; fixed-size chunking; and
+# an ordered map over chunks that runs inline when workers == 1.
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Filled in each worker process by init_worker(); read by the chunk functions.
+worker_state: Dict[str, Any] = {}
+
+
+def init_worker(setup: Callable[..., Dict[str, Any]], *args: Any) -> None:
+    worker_state.update(setup(*args))
+
+
+def chunks(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    for i in range(0, len(items), size):
+        yield list(items[i: i + size])
+
+
+def map_chunks(
+    fn: Callable[[List[T]], R],
+    chunked: Iterable[List[T]],
+    workers: int,
+    setup: Callable[..., Dict[str, Any]],
+    *setup_args: Any,
+) -> Iterator[R]:
+    """
+    Yield fn(chunk) for every chunk, in order. Each worker process first runs
+    init_worker(setup, *setup_args); `fn` and `setup` must be module-level
+    functions so they can be pickled. workers == 1 runs inline in this
+    process and clears worker_state afterwards.
+    """
+    if workers == 1:
+        init_worker(setup, *setup_args)
+        try:
+            for chunk in chunked:
+                yield fn(chunk)
+        finally:
+            worker_state.clear()
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(setup, *setup_args),
+    ) as pool:
+        yield from pool.map(fn, chunked)